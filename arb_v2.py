@@ -1,47 +1,128 @@
 # Base Imports
 import os
 import math
+import logging
 import asyncio
 import time
+from decimal import Decimal
+from collections import deque
 from typing import Tuple, Optional
 
 # External Imports
-import requests
 from config import token_configs
 from funcs.base_odos import *
 from funcs.sol_jupiter import *
-from funcs import save_trade_data
-from logging_utility import logger
+from funcs import as_result, save_trade_data, append_trade_record
+from funcs.http_client import close_session
+from funcs.price_service import PriceService, price_ids
+from funcs.base_v2_feed import V2SyncFeed
+from funcs.base_v2_quoter import get_amounts_in_ladder, get_amounts_out_ladder
+from funcs.depth_ladder import build_depth_ladders
+from funcs.quote_cache import QuoteCache, quote_height
+from funcs.tick_recorder import TickRecorder
+from funcs.allowance_manager import AllowanceManager
+from funcs.nonce_manager import NonceManager
+from funcs.fee_oracle import FeeOracle
+from funcs.sol_confirmations import ConfirmationTracker
+from funcs.base_receipts import ReceiptTracker
+from funcs.broadcaster import Broadcaster
+from funcs import load_env, rpc_settings, get_base_pool, get_sol_pool, get_w3_async, get_sol_client_async
+from funcs.warmup import WARMUP_TIMEOUT, Warmup, fetch_token_metadata, ping_url
+from funcs.sizing import best_balanced_swap, solve_balanced_swap, size_grid, sqrt_impact_leg, v2_pool_leg
+from logging_utility import logger, setup_logging
 
 ARB_PERCENT = 4 # Adjust to how aggresive the arbs needs to be
 MINIMUM_TOKEN = 10000 # Decides what the minimum token value to swap $LUNA
 MAX_TOKEN = 50000
-INCREMENT = 100
+INCREMENT = 10 # Size grid step; the whole grid is evaluated in one vectorized sweep
+SIZING_STRATEGY = "golden" # "golden" solves for the best size, "grid" sweeps every INCREMENT
+SIZING_TOLERANCE = 1.0 # LUNA; golden-section stops once the bracket is this narrow
 
 MONITOR_DELAY = 1
 MONITOR_IMPACT_MIN = 10000
 PROFIT_TRESHOLD = 0
 
+PRICE_REFRESH_TTL = 5 # Seconds between background SOL/USD price refreshes
+PRICE_MAX_AGE = 3 * PRICE_REFRESH_TTL # Seconds; an older SOL/USD price skips the round instead of sizing on it
+
+MONITOR_MODE = "pipelined" # "pipelined" overlaps quote rounds with analysis, "sequential" is the original loop
+MONITOR_TARGET_RPS = 2.0 # Target quote rounds per second in pipelined mode
+MONITOR_MAX_IN_FLIGHT = 3 # Max quote rounds outstanding at once in pipelined mode
+MONITOR_MAX_QUOTE_AGE = 2.0 # Seconds; older pipelined rounds are dropped instead of evaluated
+RATE_REPORT_INTERVAL = 60 # Seconds between achieved rounds/s reports
+
+USE_V2_SYNC_FEED = True # Follow the LUNA/VIRTUAL V2 pair's Sync logs over websocket
+USE_V2_POOL_PRICING = True # Size the Base leg from cached pool reserves instead of the sqrt impact model
+V2_MAX_RESERVE_AGE = 30 # Seconds; older reserves fall back to the sqrt impact model
+
+USE_DEPTH_LADDER = True # On an opportunity, quote several sizes per venue and size from measured depth
+DEPTH_LADDER_SIZES = (10000, 20000, 30000, 40000, 50000) # LUNA sizes quoted on each venue
+DEPTH_LADDER_CONCURRENCY = 4 # Max ladder quotes in flight per venue
+
+RECORD_TICKS = True # Append every monitor round to the columnar tick store (funcs.tick_recorder)
+
+SPECULATIVE_ASSEMBLY = True # Assemble both legs while the final quotes are being analyzed
+ODOS_PATH_TTL = 60 # Seconds an Odos pathId can be assembled and sent after quoting
+JUPITER_QUOTE_TTL = 30 # Seconds a Jupiter quote / swap transaction is trusted after quoting
+
+SOL_COMMITMENT = "confirmed" # "processed" or "confirmed"; execution returns here, finalization runs in the background
+SOL_FINALIZE_TIMEOUT = 90 # Seconds the background task waits for the Solana leg to finalize
+TRADE_RECORD_FILE = "trades.jsonl" # Final status of every trade, one JSON line each
+
+QUOTE_REUSE = True # Execute on detection (depth ladder) quotes when they are close enough, instead of re-quoting
+QUOTE_REUSE_SIZE_TOLERANCE = 0.02 # Max relative difference between the quoted and the executed input size
+QUOTE_REUSE_MAX_AGE_MS = 1500 # Max age of a reused quote in milliseconds
+QUOTE_REUSE_MAX_BLOCKS = 1 # Max Base blocks behind the newest block seen in any quote
+QUOTE_REUSE_MAX_SLOTS = 4 # Max Solana slots behind the newest slot seen in any quote
+
 """ Utility """
 
-def jup_find_price(token_address):
-    base_url = "https://api.jup.ag/price/v2"
-    
-    try:
-        response = requests.get(f"{base_url}?ids={token_address}")
-        response.raise_for_status()
-        
-        data = response.json()
-        price = float(data["data"][token_address]["price"])
+# Shared USD price cache, refreshed in the background by main()
+price_service = PriceService(price_ids(), ttl=PRICE_REFRESH_TTL)
 
-        return price
-        
-    except requests.RequestException as e:
-        print(f"Error fetching price: {e}")
-        raise
-    except KeyError as e:
-        print(f"Error parsing response: {e}")
-        raise
+# LUNA/VIRTUAL V2 pool reserves, updated from Sync logs when USE_V2_SYNC_FEED is on
+v2_feed = V2SyncFeed(token_configs["base"]["luna_virtual_v2_pair"])
+
+# Detection quotes that execute_arbitrage may reuse instead of re-quoting
+quote_cache = QuoteCache()
+
+# Every monitor round's parsed quotes, flushed to daily columnar partitions in the background
+tick_recorder = TickRecorder()
+
+# Wallets the bot trades from
+BASE_USER_ADDRS = '0x018C3FB97AB31e02C4Dc215B6b0b662A4dDf9428'
+SOL_USER_ADDRS = '9H9kY3pj1t2RdYH9cGDPnXgqh2F7BJvBehboktgVsj1c'
+
+# Odos router allowances and the Base account nonce, synced once at startup by main()
+allowance_manager = None
+nonce_manager = None
+
+# EIP-1559 fees for Base transactions, refreshed in the background
+fee_oracle = FeeOracle()
+
+# Solana signature confirmations over signatureSubscribe, batched status polling as fallback
+sol_tracker = ConfirmationTracker()
+
+# Base receipts, one batched eth_getTransactionReceipt sweep per newHeads block
+receipt_tracker = ReceiptTracker()
+
+# Fan signed transactions out to every BASE_BROADCAST_RPCS / SOL_BROADCAST_RPCS endpoint
+# Built by main() once the environment is loaded
+base_broadcaster = None
+sol_broadcaster = None
+
+# Background finalization tasks, kept referenced until they finish
+finalization_tasks = set()
+
+def sol_usd_price():
+    """Latest cached SOL/USD price, raises if the price service has no value yet or it is older than PRICE_MAX_AGE"""
+    sol_mint = token_configs["solana"]["tokens"]["sol"]["address"]
+    price = price_service.get_price(sol_mint)
+    if price is None:
+        raise ValueError("SOL price not loaded yet")
+    if price_service.age(sol_mint) > PRICE_MAX_AGE:
+        raise ValueError(f"SOL price is stale ({price_service.age(sol_mint):.1f}s old, max {PRICE_MAX_AGE}s)")
+    return price
 
 def parse_price(data, source, out_decimals=6, init_amount=10000.0):
     """
@@ -63,7 +144,7 @@ def parse_price(data, source, out_decimals=6, init_amount=10000.0):
             price_per_token = total_out_amount / init_amount
 
             # This is needed to change from TOKEN/SOL -> TOKEN/USD 
-            sol_price = jup_find_price(token_configs["solana"]['tokens']['sol']['address'])
+            sol_price = sol_usd_price()
             token_price = price_per_token*sol_price
 
             # Jupiter impact is not in percentage need to *100
@@ -88,14 +169,41 @@ def parse_price(data, source, out_decimals=6, init_amount=10000.0):
             
         else:
             print("Invalid Source")
-            return None, None
+            return None, None, None
     except Exception as e:
         print(f"Error parsing price for {source}: {e}")
-        return None, None
+        return None, None, None
+
+def v2_base_ladder(sizes, base_reserves, trade_action):
+    """
+    VIRTUAL amounts for every LUNA size, priced exactly on the V2 pool with no network I/O
+
+    Args:
+        sizes: LUNA amounts (human readable)
+        base_reserves: (reserve_virtual, reserve_luna) in raw units
+        trade_action: 'buy_base_sell_sol' prices VIRTUAL spent, 'buy_sol_sell_base' VIRTUAL received
+
+    Returns:
+        list: VIRTUAL amount per size, None where the pool cannot fill it
+    """
+    base_tokens = token_configs["base"]["tokens"]
+    luna_scale = 10 ** base_tokens["luna"]["decimals"]
+    virtual_scale = 10 ** base_tokens["virtual"]["decimals"]
+    reserve_virtual, reserve_luna = base_reserves
+    raw_sizes = [int(Decimal(str(x)) * luna_scale) for x in sizes]
 
-def calc_balanced_swap(base_price_luna_virtual, sol_price_luna_solana, base_usd_price, solana_usd_price, base_impact, sol_impact, trade_action):
+    if trade_action == 'buy_base_sell_sol':
+        raw_amounts = get_amounts_in_ladder(raw_sizes, reserve_virtual, reserve_luna)
+    else:
+        raw_amounts = get_amounts_out_ladder(raw_sizes, reserve_luna, reserve_virtual)
+
+    return [amount / virtual_scale if amount is not None else None for amount in raw_amounts]
+
+def calc_balanced_swap(base_price_luna_virtual, sol_price_luna_solana, base_usd_price, solana_usd_price, base_impact, sol_impact, trade_action, base_reserves=None, base_depth=None, sol_depth=None):
     """
-    Calculate swap amount that ensures equal LUNA amounts on both sides while accounting for price impact
+    Calculate swap amount that ensures equal LUNA amounts on both sides while accounting for price impact.
+    Returns the most profitable size in [MINIMUM_TOKEN, MAX_TOKEN], found either by a vectorized
+    sweep of the INCREMENT grid or by golden-section search (SIZING_STRATEGY).
     
     Args:
         base_price_luna_virtual: Price of LUNA in terms of VIRTUAL tokens
@@ -105,178 +213,331 @@ def calc_balanced_swap(base_price_luna_virtual, sol_price_luna_solana, base_usd_
         base_impact: Price impact percentage for base token (0.3 means 0.3%)
         sol_impact: Price impact percentage for sol token (0.3 means 0.3%)
         trade_action: Either 'buy_base_sell_sol' or 'buy_sol_sell_base'
+        base_reserves: Optional (reserve_virtual, reserve_luna) of the V2 pool. When given,
+            the Base leg is priced from the pool instead of the sqrt impact model
+        base_depth: Optional DepthLadder measured on Odos, takes priority over base_reserves
+        sol_depth: Optional DepthLadder measured on Jupiter, replaces the sqrt impact model
         
     Returns:
         tuple: (luna_amount, virtual_amount, solana_amount, expected_profit_usd)
     """
-    # Convert impact from percentage to normalized decimals
-    base_impact = (base_impact / 100) / math.sqrt(MONITOR_IMPACT_MIN)
-    sol_impact = (sol_impact / 100) / math.sqrt(MONITOR_IMPACT_MIN)
+    # For buy_base_sell_sol: VIRTUAL -> LUNA (Base) -> SOLANA (Solana)
+    # For buy_sol_sell_base: SOLANA -> LUNA (Solana) -> VIRTUAL (Base)
+    # Both legs trade the same LUNA amount x; impact is p * sqrt(x / MONITOR_IMPACT_MIN)
+    virtual_usd = base_usd_price / base_price_luna_virtual
+    solana_usd = solana_usd_price / sol_price_luna_solana
 
-    if trade_action == 'buy_base_sell_sol':
-        # For buy_base_sell_sol:
-        # VIRTUAL -> LUNA -> SOLANA
-        # 
-        # Amount of LUNA received from base (including impact):
-        # luna_amount = (virtual_amount/base_price_luna_virtual) * (1 - base_impact*√x)
-        #
-        # Amount of LUNA sold on sol side (including impact):
-        # luna_amount = x
-        
-        for x in range(MINIMUM_TOKEN, MAX_TOKEN, INCREMENT):
+    # Measured depth beats pool reserves, which beat the sqrt extrapolation
+    if base_depth:
+        base_reserves = None
+        base_leg = base_depth.leg
+    elif base_reserves:
+        base_leg = v2_pool_leg(*base_reserves,
+            counter_decimals=token_configs["base"]["tokens"]["virtual"]["decimals"],
+            luna_decimals=token_configs["base"]["tokens"]["luna"]["decimals"])
+    else:
+        base_leg = sqrt_impact_leg(base_price_luna_virtual, base_impact, MONITOR_IMPACT_MIN)
 
-            virtual_usd = base_usd_price/base_price_luna_virtual
-            solana_usd = solana_usd_price / sol_price_luna_solana
+    if sol_depth:
+        sol_leg = sol_depth.leg
+    else:
+        sol_leg = sqrt_impact_leg(sol_price_luna_solana, sol_impact, MONITOR_IMPACT_MIN)
 
-            # Calculate required VIRTUAL tokens for base side
-            virtual_amount = (x * base_price_luna_virtual) / (1 - base_impact * math.sqrt(x))
-            
-            # Calculate expected SOLANA tokens from sol side
-            solana_amount = x * sol_price_luna_solana * (1 - sol_impact * math.sqrt(x))
-            
-            # Convert to USD for profit calculation
-            virtual_value_usd = virtual_amount * virtual_usd
-            solana_value_usd = solana_amount * solana_usd
-            
-            # Check if profitable in USD terms
-            profit_usd = solana_value_usd - virtual_value_usd
-            
-            if profit_usd > 0:
-                logger.info(f"\n--------------------------------------\n"   
-                f"Calculation for Ideal Swap (Before Quote and Transaction):\n"
-                f"LUNA Amount: {x:.4f}\n"
-                f"VIRTUAL Amount (spent): {virtual_amount:.4f} (${virtual_value_usd:.2f})\n"
-                f"SOLANA Amount (received): {solana_amount:.4f} (${solana_value_usd:.2f})\n"
-                f"Expected Profit (USD): ${profit_usd:.4f}\n"
-                f"Base Impact: {base_impact * math.sqrt(x) * 100:.4f}%\n"
-                f"Sol Impact: {sol_impact * math.sqrt(x) * 100:.4f}%\n"
-                f"--------------------------------------")
+    if SIZING_STRATEGY == "golden":
+        best = solve_balanced_swap(
+            MINIMUM_TOKEN, MAX_TOKEN, base_leg, sol_leg, virtual_usd, solana_usd, trade_action, tol=SIZING_TOLERANCE
+        )
+    else:
+        best = best_balanced_swap(
+            size_grid(MINIMUM_TOKEN, MAX_TOKEN, INCREMENT), base_leg, sol_leg, virtual_usd, solana_usd, trade_action
+        )
+    if best["profit_usd"] <= 0:
+        return 0, 0, 0, 0
 
-                return x, virtual_amount, solana_amount, profit_usd
-                
-    else:  # buy_sol_sell_base
-        # For buy_sol_sell_base:
-        # SOLANA -> LUNA -> VIRTUAL
-        
-        for x in range(MINIMUM_TOKEN, MAX_TOKEN, INCREMENT):
+    x = best["luna_amount"]
+    virtual_amount = best["virtual_amount"]
+    solana_amount = best["solana_amount"]
+    profit_usd = best["profit_usd"]
 
-            virtual_usd = base_usd_price/base_price_luna_virtual
-            solana_usd = solana_usd_price / sol_price_luna_solana
+    if base_reserves:
+        # Swap the float sweep value for the exact pool amount at the chosen size
+        virtual_amount = v2_base_ladder([x], base_reserves, trade_action)[0]
+        base_tokens = token_configs["base"]["tokens"]
+        spot_virtual = (base_reserves[0] / 10 ** base_tokens["virtual"]["decimals"]) / (base_reserves[1] / 10 ** base_tokens["luna"]["decimals"])
+        base_impact_x = abs(1 - virtual_amount / (x * spot_virtual)) * 100
+    elif base_depth:
+        base_impact_x = abs(1 - virtual_amount / (x * base_price_luna_virtual)) * 100
+    else:
+        base_impact_x = base_impact * math.sqrt(x / MONITOR_IMPACT_MIN)
 
-            # Calculate required SOLANA tokens for sol side
-            solana_amount = (x * sol_price_luna_solana) / (1 - sol_impact * math.sqrt(x))
-            
-            # Calculate expected VIRTUAL tokens from base side
-            virtual_amount = x * base_price_luna_virtual * (1 - base_impact * math.sqrt(x))
-            
-            # Convert to USD for profit calculation
-            virtual_value_usd = virtual_amount * virtual_usd
-            solana_value_usd = solana_amount * solana_usd
-            
-            profit_usd = virtual_value_usd - solana_value_usd
-            
-            if profit_usd > 0:
-                logger.info(f"\n--------------------------------------\n"   
-                f"Calculation for Ideal Swap (Before Quote and Transaction):\n"
-                f"LUNA Amount: {x:.4f}\n"
-                f"SOLANA Amount (spent): {solana_amount:.4f} (${solana_value_usd:.2f})\n"
-                f"VIRTUAL Amount (received): {virtual_amount:.4f} (${virtual_value_usd:.2f})\n"
-                f"Expected Profit (USD): ${profit_usd:.4f}\n"
-                f"Base Impact: {base_impact * math.sqrt(x) * 100:.4f}%\n"
-                f"Sol Impact: {sol_impact * math.sqrt(x) * 100:.4f}%\n"
-                f"--------------------------------------")
+    if sol_depth:
+        sol_impact_x = abs(1 - solana_amount / (x * sol_price_luna_solana)) * 100
+    else:
+        sol_impact_x = sol_impact * math.sqrt(x / MONITOR_IMPACT_MIN)
 
-                return x, virtual_amount, solana_amount, profit_usd
-    
-    return 0, 0, 0, 0
+    virtual_value_usd = virtual_amount * virtual_usd
+    solana_value_usd = solana_amount * solana_usd
+    if base_reserves:
+        profit_usd = solana_value_usd - virtual_value_usd if trade_action == 'buy_base_sell_sol' else virtual_value_usd - solana_value_usd
+
+    # Lazy %-style args: the message is only built on the logging thread, and only if INFO is enabled
+    if trade_action == 'buy_base_sell_sol':
+        legs = ("VIRTUAL", "spent", virtual_amount, virtual_value_usd, "SOLANA", "received", solana_amount, solana_value_usd)
+    else:
+        legs = ("SOLANA", "spent", solana_amount, solana_value_usd, "VIRTUAL", "received", virtual_amount, virtual_value_usd)
+
+    logger.info("\n--------------------------------------\n"
+    "Calculation for Ideal Swap (Before Quote and Transaction):\n"
+    "LUNA Amount: %.4f\n"
+    "%s Amount (%s): %.4f ($%.2f)\n"
+    "%s Amount (%s): %.4f ($%.2f)\n"
+    "Expected Profit (USD): $%.4f\n"
+    "Base Impact: %.4f%%\n"
+    "Sol Impact: %.4f%%\n"
+    "--------------------------------------",
+    x, *legs, profit_usd, base_impact_x, sol_impact_x)
+
+    return x, virtual_amount, solana_amount, profit_usd
 
 """ Monitoring """
-async def price_checker(delay: int = 1, init_amount: float = 1000.0):
+async def fetch_monitor_quotes(init_amount: float = 1000.0):
     """
-    Modified price checker to use balanced swap calculation.
-    Skips rounds where either impact is 0.
+    Fire the LUNA -> VIRTUAL (Odos) and LUNA -> SOL (Jupiter) monitor quotes concurrently
+
+    Returns:
+        tuple: (quote_base, quote_sol)
     """
     base = token_configs["base"]
     sol = token_configs["solana"]
-    
-    try:
-        # Run both quotes concurrently using gather
-        quote_base, quote_sol = await asyncio.gather(
-            quote_odos(
-                base["tokens"]["luna"]["address"],
-                base["tokens"]["virtual"]["address"],  # changed
-                init_amount,
-                base["tokens"]["luna"]["decimals"],
-            ),
-            quote_jupiter(
-                sol["tokens"]["luna"]["address"],
-                sol["tokens"]["sol"]["address"], # changed
-                init_amount,  
-                sol["tokens"]["luna"]["decimals"]
-            )
+
+    return await asyncio.gather(
+        quote_odos(
+            base["tokens"]["luna"]["address"],
+            base["tokens"]["virtual"]["address"],  # changed
+            init_amount,
+            base["tokens"]["luna"]["decimals"],
+        ),
+        quote_jupiter(
+            sol["tokens"]["luna"]["address"],
+            sol["tokens"]["sol"]["address"], # changed
+            init_amount,  
+            sol["tokens"]["luna"]["decimals"]
         )
-   
-        # Parse prices from both sources
-        base_price, base_impact , base_luna_virtual = parse_price(quote_base, "Odos", base["tokens"]["virtual"]["decimals"], init_amount=init_amount)
-        sol_price, sol_impact, sol_luna_solana = parse_price(quote_sol, "Jupiter", sol["tokens"]["sol"]["decimals"], init_amount=init_amount)
-
-        if base_price and sol_price:
-            # Check for zero impacts - skip this round if found
-            if base_impact == 0 or sol_impact == 0:
-                logger.warning(f"\n--------------------------------------\n"
-                f"Warning: Zero impact detected, skipping round\n"
-                f"Base Impact: {base_impact}\n"
-                f"Sol Impact: {sol_impact}\n"
-                f"--------------------------------------")
-                
-                await asyncio.sleep(delay)
-                return False, None, 0, 0
+    )
 
-            avg_price = (base_price + sol_price) / 2
-            price_diff = abs(base_price - sol_price) / avg_price * 100
-            
-            logger.info(f"\n--------------------------------------\n"
-            f"Base Price: ${base_price:.6f}\n"
-            f"Solana Price: ${sol_price:.6f}\n"
-            f"Price Difference: {price_diff:.2f}%\n"
-            f"Base Impact ({MONITOR_IMPACT_MIN}): {base_impact}\n"
-            f"Sol Impact ({MONITOR_IMPACT_MIN}): {sol_impact}\n"
-            f"--------------------------------------")
-
-            # Determine trading action and calculate balanced amounts
-            if base_price < sol_price:
-                trade_action = "buy_base_sell_sol"
-            else:
-                trade_action = "buy_sol_sell_base"
+def record_ladder_quotes(base_depth, sol_depth, quoted_at: float):
+    """Store every depth ladder quote under the token and amount it spent, for reuse at execution"""
+    base = token_configs["base"]["tokens"]
+    sol = token_configs["solana"]["tokens"]
+
+    for ladder, tokens, counter in ((base_depth, base, "virtual"), (sol_depth, sol, "sol")):
+        # Sell ladders spend LUNA, buy ladders spend the counter token
+        in_token = tokens["luna"]["address"] if ladder.side == "sell" else tokens[counter]["address"]
+        for luna_amount, counter_amount in zip(ladder.luna_amounts, ladder.counter_amounts):
+            quote = ladder.quotes.get(luna_amount)
+            if quote is None:
+                continue
+            amount_in = luna_amount if ladder.side == "sell" else counter_amount
+            quote_cache.record(ladder.venue, in_token, amount_in, quote, quoted_at)
+
+async def evaluate_quotes(quote_base, quote_sol, init_amount: float = 1000.0):
+    """
+    Parse one round of monitor quotes, size the trade and log the result.
+    Skips rounds where either impact is 0.
+
+    Returns:
+        tuple: (arbitrage_found, trade_action, luna_amount, amount_to_spend)
+    """
+    base = token_configs["base"]
+    sol = token_configs["solana"]
+
+    # Parse prices from both sources
+    base_price, base_impact , base_luna_virtual = parse_price(quote_base, "Odos", base["tokens"]["virtual"]["decimals"], init_amount=init_amount)
+    sol_price, sol_impact, sol_luna_solana = parse_price(quote_sol, "Jupiter", sol["tokens"]["sol"]["decimals"], init_amount=init_amount)
+
+    # Monitor quotes are too small to execute on, but they keep the newest block/slot current
+    quote_cache.observe("base", quote_base)
+    quote_cache.observe("solana", quote_sol)
+
+    if base_price and sol_price and RECORD_TICKS:
+        spread = (sol_price - base_price) / ((base_price + sol_price) / 2) * 100
+        tick_recorder.record("base", init_amount, init_amount, base_luna_virtual * init_amount, base_impact,
+                             quote_height("base", quote_base), spread, base_price)
+        tick_recorder.record("solana", init_amount, init_amount, sol_luna_solana * init_amount, sol_impact,
+                             quote_height("solana", quote_sol), spread, sol_price)
+
+    if base_price and sol_price:
+        # Check for zero impacts - skip this round if found
+        if base_impact == 0 or sol_impact == 0:
+            logger.warning("\n--------------------------------------\n"
+            "Warning: Zero impact detected, skipping round\n"
+            "Base Impact: %s\n"
+            "Sol Impact: %s\n"
+            "--------------------------------------",
+            base_impact, sol_impact)
             
-            if price_diff >= ARB_PERCENT:
-                logger.info(f"Arbitrage opportunity found! Action: {trade_action}")
+            return False, None, 0, 0
+
+        avg_price = (base_price + sol_price) / 2
+        price_diff = abs(base_price - sol_price) / avg_price * 100
+        
+        logger.info("\n--------------------------------------\n"
+        "Base Price: $%.6f\n"
+        "Solana Price: $%.6f\n"
+        "Price Difference: %.2f%%\n"
+        "Base Impact (%s): %s\n"
+        "Sol Impact (%s): %s\n"
+        "--------------------------------------",
+        base_price, sol_price, price_diff, MONITOR_IMPACT_MIN, base_impact, MONITOR_IMPACT_MIN, sol_impact)
+
+        if v2_feed.is_ready() and logger.isEnabledFor(logging.INFO):
+            logger.info("V2 Pool LUNA/VIRTUAL: %.6f (block %s, %.1fs old)",
+            v2_feed.spot_price(base['tokens']['luna']['address']), v2_feed.block_number, v2_feed.age())
+
+        # Determine trading action and calculate balanced amounts
+        if base_price < sol_price:
+            trade_action = "buy_base_sell_sol"
+        else:
+            trade_action = "buy_sol_sell_base"
+        
+        if price_diff >= ARB_PERCENT:
+            logger.info("Arbitrage opportunity found! Action: %s", trade_action)
+
+            # Calculate balanced amounts
+            base_reserves = None
+            if USE_V2_POOL_PRICING and v2_feed.is_ready() and v2_feed.age() <= V2_MAX_RESERVE_AGE:
+                base_reserves = v2_feed.reserves_for(base["tokens"]["virtual"]["address"])
 
-                # Calculate balanced amounts
-                luna_amount, virtual_amount, solana_amount, expected_profit_usd = calc_balanced_swap(
-                    base_luna_virtual, sol_luna_solana, base_price, sol_price, base_impact, sol_impact, trade_action
+            base_depth = sol_depth = None
+            if USE_DEPTH_LADDER:
+                # One extra parallel round trip: measure real depth at every ladder size
+                ladder_started_at = time.monotonic()
+                base_depth, sol_depth = await build_depth_ladders(
+                    trade_action, DEPTH_LADDER_SIZES, base_luna_virtual, sol_luna_solana, DEPTH_LADDER_CONCURRENCY
                 )
+                record_ladder_quotes(base_depth, sol_depth, ladder_started_at)
+                logger.info("Depth ladder: %d Base / %d Solana points, max %.0f / %.0f LUNA",
+                len(base_depth), len(sol_depth), base_depth.max_size(), sol_depth.max_size())
 
-                # Can create a minimum profit variable with expected_profit_usd
+            luna_amount, virtual_amount, solana_amount, expected_profit_usd = calc_balanced_swap(
+                base_luna_virtual, sol_luna_solana, base_price, sol_price, base_impact, sol_impact, trade_action,
+                base_reserves=base_reserves, base_depth=base_depth or None, sol_depth=sol_depth or None
+            )
 
-                
-                if luna_amount > 0 and expected_profit_usd > PROFIT_TRESHOLD:
-                    logger.info(f"Expected Profit: {expected_profit_usd}")
+            # Can create a minimum profit variable with expected_profit_usd
 
-                    # Return the balanced amounts
-                    return True, trade_action, luna_amount, virtual_amount if trade_action == "buy_base_sell_sol" else solana_amount
-                
-                else:
-                    logger.info(f"Calculated Profit is Lower than {PROFIT_TRESHOLD}: {expected_profit_usd}")
-        
-        await asyncio.sleep(delay)
+            
+            if luna_amount > 0 and expected_profit_usd > PROFIT_TRESHOLD:
+                logger.info("Expected Profit: %s", expected_profit_usd)
+
+                # Return the balanced amounts
+                return True, trade_action, luna_amount, virtual_amount if trade_action == "buy_base_sell_sol" else solana_amount
+            
+            else:
+                logger.info("Calculated Profit is Lower than %s: %s", PROFIT_TRESHOLD, expected_profit_usd)
+
+    return False, None, 0, 0
+
+async def price_checker(delay: int = 1, init_amount: float = 1000.0):
+    """
+    Modified price checker to use balanced swap calculation.
+    Quotes one round, evaluates it and sleeps {delay} seconds unless an opportunity was found.
+    """
+    try:
+        quote_base, quote_sol = await fetch_monitor_quotes(init_amount)
+        result = await evaluate_quotes(quote_base, quote_sol, init_amount)
+        if result[0]:
+            return result
         
     except Exception as e:
-        logger.error(f"Error in price checker: {e}")
-        await asyncio.sleep(delay)
-        
+        logger.error("Error in price checker: %s", e)
+
+    await asyncio.sleep(delay)
     return False, None, 0, 0
 
+async def sequential_price_checker(delay: int = 1, init_amount: float = 1000.0):
+    """
+    Original monitor mode: await each round, then sleep before the next one
+
+    Yields:
+        tuple: same as price_checker
+    """
+    while True:
+        result = await price_checker(delay=delay, init_amount=init_amount)
+        yield result
+
+        if not result[0]:
+            await asyncio.sleep(1)
+
+async def _quote_round_at(start_at: float, init_amount: float):
+    """Wait until loop time {start_at}, then fire one monitor round"""
+    loop = asyncio.get_running_loop()
+    await asyncio.sleep(max(0.0, start_at - loop.time()))
+
+    dispatched_at = loop.time()
+    quotes = await fetch_monitor_quotes(init_amount)
+    return dispatched_at, quotes
+
+async def pipelined_price_checker(target_rps: float = MONITOR_TARGET_RPS, init_amount: float = 1000.0):
+    """
+    Monitor mode that overlaps quoting with analysis.
+
+    New rounds are dispatched on a fixed schedule of {target_rps} per second
+    without waiting for earlier ones to return, with at most
+    MONITOR_MAX_IN_FLIGHT rounds outstanding. Rounds are evaluated in dispatch
+    order, so parsing, sizing and logging for round N run while round N+1 is
+    in flight. Rounds older than MONITOR_MAX_QUOTE_AGE when they are reached
+    (e.g. after a trade held the loop) are dropped.
+
+    Yields:
+        tuple: same as price_checker
+    """
+    loop = asyncio.get_running_loop()
+    interval = 1 / target_rps
+    pending = deque()
+    next_start = loop.time()
+
+    evaluated = dropped = 0
+    window_start = loop.time()
+
+    try:
+        while True:
+            # Keep the pipeline full: one new round per interval, never scheduled in the past
+            while len(pending) < MONITOR_MAX_IN_FLIGHT:
+                next_start = max(next_start, loop.time())
+                pending.append(asyncio.create_task(_quote_round_at(next_start, init_amount)))
+                next_start += interval
+
+            try:
+                dispatched_at, (quote_base, quote_sol) = await pending.popleft()
+            except Exception as e:
+                logger.error("Error in price checker: %s", e)
+                continue
+
+            if loop.time() - dispatched_at > MONITOR_MAX_QUOTE_AGE:
+                dropped += 1
+                continue
+
+            try:
+                result = await evaluate_quotes(quote_base, quote_sol, init_amount)
+            except Exception as e:
+                logger.error("Error in price checker: %s", e)
+                continue
+
+            evaluated += 1
+            elapsed = loop.time() - window_start
+            if elapsed >= RATE_REPORT_INTERVAL:
+                logger.info("Monitor rate: %.2f rounds/s (target %.2f, dropped %d stale)",
+                evaluated / elapsed, target_rps, dropped)
+                evaluated = dropped = 0
+                window_start = loop.time()
+
+            yield result
+
+    finally:
+        for task in pending:
+            task.cancel()
+
 def analyze_arb_quotes(quote_base, quote_sol, trade_action):
     """
     Analyze arbitrage quotes and calculate key metrics
@@ -297,7 +558,6 @@ def analyze_arb_quotes(quote_base, quote_sol, trade_action):
     sol_luna_dec = sol["tokens"]["luna"]["decimals"]
 
     sol_solana_dec = sol["tokens"]["sol"]["decimals"]
-    sol_solana_address = sol["tokens"]["sol"]["address"]
 
     try:
         # Initialize variables based on trade direction
@@ -309,7 +569,7 @@ def analyze_arb_quotes(quote_base, quote_sol, trade_action):
             luna_sol = float(quote_sol['inAmount']) / (10 ** sol_luna_dec)  # LUNA spent on Sol
 
             sol_amount = float(quote_sol['outAmount']) / (10 ** sol_solana_dec)
-            solana_price = jup_find_price(sol_solana_address)
+            solana_price = sol_usd_price()
 
             usdc_sol = float(sol_amount) * (solana_price) # What is the SOL received, value_usd
             
@@ -321,7 +581,7 @@ def analyze_arb_quotes(quote_base, quote_sol, trade_action):
             luna_sol = float(quote_sol['outAmount']) / (10 ** sol_luna_dec)  # LUNA received from Sol
             
             sol_amount = float(quote_sol['inAmount']) / (10 ** sol_solana_dec)
-            solana_price = jup_find_price(sol_solana_address)
+            solana_price = sol_usd_price()
 
             usdc_sol = float(sol_amount) * (solana_price) # What is the SOL spent, value_usd
         
@@ -342,33 +602,84 @@ def analyze_arb_quotes(quote_base, quote_sol, trade_action):
         }
         
         # Print detailed analysis
-        logger.info(f"\n=== Arbitrage Analysis ===\n"
-        f"Action: {trade_action}\n"
-        f"LUNA Sol: {luna_sol:.6f}\n"
-        f"LUNA Base: {luna_base:.6f}\n"
-        f"USDC Sol: ${usdc_sol:.2f}\n"
-        f"USDC Base: ${usdc_base:.2f}\n"
-        f"Profit: ${profit:.2f}\n"
-        f"========================")
+        logger.info("\n=== Arbitrage Analysis ===\n"
+        "Action: %s\n"
+        "LUNA Sol: %.6f\n"
+        "LUNA Base: %.6f\n"
+        "USDC Sol: $%.2f\n"
+        "USDC Base: $%.2f\n"
+        "Profit: $%.2f\n"
+        "========================",
+        trade_action, luna_sol, luna_base, usdc_sol, usdc_base, profit)
                     
         return results
         
     except Exception as e:
-        logger.error(f"Error analyzing arbitrage quotes: {e}")
+        logger.error("Error analyzing arbitrage quotes: %s", e)
         return None
 
 """ Transactions """
+def base_amount_in(quote_base, amount: float, decimals: int) -> int:
+    """Raw input amount of an Odos quote, falling back to the requested amount"""
+    try:
+        return int(quote_base["inAmounts"][0])
+    except (KeyError, IndexError, TypeError, ValueError):
+        return int(convert_to_decimal_amount(amount, decimals))
+
+def _reuse_summary(entry, reason) -> str:
+    if entry is None:
+        return f"re-quoted ({reason})"
+    amount_in, _, quoted_at, height = entry
+    return f"reused {amount_in:.4f} in, {(time.monotonic() - quoted_at) * 1000:.0f} ms old, height {height}"
+
+async def assemble_legs(base_user_addrs: str, sol_user_addrs: str, quote_base, quote_sol, quoted_at: float):
+    """
+    Assemble both legs concurrently and tag them with their expiry
+
+    Returns:
+        dict: odos, jupiter payloads plus assembled_at and per-leg expires_at (loop-independent monotonic time)
+    """
+    odos_assembled, jup_assembled = await asyncio.gather(
+        assemble_odos(base_user_addrs, quote_base),
+        swap_jupiter(sol_user_addrs, quote_sol)
+    )
+
+    return {
+        "odos": odos_assembled,
+        "jupiter": jup_assembled,
+        "assembled_at": time.monotonic(),
+        "odos_expires_at": quoted_at + ODOS_PATH_TTL,
+        "jupiter_expires_at": quoted_at + JUPITER_QUOTE_TTL,
+    }
+
+def assembly_is_fresh(assembled) -> Tuple[bool, Optional[str]]:
+    """Check neither leg of an assembled pair has expired"""
+    now = time.monotonic()
+
+    if now >= assembled["odos_expires_at"]:
+        return False, f"Odos pathId expired {now - assembled['odos_expires_at']:.1f}s ago"
+    if now >= assembled["jupiter_expires_at"]:
+        return False, f"Jupiter quote expired {now - assembled['jupiter_expires_at']:.1f}s ago"
+    return True, None
+
 async def execute_arbitrage(
     trade_action: str,
     amount_sell: float,
     amount_buy: float,
     base_priv_key: str,
-    sol_priv_key: str
+    sol_priv_key: str,
+    detected_at: Optional[float] = None
 ) -> Tuple[bool, Optional[str]]:
     """
-    Execute the arbitrage trade across both chains
+    Execute the arbitrage trade across both chains.
+    With SPECULATIVE_ASSEMBLY both legs are assembled while the final quotes are analyzed,
+    and the assembly is discarded if the trade is no longer profitable.
+    {detected_at} (time.monotonic) is used to log detection-to-submission latency.
     Returns (success, error_message)
     """
+    detected_at = detected_at or time.monotonic()
+    assembly_task = None
+
     try:
         # Get addresses from config
         base = token_configs["base"]
@@ -398,14 +709,26 @@ async def execute_arbitrage(
             sol_amount = amount_buy
 
         # Initialize wallet addresses
-        base_user_addrs = '0x018C3FB97AB31e02C4Dc215B6b0b662A4dDf9428'
-        sol_user_addrs = '9H9kY3pj1t2RdYH9cGDPnXgqh2F7BJvBehboktgVsj1c'
+        base_user_addrs = BASE_USER_ADDRS
+        sol_user_addrs = SOL_USER_ADDRS
+
+        # Fast path: reuse a detection quote per leg when it is close in size and still fresh
+        base_reused = sol_reused = None
+        base_reason = sol_reason = "quote reuse disabled"
+        if QUOTE_REUSE:
+            base_reused, base_reason = quote_cache.lookup("base", base_in, base_amount,
+                QUOTE_REUSE_SIZE_TOLERANCE, QUOTE_REUSE_MAX_AGE_MS, QUOTE_REUSE_MAX_BLOCKS)
+            sol_reused, sol_reason = quote_cache.lookup("solana", sol_in, sol_amount,
+                QUOTE_REUSE_SIZE_TOLERANCE, QUOTE_REUSE_MAX_AGE_MS, QUOTE_REUSE_MAX_SLOTS)
 
         try:
-            # Get quotes
+            # Get quotes, re-quoting only the legs that could not be reused
+            requested_at = time.monotonic()
             quote_base, quote_sol = await asyncio.gather(
-                quote_odos(base_in, base_out, base_amount, base_in_dec, user_addrs=base_user_addrs),
+                quote_odos(base_in, base_out, base_amount, base_in_dec, user_addrs=base_user_addrs)
+                if base_reused is None else as_result(base_reused[1]),
                 quote_jupiter(sol_in, sol_out, sol_amount, sol_in_dec)
+                if sol_reused is None else as_result(sol_reused[1])
             )
 
             if not quote_base or not quote_sol:
@@ -414,8 +737,23 @@ async def execute_arbitrage(
         except Exception as e:
             return False, f"Error getting quotes: {str(e)}"
 
-        # Analyze the quotes
-        arb_analysis = analyze_arb_quotes(quote_base, quote_sol, trade_action)
+        # Expiry runs from when the oldest leg was priced
+        quoted_at = min([requested_at] + [entry[2] for entry in (base_reused, sol_reused) if entry])
+
+        logger.info(f"Execution path: {'fast (no re-quote)' if base_reused and sol_reused else 're-quote'} | "
+        f"Base {_reuse_summary(base_reused, base_reason)} | Solana {_reuse_summary(sol_reused, sol_reason)}")
+
+        # Speculative: start assembling both legs before the analysis has decided
+        if SPECULATIVE_ASSEMBLY:
+            assembly_task = asyncio.create_task(
+                assemble_legs(base_user_addrs, sol_user_addrs, quote_base, quote_sol, quoted_at)
+            )
+
+        # Analyze the quotes; while assembling speculatively, off the loop so the assembly requests go out meanwhile
+        if assembly_task is not None:
+            arb_analysis = await asyncio.to_thread(analyze_arb_quotes, quote_base, quote_sol, trade_action)
+        else:
+            arb_analysis = analyze_arb_quotes(quote_base, quote_sol, trade_action)
         if not arb_analysis or arb_analysis['profit_usdc'] <= 0:
             return False, "Arbitrage no longer profitable after final quote"
 
@@ -426,10 +764,12 @@ async def execute_arbitrage(
         try:
 
             # Assemble transactions
-            odos_assembled, jup_assembled = await asyncio.gather(
-                assemble_odos(base_user_addrs, quote_base),
-                swap_jupiter(sol_user_addrs, quote_sol)
-            )
+            if assembly_task is None:
+                assembly_task = asyncio.create_task(
+                    assemble_legs(base_user_addrs, sol_user_addrs, quote_base, quote_sol, quoted_at)
+                )
+            assembled = await assembly_task
+            odos_assembled, jup_assembled = assembled["odos"], assembled["jupiter"]
 
             if not odos_assembled or not jup_assembled:
                 return False, "Failed to assemble transactions"
@@ -437,22 +777,38 @@ async def execute_arbitrage(
         except Exception as e:
             return False, f"Error assembling transactions: {str(e)}"
 
-        # Check approvals
-        ODOS_ROUTER_V2 = base["odos_routerV2"]
-        needs_approval = check_token_approval(base_in, base_user_addrs, ODOS_ROUTER_V2)
+        # Check approvals - in memory, approved up front at startup
+        if not await allowance_manager.ensure(base_in):
+            return False, "Token approval failed"
+
+        # Never send an assembly built from an expired pathId or quote; the
+        # assembly always comes from the analyzed quotes, so expiry is the only check
+        fresh, reason = assembly_is_fresh(assembled)
+        if not fresh:
+            return False, f"Assembled transactions are stale: {reason}"
 
-        if needs_approval:
-            approval_success = send_infinite_approval(base_in, ODOS_ROUTER_V2)
-            if not approval_success:
-                return False, "Token approval failed"
+        submitted_at = time.monotonic()
+        logger.info(f"Latency (speculative assembly {'on' if SPECULATIVE_ASSEMBLY else 'off'}): "
+        f"detection -> submission {(submitted_at - detected_at) * 1000:.0f} ms "
+        f"(final quote {(quoted_at - detected_at) * 1000:.0f} ms, "
+        f"analysis + assembly {(submitted_at - quoted_at) * 1000:.0f} ms)")
         
         try:
             # Execute transactions
             base_tx_hash, solana_tx_hash = await asyncio.gather(
-                execute_odos(odos_assembled, base_priv_key),
-                execute_jupiter(jup_assembled, sol_priv_key)
+                execute_odos(odos_assembled, base_priv_key, nonce_manager=nonce_manager, fee_oracle=fee_oracle, broadcaster=base_broadcaster, receipt_tracker=receipt_tracker),
+                execute_jupiter(jup_assembled, sol_priv_key, tracker=sol_tracker, commitment=SOL_COMMITMENT, broadcaster=sol_broadcaster)
             )
 
+            # execute_odos returns the hash as a str, or an error dict when the swap failed or reverted
+            if isinstance(base_tx_hash, dict):
+                logger.error(f"Base swap failed: {base_tx_hash.get('error')}")
+                base_tx_hash = None
+
+            # Our own swap is the only thing that changes the cached allowance
+            if base_tx_hash:
+                allowance_manager.record_spend(base_in, base_amount_in(quote_base, base_amount, base_in_dec))
+
             if not base_tx_hash or not solana_tx_hash:
                     return False, "Failed to get transaction hashes"
                 
@@ -461,17 +817,72 @@ async def execute_arbitrage(
 
         logger.info(f"View on Basescan: https://basescan.org/tx/0x{base_tx_hash}")
         logger.info(f"View on Solscan: https://solscan.io/tx/{solana_tx_hash}")
+        base_broadcaster.log_report()
+        sol_broadcaster.log_report()
+
+        # Return at SOL_COMMITMENT; finalization is tracked off the hot path
+        trade_record = {
+            "trade_action": trade_action,
+            "amount_sell": amount_sell,
+            "amount_buy": amount_buy,
+            "base_tx": f"0x{base_tx_hash}",
+            "sol_tx": str(solana_tx_hash),
+            "sol_status": SOL_COMMITMENT,
+            "base_first_ack": base_broadcaster.transactions.get(f"0x{base_tx_hash}", {}).get("first_ack"),
+            "sol_first_ack": sol_broadcaster.transactions.get(str(solana_tx_hash), {}).get("first_ack"),
+            "detection_to_submission_ms": round((submitted_at - detected_at) * 1000),
+            "returned_after_ms": round((time.monotonic() - detected_at) * 1000),
+        }
+        track_finalization(trade_record)
 
         return True, None
 
     except Exception as e:
         return False, f"Error executing arbitrage: {str(e)}"
 
+    finally:
+        # Discard a speculative assembly that was never used
+        if assembly_task is not None and not assembly_task.done():
+            assembly_task.cancel()
+
+async def finalize_trade(trade_record):
+    """Wait for the Solana leg to finalize, then write the final status into {trade_record}"""
+    try:
+        result = await sol_tracker.wait(trade_record["sol_tx"], timeout=SOL_FINALIZE_TIMEOUT, commitment="finalized")
+        trade_record["sol_status"] = "failed" if result["err"] else "finalized"
+        trade_record["sol_err"] = result["err"]
+        trade_record["sol_slot"] = result["slot"]
+    except asyncio.TimeoutError:
+        trade_record["sol_status"] = "finalize_timeout"
+    except Exception as e:
+        trade_record["sol_status"] = "finalize_error"
+        trade_record["sol_err"] = str(e)
+
+    # Broadcast endpoints are credited in the background; by finalization both legs have been attributed
+    trade_record["base_confirmed_by"] = base_broadcaster.transactions.get(trade_record["base_tx"], {}).get("confirmed_by")
+    trade_record["sol_confirmed_by"] = sol_broadcaster.transactions.get(trade_record["sol_tx"], {}).get("confirmed_by")
+
+    if trade_record["sol_status"] == "finalized":
+        logger.info(f"Solana leg finalized: {trade_record['sol_tx']} (slot {trade_record['sol_slot']})")
+    else:
+        logger.error(f"Solana leg {trade_record['sol_status']}: {trade_record['sol_tx']} {trade_record.get('sol_err') or ''}")
+
+    await asyncio.to_thread(append_trade_record, trade_record, TRADE_RECORD_FILE)
+    return trade_record
+
+def track_finalization(trade_record) -> asyncio.Task:
+    """Run finalize_trade in the background so the monitor loop can resume scanning"""
+    task = asyncio.create_task(finalize_trade(trade_record))
+    finalization_tasks.add(task)
+    task.add_done_callback(finalization_tasks.discard)
+    return task
+
 async def main():
     """
     Main function that runs the continuous arbitrage monitoring loop
     """
     # Get private keys from environment
+    load_env()
     base_priv_key = os.getenv('BASE_PRIVATE_KEY')
     sol_priv_key = os.getenv('SOL_PRIVATE_KEY')
     
@@ -480,13 +891,106 @@ async def main():
         return
 
     logger.info("Starting continuous arbitrage monitor...")
-    
-    while True:
-        try:
-            # Check for arbitrage opportunity
-            arbitrage_check, trade_action, amount_in, amount_out = await price_checker(delay=1)
 
+    global allowance_manager, nonce_manager, base_broadcaster, sol_broadcaster
+    settings = rpc_settings()
+    base_broadcaster = Broadcaster("base", settings["base_broadcast_rpcs"])
+    sol_broadcaster = Broadcaster("solana", settings["sol_broadcast_rpcs"])
+    base_pool, sol_pool = get_base_pool(), get_sol_pool()
+    nonce_manager = NonceManager(BASE_USER_ADDRS)
+    allowance_manager = AllowanceManager(BASE_USER_ADDRS, base_priv_key, nonce_manager=nonce_manager, fee_oracle=fee_oracle,
+                                         receipt_tracker=receipt_tracker)
+
+    warmup = build_warmup(base_pool, sol_pool)
+
+    try:
+        await sol_tracker.start()
+        await receipt_tracker.start()
+        await tick_recorder.start()
+
+        # Nothing trades until every connection is open and every cache is filled
+        if not await warmup.run(WARMUP_TIMEOUT):
+            raise RuntimeError(f"Warm-up not ready after {WARMUP_TIMEOUT}s, missing {', '.join(warmup.missing())}")
+        await warmup.start_keepalive()
+        base_pool.log_metrics()
+        sol_pool.log_metrics()
+
+        await monitor_loop(base_priv_key, sol_priv_key)
+    finally:
+        # Let in-flight finalizations record their status before the tracker goes away
+        if finalization_tasks:
+            await asyncio.wait(finalization_tasks, timeout=SOL_FINALIZE_TIMEOUT)
+        await warmup.stop()
+        await allowance_manager.stop()
+        await fee_oracle.stop()
+        await sol_tracker.stop()
+        await receipt_tracker.stop()
+        await base_broadcaster.stop()
+        await sol_broadcaster.stop()
+        await tick_recorder.stop()
+        await v2_feed.stop()
+        await price_service.stop()
+        base_pool.log_metrics()
+        sol_pool.log_metrics()
+        await base_pool.stop()
+        await sol_pool.stop()
+        await get_sol_client_async().close()
+        # Release pooled keep-alive connections on shutdown
+        await close_session()
+
+def build_warmup(base_pool, sol_pool) -> Warmup:
+    """
+    Every start-up step, run in parallel by Warmup before the first trading round:
+    RPC pools and each endpoint's client connection, Odos / Jupiter connections
+    (one monitor quote round), prices, fees, the Base nonce and allowances,
+    and a check of on-chain token decimals against config.
+    Keep-alive pings cover the connections no background refresh already uses.
+    """
+    base_tokens = token_configs["base"]["tokens"].values()
+    warmup = Warmup()
+
+    async def warm_rpc():
+        await asyncio.gather(base_pool.start(), sol_pool.start())
+        await asyncio.gather(get_w3_async().provider.warm(), get_sol_client_async().warm())
+
+    async def warm_base_account():
+        # The nonce is synced before allowance_manager can send an approval with it
+        if nonce_manager.next_nonce is None:
+            await nonce_manager.sync()
+        await allowance_manager.start()
+
+    warmup.add("rpc_pools", warm_rpc, lambda: base_pool.is_ready() and sol_pool.is_ready())
+    warmup.add("upstreams", fetch_monitor_quotes)
+    sol_mint = token_configs["solana"]["tokens"]["sol"]["address"]
+    warmup.add("prices", price_service.start, lambda: price_service.get_price(sol_mint) is not None)
+    warmup.add("fees", fee_oracle.start, fee_oracle.is_ready)
+    warmup.add("base_account", warm_base_account, lambda: nonce_manager.next_nonce is not None and all(
+        allowance_manager.allowance(token["address"]) is not None for token in base_tokens
+    ))
+    warmup.add("token_metadata", fetch_token_metadata)
+    if USE_V2_SYNC_FEED:
+        # The bot already falls back to Odos prices without reserves, so this one may stay cold
+        warmup.add("v2_feed", v2_feed.start, v2_feed.is_ready, required=False)
+
+    warmup.add_keepalive("odos", lambda: ping_url(f"{ODOS_API_URL}/info/chains"))
+    warmup.add_keepalive("jupiter", lambda: ping_url(f"{JUPITER_API_URL}/quote"))
+    warmup.add_keepalive("base_rpc", lambda: get_w3_async().provider.warm())
+    warmup.add_keepalive("sol_rpc", lambda: get_sol_client_async().warm())
+    return warmup
+
+async def monitor_loop(base_priv_key: str, sol_priv_key: str):
+    """
+    Continuous loop: check prices, execute when an opportunity is found
+    """
+    if MONITOR_MODE == "pipelined":
+        rounds = pipelined_price_checker(MONITOR_TARGET_RPS)
+    else:
+        rounds = sequential_price_checker(delay=1)
+
+    async for arbitrage_check, trade_action, amount_in, amount_out in rounds:
+        try:
             if arbitrage_check:
+                detected_at = time.monotonic()
                 logger.info(f"\n!!! POSITIVE PROFIT ON ARBITRAGE !!!\n"
                 f"--------------------------------------\n"
                 f"Trade action: {trade_action}\n"
@@ -508,7 +1012,8 @@ async def main():
                     amount_in,
                     amount_out,
                     base_priv_key,
-                    sol_priv_key
+                    sol_priv_key,
+                    detected_at=detected_at
                 )
                 
                 if success:
@@ -519,9 +1024,6 @@ async def main():
                 # Add a small delay after execution before resuming monitoring
                 logger.info(f"Waiting {MONITOR_DELAY} seconds before resuming monitoring...")
                 await asyncio.sleep(MONITOR_DELAY)
-            else:
-                # No arbitrage opportunity found, continue monitoring
-                await asyncio.sleep(1)
             
         except Exception as e:
             logger.error(f"Error in main loop: {str(e)}")
@@ -539,6 +1041,7 @@ async def main():
             f"=======================")
 
 if __name__ == "__main__":
+    setup_logging()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -2,6 +2,8 @@ token_configs = {
     "base": {
         "chain_id": "8453",
         "odos_routerV2": "0x19cEeAd7105607Cd444F5ad10dd51356436095a1",
+        "uniswapV2_router02": "0x4752ba5dbc23f44d87826276bf6fd6b1c372ad24",
+        "luna_virtual_v2_pair": "0xa8e64FB120CE8796594670BAE72279C8aA1e5359",
         "tokens": {
             "luna": {
                 "address": "0x55cD6469F597452B5A7536e2CD98fDE4c1247ee4",
@@ -0,0 +1,17 @@
+# Base Imports
+import importlib
+from functools import cache
+
+# ABI name -> module under contracts.abi that defines it. The ABI modules are
+# large literals, so they are only imported the first time get_abi asks for one.
+ABI_MODULES = {
+    "erc20_abi": "contracts.abi.erc20_approve_abi",
+    "multicall3_abi": "contracts.abi.multicall3_abi",
+    "v2_lp_abi": "contracts.abi.base_uniswapV2_lp",
+    "router02_abi": "contracts.abi.base_uniswapV2_router02",
+}
+
+@cache
+def get_abi(name: str):
+    """The ABI list called {name}, importing its module on first use"""
+    return getattr(importlib.import_module(ABI_MODULES[name]), name)
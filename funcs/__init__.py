@@ -1,29 +1,134 @@
 # Base Imports
 import os
 import json
+from functools import cache
 
-# External Imports
-from dotenv import load_dotenv
-from web3 import Web3
-from web3 import AsyncHTTPProvider, AsyncWeb3
-from solana.rpc.api import Client
-from solana.rpc.async_api import AsyncClient
+# Nothing below runs at import time. Settings are read from the environment
+# (and .env) on first use, and the web3 / solana clients are built by the
+# get_* accessors the first time someone asks for them, so importing funcs
+# does no I/O and pulls in neither web3 nor solana.
+#
+# The old module attributes (funcs.w3, funcs.base_rpc, ...) still resolve
+# through __getattr__, on first access.
 
-load_dotenv()
+RECONNECT_DELAY = 2 # Seconds every websocket follower waits before reconnecting a dropped socket
 
-# Base Side Inits
-infura_key = os.getenv("BASE_INFURA_API_KEY")
-base_rpc = f'https://base-mainnet.infura.io/v3/{infura_key}'
+def _url_list(name: str, default):
+    """Comma separated urls from env var {name}, or {default}"""
+    return [url.strip() for url in os.getenv(name, "").split(",") if url.strip()] or default
 
-w3 = Web3(Web3.HTTPProvider(base_rpc))
-w3_async = AsyncWeb3(AsyncHTTPProvider(base_rpc))
+@cache
+def load_env():
+    """Load .env into the process environment, once"""
+    from dotenv import load_dotenv
+    return load_dotenv()
 
-# Solana Side Inits
-sol_rpc = os.getenv("SOL_RPC")
-sol_client_async = AsyncClient(sol_rpc)
-sol_client = Client(sol_rpc)
+@cache
+def rpc_settings():
+    """
+    Every RPC url the bot uses, read once from the environment after loading .env
+
+    Returns:
+        dict: infura_key, base_rpc, base_ws_rpc, base_broadcast_rpcs, base_rpcs,
+              sol_rpc, sol_ws_rpc, sol_broadcast_rpcs, sol_rpcs
+    """
+    load_env()
+
+    # Base Side
+    infura_key = os.getenv("BASE_INFURA_API_KEY")
+    base_rpc = f'https://base-mainnet.infura.io/v3/{infura_key}'
+
+    # Solana Side
+    sol_rpc = os.getenv("SOL_RPC")
+
+    return {
+        "infura_key": infura_key,
+        "base_rpc": base_rpc,
+        "base_ws_rpc": os.getenv("BASE_WS_RPC") or f'wss://base-mainnet.infura.io/ws/v3/{infura_key}',
+        # Extra endpoints every Base transaction is fanned out to
+        "base_broadcast_rpcs": _url_list("BASE_BROADCAST_RPCS", [base_rpc]),
+        # Read endpoints, scored by latency and error rate; every read goes to the best healthy one
+        "base_rpcs": _url_list("BASE_RPCS", [base_rpc]),
+        "sol_rpc": sol_rpc,
+        "sol_ws_rpc": os.getenv("SOL_WS_RPC") or (sol_rpc.replace("https://", "wss://").replace("http://", "ws://") if sol_rpc else None),
+        "sol_broadcast_rpcs": _url_list("SOL_BROADCAST_RPCS", [sol_rpc]),
+        "sol_rpcs": _url_list("SOL_RPCS", [sol_rpc or "http://localhost:8899"]),
+    }
+
+@cache
+def get_base_pool():
+    from funcs.endpoint_pool import EndpointPool
+    return EndpointPool("base", rpc_settings()["base_rpcs"])
+
+@cache
+def get_sol_pool():
+    from funcs.endpoint_pool import EndpointPool
+    return EndpointPool("solana", rpc_settings()["sol_rpcs"])
+
+@cache
+def get_w3():
+    """Sync Web3 on the Base endpoint pool"""
+    from web3 import Web3
+    from funcs.endpoint_pool import PooledHTTPProvider
+    return Web3(PooledHTTPProvider(get_base_pool()))
+
+@cache
+def get_w3_async():
+    """AsyncWeb3 on the Base endpoint pool"""
+    from web3 import AsyncWeb3
+    from funcs.endpoint_pool import PooledAsyncHTTPProvider
+    return AsyncWeb3(PooledAsyncHTTPProvider(get_base_pool()))
+
+@cache
+def get_sol_client():
+    """Sync solana Client on the Solana endpoint pool"""
+    from solana.rpc.api import Client
+    from funcs.endpoint_pool import PooledSolanaClient
+    return PooledSolanaClient(get_sol_pool(), Client)
+
+@cache
+def get_sol_client_async():
+    """Async solana client on the Solana endpoint pool"""
+    from solana.rpc.async_api import AsyncClient
+    from funcs.endpoint_pool import PooledSolanaClient
+    return PooledSolanaClient(get_sol_pool(), AsyncClient)
+
+_SETTINGS = (
+    "infura_key", "base_rpc", "base_ws_rpc", "base_broadcast_rpcs", "base_rpcs",
+    "sol_rpc", "sol_ws_rpc", "sol_broadcast_rpcs", "sol_rpcs",
+)
+
+_ACCESSORS = {
+    "w3": get_w3,
+    "w3_async": get_w3_async,
+    "sol_client": get_sol_client,
+    "sol_client_async": get_sol_client_async,
+    "base_pool": get_base_pool,
+    "sol_pool": get_sol_pool,
+}
+
+def __getattr__(name):
+    if name in _ACCESSORS:
+        return _ACCESSORS[name]()
+    if name in _SETTINGS:
+        return rpc_settings()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def save_trade_data(trade_data, filename='trade_data.json'):
     with open(filename, 'w') as f:
         json.dump(trade_data, f, indent=4)
     return filename
+
+def append_trade_record(record, filename='trades.jsonl'):
+    """Append one trade record as a JSON line"""
+    with open(filename, 'a') as f:
+        f.write(json.dumps(record, default=str) + '\n')
+    return filename
+
+def hex_int(value) -> int:
+    """Int from a JSON-RPC quantity, given as a 0x hex string or already decoded"""
+    return int(value, 16) if isinstance(value, str) else int(value)
+
+async def as_result(value):
+    """Awaitable resolving to {value}, to stand in for a call in an asyncio.gather"""
+    return value
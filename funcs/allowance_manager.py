@@ -0,0 +1,126 @@
+# Base Imports
+import asyncio
+from contextlib import nullcontext
+
+# External Imports
+from web3 import Web3
+from config import token_configs
+from funcs.base_odos import LARGE_APPROVAL_THRESHOLD, MAX_UINT256, send_infinite_approval_async
+from funcs.multicall import refresh_base_state_async
+from logging_utility import logger
+
+class AllowanceManager:
+    """
+    In-memory allowances of every configured Base token for one owner and spender.
+
+    start() reads all allowances in one Multicall3 round trip and sends any
+    missing infinite approvals up front, as background tasks so monitoring
+    starts while they are mined. After that the state only changes through
+    our own transactions (record_approval / record_spend), so the execution
+    path can check approvals without touching the network.
+    """
+
+    def __init__(self, owner_address: str, private_key: str = None, spender_address: str = None, nonce_manager=None,
+                 fee_oracle=None, receipt_tracker=None):
+        self.owner_address = Web3.to_checksum_address(owner_address)
+        self.private_key = private_key
+        self.spender_address = Web3.to_checksum_address(spender_address or token_configs["base"]["odos_routerV2"])
+        self.allowances = {} # lowercase token address -> allowance (raw units)
+        self.pending = {} # lowercase token address -> approval task in flight
+        self.nonce_manager = nonce_manager
+        self.fee_oracle = fee_oracle
+        self.receipt_tracker = receipt_tracker
+        self._lock = asyncio.Lock() # Without a nonce manager, one approval at a time so nonces never collide
+
+    def allowance(self, token_address: str):
+        """Cached allowance, None if the token was never synced or was invalidated"""
+        return self.allowances.get(token_address.lower())
+
+    def needs_approval(self, token_address: str) -> bool:
+        """In-memory check, no RPC. Unknown tokens need approval."""
+        allowance = self.allowance(token_address)
+        return allowance is None or allowance < LARGE_APPROVAL_THRESHOLD
+
+    async def sync(self):
+        """Read every configured token's allowance for the spender in one round trip"""
+        state = await refresh_base_state_async(self.owner_address, self.spender_address)
+        for name, token in token_configs["base"]["tokens"].items():
+            allowance = state["allowances"].get(name)
+            if allowance is not None:
+                self.allowances[token["address"].lower()] = allowance
+        return state
+
+    async def start(self, wait: bool = False):
+        """
+        Sync from chain, then approve every configured token that is not yet infinitely approved
+
+        Args:
+            wait: Block until the approvals are mined instead of leaving them in the background
+        """
+        await self.sync()
+
+        tokens = token_configs["base"]["tokens"].values()
+        missing = [token["address"] for token in tokens if self.needs_approval(token["address"])]
+        logger.info(f"Allowances: {len(tokens) - len(missing)}/{len(tokens)} tokens approved for {self.spender_address}"
+        + (f", approving {len(missing)} in the background" if missing else ""))
+
+        tasks = [self.approve_in_background(token_address) for token_address in missing]
+        if wait and tasks:
+            await asyncio.gather(*tasks)
+
+    async def stop(self):
+        for task in self.pending.values():
+            task.cancel()
+        self.pending.clear()
+
+    def approve_in_background(self, token_address: str) -> asyncio.Task:
+        """Schedule one approval, reusing the task if it is already in flight"""
+        key = token_address.lower()
+        task = self.pending.get(key)
+        if task is None:
+            task = asyncio.create_task(self.approve(token_address))
+            self.pending[key] = task
+            task.add_done_callback(lambda _: self.pending.pop(key, None))
+        return task
+
+    async def approve(self, token_address: str) -> bool:
+        """Send one infinite approval on w3_async and record it on success"""
+        async with self._lock if self.nonce_manager is None else nullcontext():
+            if not self.needs_approval(token_address):
+                return True
+
+            success = await send_infinite_approval_async(
+                Web3.to_checksum_address(token_address), self.spender_address, self.private_key,
+                nonce_manager=self.nonce_manager, fee_oracle=self.fee_oracle,
+                receipt_tracker=self.receipt_tracker
+            )
+            if success:
+                self.record_approval(token_address)
+                logger.info(f"Allowances: approved {token_address}")
+            else:
+                logger.error(f"Allowances: approval failed for {token_address}")
+            return success
+
+    async def ensure(self, token_address: str) -> bool:
+        """
+        Hot-path check: True immediately when the cached allowance is infinite.
+        Otherwise waits for the token's approval, joining one already in flight.
+        """
+        if not self.needs_approval(token_address):
+            return True
+        return await self.approve_in_background(token_address)
+
+    # State changes from our own transactions
+    def record_approval(self, token_address: str, amount: int = MAX_UINT256):
+        self.allowances[token_address.lower()] = amount
+
+    def record_spend(self, token_address: str, amount: int):
+        """Our swap spent {amount}; ERC20s leave a max-uint allowance untouched"""
+        key = token_address.lower()
+        allowance = self.allowances.get(key)
+        if allowance is not None and allowance != MAX_UINT256:
+            self.allowances[key] = max(allowance - amount, 0)
+
+    def invalidate(self, token_address: str):
+        """Forget a token's allowance so the next ensure() approves it again"""
+        self.allowances.pop(token_address.lower(), None)
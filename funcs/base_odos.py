@@ -1,13 +1,18 @@
 # Base Imports
 import os
+import asyncio
 from decimal import Decimal
 
 # External Imports
 import aiohttp
-from contracts.abi.erc20_approve_abi import erc20_abi
-from funcs import w3 , w3_async
+from contracts import get_abi
+from funcs import as_result, get_w3, get_w3_async, hex_int
+from funcs.http_client import get_session
 
+ODOS_API_URL = "https://api.odos.xyz"
 slippage = 3 # Default is 0.3%, current is 3%
+MAX_UINT256 = 2**256 - 1 # Amount sent by an infinite approval
+LARGE_APPROVAL_THRESHOLD = 2**200 # Allowances above this are treated as infinite
 
 # Utils
 def convert_to_decimal_amount(amount: float, decimals: int) -> str:
@@ -36,7 +41,6 @@ async def quote_odos(in_token, out_token, amount, in_decimals, chain_id = '8453'
         slippage: Maximum slippage tolerance in percentage
     """
     
-    base_url = "https://api.odos.xyz"
     decimal_amount = convert_to_decimal_amount(amount, in_decimals)
     
     payload = {
@@ -61,17 +65,17 @@ async def quote_odos(in_token, out_token, amount, in_decimals, chain_id = '8453'
     }
     
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{base_url}/sor/quote/v2",
-                json=payload,
-                headers={
-                    "Content-Type": "application/json",
-                    "Accept": "application/json"
-                }
-            ) as response:
-                response.raise_for_status()
-                return await response.json()
+        session = get_session()
+        async with session.post(
+            f"{ODOS_API_URL}/sor/quote/v2",
+            json=payload,
+            headers={
+                "Content-Type": "application/json",
+                "Accept": "application/json"
+            }
+        ) as response:
+            response.raise_for_status()
+            return await response.json()
                 
     except aiohttp.ClientError as e:
         raise Exception(f"Error fetching quote from Odos API: {str(e)}")
@@ -80,7 +84,6 @@ async def assemble_odos(user_addrs, odos_quote):
     """ Assemble the odos quote asynchronously """
 
     pathId = parse_path_id(odos_quote)
-    base_url = "https://api.odos.xyz"
     
     payload = {
         "userAddr": user_addrs,
@@ -88,43 +91,41 @@ async def assemble_odos(user_addrs, odos_quote):
         "simulate": False
     }
     
-    async with aiohttp.ClientSession() as session:
-        try:
-            async with session.post(
-                f"{base_url}/sor/assemble",
-                json=payload,
-                headers={
-                    "Content-Type": "application/json",
-                    "Accept": "application/json"
-                }
-            ) as response:
-                response.raise_for_status()
-                return await response.json()
-                
-        except aiohttp.ClientError as e:
-            raise Exception(f"Error fetching quote from Odos API: {str(e)}")
+    try:
+        session = get_session()
+        async with session.post(
+            f"{ODOS_API_URL}/sor/assemble",
+            json=payload,
+            headers={
+                "Content-Type": "application/json",
+                "Accept": "application/json"
+            }
+        ) as response:
+            response.raise_for_status()
+            return await response.json()
+            
+    except aiohttp.ClientError as e:
+        raise Exception(f"Error fetching quote from Odos API: {str(e)}")
 
 # Check Approval
 def check_token_approval(token_address, owner_address, spender_address):
     """Check if token approval is needed"""
 
-    token_contract = w3.eth.contract(address=token_address, abi=erc20_abi)
+    w3 = get_w3()
+    token_contract = w3.eth.contract(address=token_address, abi=get_abi("erc20_abi"))
     current_allowance = token_contract.functions.allowance(owner_address, spender_address).call()
     
     # Check if current allowance is "infinite enough" (very large number)
-    LARGE_APPROVAL_THRESHOLD = 2**200  # If allowance is above this, we consider it infinite
     return current_allowance < LARGE_APPROVAL_THRESHOLD
 
-def send_infinite_approval(token_address, spender_address):
-    """Send infinite token approval transaction"""
+def send_infinite_approval(token_address, spender_address, private_key=None):
+    """Send infinite token approval transaction, signed with {private_key} or the PRIVATE_KEY env"""
     
-    token_contract = w3.eth.contract(address=token_address, abi=erc20_abi)
-    private_key = os.getenv("PRIVATE_KEY")
+    w3 = get_w3()
+    token_contract = w3.eth.contract(address=token_address, abi=get_abi("erc20_abi"))
+    private_key = private_key or os.getenv("PRIVATE_KEY")
     account = w3.eth.account.from_key(private_key)
     
-    # Maximum uint256 value for infinite approval
-    MAX_INT = 2**256 - 1
-    
     # Get the latest nonce and gas price
     latest_nonce = w3.eth.get_transaction_count(account.address, 'latest')
     gas_price = w3.eth.gas_price
@@ -135,7 +136,7 @@ def send_infinite_approval(token_address, spender_address):
         # Build approval transaction
         approve_tx = token_contract.functions.approve(
             spender_address,
-            MAX_INT
+            MAX_UINT256
         ).build_transaction({
             'from': account.address,
             'nonce': latest_nonce,
@@ -158,22 +159,154 @@ def send_infinite_approval(token_address, spender_address):
         print(f"Error in approval transaction: {str(e)}")
         return False
 
+async def send_infinite_approval_async(token_address, spender_address, private_key=None, timeout=120, poll_latency=0.5, nonce_manager=None, fee_oracle=None, receipt_tracker=None):
+    """
+    Send infinite token approval transaction on w3_async.
+    Nonce and gas price are fetched concurrently and the receipt wait yields to the event loop.
+    With {nonce_manager} the nonce is reserved locally instead of read from chain, and with a
+    ready {fee_oracle} a type-2 transaction is built from its cached fees instead of fetching gas_price.
+    With {receipt_tracker} the receipt comes from its shared per-block sweep instead of a polling loop.
+    """
+    
+    w3_async = get_w3_async()
+    token_contract = w3_async.eth.contract(address=token_address, abi=get_abi("erc20_abi"))
+    private_key = private_key or os.getenv("PRIVATE_KEY")
+    account = w3_async.eth.account.from_key(private_key)
+    
+    try:
+        # Get the pending nonce and gas price in one round trip
+        fees = fee_oracle.fees() if fee_oracle else None
+        latest_nonce, gas_price = await asyncio.gather(
+            nonce_manager.reserve() if nonce_manager else w3_async.eth.get_transaction_count(account.address, 'pending'),
+            w3_async.eth.gas_price if fees is None else as_result(None),
+            return_exceptions=True
+        )
+        reserved = nonce_manager is not None and not isinstance(latest_nonce, Exception)
+
+        # From here until the node accepts the send, any failure hands the reserved nonce back
+        try:
+            for result in (latest_nonce, gas_price):
+                if isinstance(result, Exception):
+                    raise result
+
+            # Build approval transaction
+            tx_params = {
+                'from': account.address,
+                'nonce': latest_nonce,
+                'gas': 100000,
+                'chainId': 8453  # Base chain ID
+            }
+            if fees is None:
+                tx_params['gasPrice'] = gas_price
+            else:
+                tx_params.update(fees)
+                tx_params['type'] = 2
+
+            approve_tx = await token_contract.functions.approve(
+                spender_address,
+                MAX_UINT256
+            ).build_transaction(tx_params)
+
+            # Sign and send transaction
+            signed_tx = w3_async.eth.account.sign_transaction(approve_tx, private_key)
+            tx_hash = await w3_async.eth.send_raw_transaction(signed_tx.raw_transaction)
+        except Exception as e:
+            if reserved:
+                await nonce_manager.release(latest_nonce, e)
+            raise
+        if nonce_manager:
+            nonce_manager.track(latest_nonce, tx_hash)
+        
+        # Wait for transaction receipt without blocking the loop
+        print(f"Waiting for infinite approval transaction {tx_hash.hex()} (nonce {latest_nonce}) to be mined...")
+        try:
+            if receipt_tracker is not None:
+                tx_receipt = await receipt_tracker.wait(tx_hash, timeout=timeout)
+            else:
+                tx_receipt = await w3_async.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout, poll_latency=poll_latency)
+        except Exception:
+            if nonce_manager:
+                await nonce_manager.sync()
+            raise
+        if nonce_manager:
+            nonce_manager.confirm(latest_nonce)
+        
+        return tx_receipt['status'] == 1
+        
+    except Exception as e:
+        print(f"Error in approval transaction: {str(e)}")
+        return False
+
 # Execute Transaction
-async def execute_odos(assembled_transaction, private_key, chain_id=8453):
-    """ Execute a transaction and check its status asynchronously """
+async def execute_odos(assembled_transaction, private_key, chain_id=8453, nonce_manager=None, fee_oracle=None, broadcaster=None, receipt_tracker=None):
+    """
+    Execute a transaction and check its status asynchronously.
+    With {nonce_manager} the nonce assembled by Odos is replaced by a locally reserved one,
+    and with {fee_oracle} its legacy gasPrice is replaced by the oracle's type-2 fees.
+    With {broadcaster} the raw transaction is fanned out to every configured endpoint and the
+    receipt comes from whichever endpoint sees it first.
+    With {receipt_tracker} the receipt comes from its shared per-block sweep instead.
+    """
 
+    w3_async = get_w3_async()
     transaction = assembled_transaction["transaction"]
     transaction["chainId"] = chain_id
     transaction["value"] = int(transaction["value"])
+
+    if fee_oracle is not None:
+        fee_oracle.apply(transaction)
+
+    nonce = None
+    landing_watch = None
     
     try:
-        # Sign and send transaction
-        signed_tx = w3_async.eth.account.sign_transaction(transaction, private_key)
-        tx_hash = await w3_async.eth.send_raw_transaction(signed_tx.raw_transaction)
+        if nonce_manager is not None:
+            nonce = await nonce_manager.reserve()
+
+        # From here until the node accepts the send, any failure hands the reserved nonce back
+        try:
+            if nonce is not None:
+                transaction["nonce"] = nonce
+
+            # Sign and send transaction
+            signed_tx = w3_async.eth.account.sign_transaction(transaction, private_key)
+            if broadcaster is not None:
+                tx_hash = signed_tx.hash
+                sent = await broadcaster.broadcast(signed_tx.raw_transaction, tx_id="0x" + tx_hash.hex().removeprefix("0x"))
+                print(f"Base -> Broadcast to {len(sent['acks'])}/{len(broadcaster.endpoints)} endpoints, first ack {sent['first_ack']}")
+                if receipt_tracker is not None:
+                    # The receipt comes from the tracker; this only credits the broadcast endpoint that saw it first
+                    landing_watch = broadcaster.watch_landing(sent["tx_id"])
+            else:
+                tx_hash = await w3_async.eth.send_raw_transaction(signed_tx.raw_transaction)
+        except Exception as e:
+            if nonce is not None:
+                await nonce_manager.release(nonce, e)
+            raise
+        if nonce is not None:
+            nonce_manager.track(nonce, tx_hash)
         
         # Wait for transaction receipt
         print(f"Base -> Transaction sent: {tx_hash.hex()}")
-        tx_receipt = await w3_async.eth.wait_for_transaction_receipt(tx_hash)
+        try:
+            if receipt_tracker is not None:
+                tx_receipt = await receipt_tracker.wait(tx_hash)
+                print(f"Base -> Receipt after {tx_receipt['seconds']:.2f}s from {tx_receipt['endpoint']}")
+            elif broadcaster is not None:
+                endpoint, receipt = await broadcaster.wait_landed("0x" + tx_hash.hex().removeprefix("0x"))
+                print(f"Base -> Receipt first seen by {endpoint}")
+                tx_receipt = {**receipt, "status": hex_int(receipt["status"]), "blockNumber": hex_int(receipt["blockNumber"])}
+            else:
+                tx_receipt = await w3_async.eth.wait_for_transaction_receipt(tx_hash)
+        except Exception:
+            if landing_watch is not None:
+                landing_watch.cancel()
+            # Never mined in time: dropped or replaced, let the chain decide the next nonce
+            if nonce is not None:
+                await nonce_manager.sync()
+            raise
+        if nonce is not None:
+            nonce_manager.confirm(nonce)
         
         # Check transaction status
         if tx_receipt['status'] == 1:
@@ -189,9 +322,9 @@ async def execute_odos(assembled_transaction, private_key, chain_id=8453):
         else:
             # Try to get revert reason
             try:
-                tx = await w3.eth.get_transaction(tx_hash)
+                tx = await w3_async.eth.get_transaction(tx_hash)
                 # Simulate the failed transaction to get the revert reason
-                await w3.eth.call(
+                await w3_async.eth.call(
                     {
                         'from': tx['from'],
                         'to': tx['to'],
@@ -0,0 +1,198 @@
+# Base Imports
+import json
+import time
+import asyncio
+import itertools
+
+# External Imports
+import websockets
+from funcs import RECONNECT_DELAY, get_base_pool, hex_int, rpc_settings
+from funcs.http_client import get_session
+from logging_utility import logger
+
+POLL_INTERVAL = 2 # Seconds between receipt sweeps while newHeads is down (about one Base block)
+RECEIPT_BATCH_SIZE = 100 # Receipts per JSON-RPC batch request
+
+def normalize_hash(tx_hash) -> str:
+    """0x-prefixed lowercase hex for a hash given as HexBytes, bytes or str"""
+    if isinstance(tx_hash, (bytes, bytearray)):
+        tx_hash = bytes(tx_hash).hex()
+    return "0x" + str(tx_hash).lower().removeprefix("0x")
+
+class ReceiptTracker:
+    """
+    Resolves a future per Base transaction hash as soon as its receipt exists.
+
+    One newHeads subscription drives everything: on every new block the
+    receipts of all outstanding hashes are fetched in a single JSON-RPC batch
+    request, so a transaction resolves within one block of inclusion and N
+    in-flight transactions cost one request per block instead of N polling
+    loops. Heads that arrive while a sweep is still running are coalesced
+    into one follow-up sweep. While the socket is down the same sweep runs
+    every `poll_interval` seconds instead.
+
+    Results are receipt dicts with integer status and blockNumber, plus
+    endpoint (the url that answered) and seconds (time from track() to resolve).
+
+    Args:
+        ws_url: Websocket url for newHeads, BASE_WS_RPC by default, "" to poll only
+        pool: EndpointPool the receipt batches are sent through, the shared Base pool by default
+    """
+
+    def __init__(self, ws_url: str = None, pool=None, poll_interval: float = POLL_INTERVAL):
+        self._ws_url = ws_url
+        self._pool = pool
+        self.poll_interval = poll_interval
+        self.watched = {} # tx hash -> (future, tracked_at)
+        self.head = None # Latest block number seen on newHeads
+        self.sweeps = 0 # Batched receipt requests sent, for comparing against per-transaction polling
+        self._ids = itertools.count(1)
+        self._connected = False
+        self._wake = asyncio.Event()
+        self._tasks = []
+
+    @property
+    def ws_url(self):
+        """The websocket url passed in, or BASE_WS_RPC; "" disables newHeads and only the poll runs"""
+        return self._ws_url if self._ws_url is not None else rpc_settings()["base_ws_rpc"]
+
+    @property
+    def pool(self):
+        return self._pool or get_base_pool()
+
+    # Public API
+    def track(self, tx_hash) -> asyncio.Future:
+        """Start watching {tx_hash}; the returned future resolves with its receipt"""
+        tx_hash = normalize_hash(tx_hash)
+        if tx_hash in self.watched:
+            return self.watched[tx_hash][0]
+
+        future = asyncio.get_running_loop().create_future()
+        self.watched[tx_hash] = (future, time.monotonic())
+        return future
+
+    async def wait(self, tx_hash, timeout: float = 120):
+        """
+        Track {tx_hash} and wait up to {timeout} seconds for its receipt
+
+        Returns:
+            dict: the receipt. Raises asyncio.TimeoutError if it is never mined.
+        """
+        future = self.track(tx_hash)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            self.forget(tx_hash)
+            raise
+
+    def forget(self, tx_hash):
+        """Stop watching {tx_hash} without resolving it"""
+        entry = self.watched.pop(normalize_hash(tx_hash), None)
+        if entry and not entry[0].done():
+            entry[0].cancel()
+
+    def outstanding(self) -> int:
+        return len(self.watched)
+
+    # Receipt sweep
+    async def _batch(self, url: str, hashes):
+        session = get_session()
+        ids = {next(self._ids): tx_hash for tx_hash in hashes}
+        payload = [{"jsonrpc": "2.0", "id": request_id, "method": "eth_getTransactionReceipt", "params": [tx_hash]}
+                   for request_id, tx_hash in ids.items()]
+        async with session.post(url, json=payload) as response:
+            response.raise_for_status()
+            body = await response.json()
+        # Batch responses may come back in any order
+        return {ids[item["id"]]: item.get("result") for item in body if item.get("id") in ids}
+
+    async def sweep(self):
+        """Fetch every outstanding receipt in one batch request per RECEIPT_BATCH_SIZE hashes"""
+        hashes = list(self.watched)
+        for i in range(0, len(hashes), RECEIPT_BATCH_SIZE):
+            batch = hashes[i:i + RECEIPT_BATCH_SIZE]
+            # A malformed batch body (ValueError) also moves on to the next endpoint
+            url, receipts = await self.pool.call_async(lambda url: self._batch(url, batch),
+                                                       errors=self.pool.failover_errors + (ValueError,))
+            self.sweeps += 1
+
+            for tx_hash, receipt in receipts.items():
+                if receipt:
+                    self._resolve(tx_hash, receipt, url)
+
+    def _resolve(self, tx_hash: str, receipt: dict, endpoint: str):
+        entry = self.watched.pop(tx_hash, None)
+        if entry is None:
+            return
+
+        future, tracked_at = entry
+        if not future.done():
+            future.set_result({
+                **receipt,
+                "status": hex_int(receipt["status"]),
+                "blockNumber": hex_int(receipt["blockNumber"]),
+                "endpoint": endpoint,
+                "seconds": time.monotonic() - tracked_at,
+            })
+
+    async def _run_sweeps(self):
+        """One sweep per wake-up; heads that arrive mid-sweep collapse into the next one"""
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), None if self._connected else self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            if not self.watched:
+                continue
+            try:
+                await self.sweep()
+            except Exception as e:
+                logger.warning(f"Receipts: sweep failed: {e}")
+
+    # newHeads
+    async def _follow(self):
+        async with websockets.connect(self.ws_url) as websocket:
+            await websocket.send(json.dumps({
+                "jsonrpc": "2.0", "id": next(self._ids), "method": "eth_subscribe", "params": ["newHeads"],
+            }))
+            self._connected = True
+            logger.info(f"Receipts: subscribed to newHeads, {len(self.watched)} transaction(s) outstanding")
+            # Catch up on anything mined while the socket was down
+            self._wake.set()
+
+            async for raw in websocket:
+                message = json.loads(raw)
+                if message.get("method") != "eth_subscription":
+                    continue
+                self.head = hex_int(message["params"]["result"]["number"])
+                self._wake.set()
+
+    async def _run_websocket(self):
+        while True:
+            try:
+                await self._follow()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Receipts: newHeads lost ({e}), polling until reconnected in {RECONNECT_DELAY}s")
+            finally:
+                self._connected = False
+                self._wake.set()
+            await asyncio.sleep(RECONNECT_DELAY)
+
+    async def start(self):
+        if not self._tasks:
+            if self.ws_url:
+                self._tasks.append(asyncio.create_task(self._run_websocket()))
+            self._tasks.append(asyncio.create_task(self._run_sweeps()))
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
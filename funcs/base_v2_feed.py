@@ -0,0 +1,129 @@
+# Base Imports
+import time
+import asyncio
+
+# External Imports
+from web3 import AsyncWeb3, Web3, WebSocketProvider
+from contracts import get_abi
+from funcs import RECONNECT_DELAY, hex_int, rpc_settings
+from funcs.refresher import BackgroundRefresher
+from logging_utility import logger
+
+SYNC_TOPIC = "0x" + Web3.keccak(text="Sync(uint112,uint112)").hex().removeprefix("0x")
+
+def decode_sync_data(data):
+    """Decode the (reserve0, reserve1) payload of a Sync log"""
+    if isinstance(data, str):
+        data = bytes.fromhex(data.removeprefix("0x"))
+    data = bytes(data)
+    return int.from_bytes(data[0:32], "big"), int.from_bytes(data[32:64], "big")
+
+class V2SyncFeed(BackgroundRefresher):
+    """
+    In-memory reserves for one Uniswap V2 pair, driven by its Sync events.
+
+    Subscribes to the pair's Sync logs over a websocket provider, seeds the
+    reserves with getReserves() once per connection, and applies every Sync
+    after that. A new price is available as soon as the log for its block
+    arrives, with no aggregator round trip. The background task is the
+    subscription itself, reconnecting every `interval` seconds after a drop.
+    """
+
+    def __init__(self, pair_address: str, ws_url: str = None):
+        super().__init__(RECONNECT_DELAY)
+        self.pair_address = Web3.to_checksum_address(pair_address)
+        self.ws_url = ws_url # BASE_WS_RPC when None, resolved on connect
+        self.token0 = None
+        self.token1 = None
+        self.reserve0 = None
+        self.reserve1 = None
+        self.block_number = None
+        self._position = (-1, -1) # (blockNumber, logIndex) of the last applied update
+        self._ready = asyncio.Event()
+
+    # Readers
+    def is_ready(self) -> bool:
+        return self._ready.is_set()
+
+    def reserves_for(self, token_in: str):
+        """
+        Reserves ordered for a swap that sells {token_in}
+
+        Returns:
+            tuple: (reserve_in, reserve_out) in raw token units
+        """
+        if Web3.to_checksum_address(token_in) == self.token0:
+            return self.reserve0, self.reserve1
+        if Web3.to_checksum_address(token_in) == self.token1:
+            return self.reserve1, self.reserve0
+        raise ValueError(f"{token_in} is not in pair {self.pair_address}")
+
+    def spot_price(self, token_in: str, in_decimals: int = 18, out_decimals: int = 18) -> float:
+        """Marginal price of 1 {token_in} in the other token, before fee and impact"""
+        reserve_in, reserve_out = self.reserves_for(token_in)
+        return (reserve_out / 10 ** out_decimals) / (reserve_in / 10 ** in_decimals)
+
+    # Updates
+    def _apply(self, reserve0: int, reserve1: int, block_number: int, log_index: int = -1):
+        position = (block_number, log_index)
+        # Logs can arrive out of order around a reconnect; never step backwards
+        if position < self._position:
+            return False
+
+        self.reserve0 = reserve0
+        self.reserve1 = reserve1
+        self.block_number = block_number
+        self.updated_at = time.monotonic()
+        self._position = position
+        self._ready.set()
+        return True
+
+    def _on_log(self, log):
+        if log.get("removed"):
+            logger.warning(f"V2 feed: Sync log removed by reorg at block {hex_int(log['blockNumber'])}, waiting for the next one")
+            return
+
+        reserve0, reserve1 = decode_sync_data(log["data"])
+        self._apply(reserve0, reserve1, hex_int(log["blockNumber"]), hex_int(log["logIndex"]))
+
+    async def _follow(self):
+        async with AsyncWeb3(WebSocketProvider(self.ws_url or rpc_settings()["base_ws_rpc"])) as w3:
+            pair = w3.eth.contract(address=self.pair_address, abi=get_abi("v2_lp_abi"))
+
+            subscription_id = await w3.eth.subscribe("logs", {
+                "address": self.pair_address,
+                "topics": [SYNC_TOPIC],
+            })
+
+            # Seed after subscribing so a Sync between the read and the subscription is not missed,
+            # reading the reserves at the block they are tagged with
+            block_number = await w3.eth.block_number
+            self.token0, self.token1, (reserve0, reserve1, _) = await asyncio.gather(
+                pair.functions.token0().call(),
+                pair.functions.token1().call(),
+                pair.functions.getReserves().call(block_identifier=block_number),
+            )
+            self.token0 = Web3.to_checksum_address(self.token0)
+            self.token1 = Web3.to_checksum_address(self.token1)
+            self._apply(reserve0, reserve1, block_number)
+            logger.info(f"V2 feed: following Sync on {self.pair_address} from block {block_number}")
+
+            async for payload in w3.socket.process_subscriptions():
+                if payload.get("subscription") != subscription_id:
+                    continue
+                self._on_log(payload["result"])
+
+    async def _run(self):
+        while True:
+            try:
+                await self._follow()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"V2 feed: connection lost ({e}), reconnecting in {self.interval}s")
+            await asyncio.sleep(self.interval)
+
+    async def start(self, timeout: float = 10):
+        """Start following the pair and wait up to {timeout} seconds for the first reserves"""
+        self._spawn()
+        await asyncio.wait_for(self._ready.wait(), timeout)
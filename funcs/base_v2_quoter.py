@@ -0,0 +1,100 @@
+# External Imports
+from web3 import Web3
+from funcs.multicall import multicall, prepare_call
+
+# Uniswap V2 charges 0.3% on the input amount
+FEE_NUMERATOR = 997
+FEE_DENOMINATOR = 1000
+
+# Quote Engine - integer math identical to UniswapV2Library
+def get_amount_out(amount_in: int, reserve_in: int, reserve_out: int) -> int:
+    """
+    Exact output of a V2 swap, as returned by router.getAmountsOut
+
+    Args:
+        amount_in: Input amount in raw token units
+        reserve_in: Pair reserve of the input token
+        reserve_out: Pair reserve of the output token
+    """
+    if amount_in <= 0:
+        raise ValueError("INSUFFICIENT_INPUT_AMOUNT")
+    if reserve_in <= 0 or reserve_out <= 0:
+        raise ValueError("INSUFFICIENT_LIQUIDITY")
+
+    amount_in_with_fee = amount_in * FEE_NUMERATOR
+    numerator = amount_in_with_fee * reserve_out
+    denominator = reserve_in * FEE_DENOMINATOR + amount_in_with_fee
+    return numerator // denominator
+
+def get_amount_in(amount_out: int, reserve_in: int, reserve_out: int) -> int:
+    """
+    Exact input needed to receive {amount_out}, as returned by router.getAmountsIn
+
+    Args:
+        amount_out: Desired output amount in raw token units
+        reserve_in: Pair reserve of the input token
+        reserve_out: Pair reserve of the output token
+    """
+    if amount_out <= 0:
+        raise ValueError("INSUFFICIENT_OUTPUT_AMOUNT")
+    if reserve_in <= 0 or reserve_out <= 0:
+        raise ValueError("INSUFFICIENT_LIQUIDITY")
+    if amount_out >= reserve_out:
+        raise ValueError("INSUFFICIENT_LIQUIDITY")
+
+    numerator = reserve_in * amount_out * FEE_DENOMINATOR
+    denominator = (reserve_out - amount_out) * FEE_NUMERATOR
+    return numerator // denominator + 1
+
+def get_amounts_out_ladder(amounts_in, reserve_in: int, reserve_out: int):
+    """Exact outputs for a whole ladder of input sizes against the same reserves"""
+    return [get_amount_out(amount, reserve_in, reserve_out) for amount in amounts_in]
+
+def get_amounts_in_ladder(amounts_out, reserve_in: int, reserve_out: int):
+    """
+    Exact inputs for a whole ladder of output sizes against the same reserves.
+    Sizes the pool cannot fill map to None.
+    """
+    return [
+        get_amount_in(amount, reserve_in, reserve_out) if amount < reserve_out else None
+        for amount in amounts_out
+    ]
+
+# RPC Cross-Check
+def cross_check_router(w3, pair_contract, router02_contract, token_in, amounts_in, block_identifier=None):
+    """
+    Confirm the local engine is bit-exact with router02 for every size in {amounts_in}.
+
+    Reserves and router quotes are each read in one Multicall3 batch at the
+    same block, so both sides see identical state.
+
+    Returns:
+        list: (amount_in, local_out, router_out) for every size that differs
+    """
+    if block_identifier is None:
+        block_identifier = w3.eth.block_number
+
+    token0, token1, (reserve0, reserve1, _) = multicall([
+        prepare_call(pair_contract, "token0"),
+        prepare_call(pair_contract, "token1"),
+        prepare_call(pair_contract, "getReserves"),
+    ], block_identifier=block_identifier, client=w3)
+    token0, token1 = Web3.to_checksum_address(token0), Web3.to_checksum_address(token1)
+
+    if Web3.to_checksum_address(token_in) == token0:
+        path, reserve_in, reserve_out = [token0, token1], reserve0, reserve1
+    else:
+        path, reserve_in, reserve_out = [token1, token0], reserve1, reserve0
+
+    local_amounts = get_amounts_out_ladder(amounts_in, reserve_in, reserve_out)
+    router_amounts = multicall(
+        [prepare_call(router02_contract, "getAmountsOut", amount_in, path) for amount_in in amounts_in],
+        block_identifier=block_identifier, client=w3
+    )
+
+    mismatches = []
+    for amount_in, local_out, router_out in zip(amounts_in, local_amounts, router_amounts):
+        if router_out[1] != local_out:
+            mismatches.append((amount_in, local_out, router_out[1]))
+
+    return mismatches
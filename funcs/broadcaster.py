@@ -0,0 +1,247 @@
+# Base Imports
+import time
+import base64
+import asyncio
+import itertools
+
+# External Imports
+import aiohttp
+from funcs.http_client import get_session
+from logging_utility import logger
+
+LANDING_POLL_INTERVAL = 0.5 # Seconds between landing checks across every endpoint
+LANDING_TIMEOUT = 120 # Seconds wait_landed waits before giving up
+
+class EndpointStats:
+    """Running totals for one endpoint"""
+
+    def __init__(self):
+        self.sent = 0 # Transactions sent to it, once per transaction
+        self.resends = 0 # Repeat sends of a transaction it was already sent (Solana rebroadcasts)
+        self.acked = 0 # Transactions it accepted, once per transaction
+        self.errors = 0 # First sends it rejected or that failed in transport
+        self.first_acks = 0 # Times it was the first to accept a transaction
+        self.first_confirms = 0 # Times its view was the first to show a transaction landed
+        self.landed = 0 # Transactions it accepted that later landed
+        self.ack_ms_total = 0.0
+
+    def as_dict(self):
+        return {
+            "sent": self.sent,
+            "resends": self.resends,
+            "acked": self.acked,
+            "errors": self.errors,
+            "first_acks": self.first_acks,
+            "first_confirms": self.first_confirms,
+            "landed": self.landed,
+            "landing_rate": self.landed / self.acked if self.acked else None,
+            "mean_ack_ms": self.ack_ms_total / self.acked if self.acked else None,
+        }
+
+class Broadcaster:
+    """
+    Sends the same raw transaction to several RPC endpoints in parallel.
+
+    Every broadcast records which endpoint accepted it first; wait_landed()
+    polls every endpoint's view and records which one showed it landed
+    first. When the caller waits on its own tracker (receipts sweep,
+    signatureSubscribe), watch_landing() runs that poll in the background so
+    the landing is still credited to a broadcast endpoint. Per-endpoint
+    totals are kept in `stats` so slow or lossy endpoints can be spotted and
+    dropped from the env list. Broadcasting the same tx id again (a Solana
+    rebroadcast) counts as a resend: sent, acked and first_acks count each
+    transaction once per endpoint, so landing_rate stays per transaction.
+
+    Args:
+        chain: "base" (eth_sendRawTransaction / eth_getTransactionReceipt)
+               or "solana" (sendTransaction / getSignatureStatuses)
+        endpoints: JSON-RPC HTTP urls
+    """
+
+    def __init__(self, chain: str, endpoints):
+        if chain not in ("base", "solana"):
+            raise ValueError(f"Unsupported chain {chain}")
+        self.chain = chain
+        self.endpoints = list(dict.fromkeys(endpoint for endpoint in endpoints if endpoint))
+        self.stats = {endpoint: EndpointStats() for endpoint in self.endpoints}
+        self.transactions = {} # tx id -> {"sent_to": [...], "acked_by": [...], "first_ack", "confirmed_by", "sent_at"}
+        self._ids = itertools.count(1)
+        self._watchers = set() # watch_landing tasks, kept referenced until they finish
+
+    # JSON-RPC
+    async def _rpc(self, endpoint: str, method: str, params):
+        session = get_session()
+        payload = {"jsonrpc": "2.0", "id": next(self._ids), "method": method, "params": params}
+        async with session.post(endpoint, json=payload) as response:
+            response.raise_for_status()
+            body = await response.json()
+        if body.get("error"):
+            raise RuntimeError(body["error"].get("message", body["error"]))
+        return body["result"]
+
+    def _send_request(self, raw_tx: bytes):
+        if self.chain == "base":
+            return "eth_sendRawTransaction", ["0x" + bytes(raw_tx).hex()]
+        encoded = base64.b64encode(bytes(raw_tx)).decode()
+        return "sendTransaction", [encoded, {"encoding": "base64", "skipPreflight": True, "maxRetries": 0}]
+
+    # Fan-out
+    async def broadcast(self, raw_tx: bytes, tx_id: str = None):
+        """
+        Send {raw_tx} to every endpoint at once
+
+        Args:
+            tx_id: Known hash / signature; when given, the ids endpoints echo back are not needed
+
+        Returns:
+            dict: tx_id, first_ack, acks {endpoint: ms}, errors {endpoint: message}.
+            Raises RuntimeError carrying the last send error when no endpoint accepted it,
+            so a nonce error still reaches NonceManager.release.
+        """
+        method, params = self._send_request(raw_tx)
+        started = time.monotonic()
+        acks, errors = {}, {}
+        first = {"endpoint": None, "tx_id": tx_id, "error": None}
+        # What earlier broadcasts of the same tx id already counted
+        known = self.transactions.get(tx_id, {})
+        sent_to, acked_by = set(known.get("sent_to", ())), set(known.get("acked_by", ()))
+        first_counted = known.get("first_ack") is not None
+
+        async def send(endpoint):
+            stats = self.stats[endpoint]
+            resend = endpoint in sent_to
+            if resend:
+                stats.resends += 1
+            else:
+                stats.sent += 1
+            try:
+                result = await self._rpc(endpoint, method, params)
+            except (aiohttp.ClientError, asyncio.TimeoutError, RuntimeError, ValueError) as e:
+                if not resend:
+                    stats.errors += 1
+                errors[endpoint] = str(e)
+                first["error"] = e
+                return
+
+            elapsed_ms = (time.monotonic() - started) * 1000
+            acks[endpoint] = elapsed_ms
+            if endpoint not in acked_by:
+                stats.acked += 1
+                stats.ack_ms_total += elapsed_ms
+            if first["endpoint"] is None:
+                first["endpoint"] = endpoint
+                first["tx_id"] = first["tx_id"] or result
+                if not first_counted:
+                    stats.first_acks += 1
+
+        await asyncio.gather(*[send(endpoint) for endpoint in self.endpoints])
+
+        if first["tx_id"] is not None:
+            record = self._record(first["tx_id"], started)
+            record["sent_to"] = list(dict.fromkeys(record["sent_to"] + self.endpoints))
+        if first["endpoint"] is None:
+            raise RuntimeError(f"None of {len(self.endpoints)} endpoint(s) accepted the transaction, last error: {first['error']}") from first["error"]
+
+        record["acked_by"] = list(dict.fromkeys(record["acked_by"] + list(acks)))
+        if record["first_ack"] is None:
+            record["first_ack"] = first["endpoint"]
+
+        return {"tx_id": first["tx_id"], "first_ack": first["endpoint"], "acks": acks, "errors": errors}
+
+    def _record(self, tx_id: str, sent_at: float = None):
+        return self.transactions.setdefault(tx_id, {
+            "sent_to": [], "acked_by": [], "first_ack": None, "confirmed_by": None,
+            "sent_at": time.monotonic() if sent_at is None else sent_at,
+        })
+
+    # Landing
+    async def _landed_view(self, endpoint: str, tx_id: str):
+        """The endpoint's receipt / status for {tx_id}, None while it has not landed there"""
+        if self.chain == "base":
+            return await self._rpc(endpoint, "eth_getTransactionReceipt", [tx_id])
+
+        result = await self._rpc(endpoint, "getSignatureStatuses", [[tx_id]])
+        status = result["value"][0]
+        if status is None or status.get("confirmationStatus") not in ("confirmed", "finalized"):
+            return None
+        return status
+
+    def record_landed(self, tx_id: str, confirmed_by: str):
+        """Credit a landing seen by {confirmed_by} (an endpoint, or e.g. a websocket subscription)"""
+        record = self.transactions.get(tx_id)
+        if record is None or record["confirmed_by"] is not None:
+            return
+        record["confirmed_by"] = confirmed_by
+        record["landed_after"] = time.monotonic() - record["sent_at"]
+        if confirmed_by in self.stats:
+            self.stats[confirmed_by].first_confirms += 1
+        for endpoint in record["acked_by"]:
+            self.stats[endpoint].landed += 1
+
+    async def wait_landed(self, tx_id: str, timeout: float = LANDING_TIMEOUT, interval: float = LANDING_POLL_INTERVAL):
+        """
+        Poll every endpoint until one shows {tx_id} landed
+
+        Returns:
+            tuple: (endpoint, receipt or status dict). Raises asyncio.TimeoutError.
+        """
+        deadline = time.monotonic() + timeout
+
+        async def check(endpoint):
+            try:
+                return endpoint, await self._landed_view(endpoint, tx_id)
+            except (aiohttp.ClientError, asyncio.TimeoutError, RuntimeError, ValueError, KeyError):
+                return endpoint, None
+
+        while True:
+            # First endpoint to answer with a landed view wins the round
+            checks = [asyncio.create_task(check(endpoint)) for endpoint in self.endpoints]
+            try:
+                for next_view in asyncio.as_completed(checks):
+                    endpoint, view = await next_view
+                    if view:
+                        self.record_landed(tx_id, endpoint)
+                        return endpoint, view
+            finally:
+                for task in checks:
+                    task.cancel()
+
+            if time.monotonic() >= deadline:
+                raise asyncio.TimeoutError(f"{tx_id} not seen landed by any endpoint after {timeout}s")
+            await asyncio.sleep(interval)
+
+    def watch_landing(self, tx_id: str, timeout: float = LANDING_TIMEOUT) -> asyncio.Task:
+        """
+        Run wait_landed for {tx_id} in the background, alongside whatever tracker the caller waits on.
+        The caller is never slowed down; the first broadcast endpoint to show the transaction landed
+        gets the first_confirms credit. Cancel the returned task once the transaction can no longer land.
+        """
+        self._record(tx_id)
+
+        async def watch():
+            try:
+                await self.wait_landed(tx_id, timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"Broadcast {self.chain}: no endpoint showed {tx_id} landed within {timeout}s")
+
+        task = asyncio.create_task(watch())
+        self._watchers.add(task)
+        task.add_done_callback(self._watchers.discard)
+        return task
+
+    async def stop(self):
+        for task in list(self._watchers):
+            task.cancel()
+        for task in list(self._watchers):
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def report(self):
+        """Per-endpoint stats as dicts, for logging"""
+        return {endpoint: stats.as_dict() for endpoint, stats in self.stats.items()}
+
+    def log_report(self):
+        for endpoint, stats in self.report().items():
+            logger.info(f"Broadcast {self.chain} {endpoint}: {stats}")
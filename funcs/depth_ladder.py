@@ -0,0 +1,150 @@
+# Base Imports
+import time
+import asyncio
+from bisect import bisect_left, insort
+
+# External Imports
+import numpy as np
+from config import token_configs
+from funcs.base_odos import quote_odos
+from funcs.sol_jupiter import quote_jupiter
+from logging_utility import logger
+
+LADDER_CONCURRENCY = 4 # Max quotes in flight per venue while building a ladder
+LADDER_BUY_HEADROOM = 1.1 # Buy-side quotes spend this much extra so the ladder still reaches the top LUNA size
+
+class DepthLadder:
+    """
+    Measured depth for one venue and direction, as sorted (luna, counter) points.
+
+    A "sell" ladder maps LUNA sold to counter-token received, a "buy" ladder
+    maps LUNA received to counter-token spent. Lookups interpolate linearly
+    between the two nearest points in O(log n) and treat (0, 0) as the first
+    point. Sizes beyond the deepest quote cannot be filled.
+    """
+
+    def __init__(self, venue: str, side: str):
+        self.venue = venue
+        self.side = side
+        self.luna_amounts = []
+        self.counter_amounts = []
+        self.quotes = {} # luna amount -> raw quote the point came from
+        self.updated_at = 0.0
+
+    def __len__(self):
+        return len(self.luna_amounts)
+
+    def insert(self, luna_amount: float, counter_amount: float, quote=None):
+        """Add one measured point, keeping both lists sorted by LUNA amount"""
+        i = bisect_left(self.luna_amounts, luna_amount)
+        if i < len(self.luna_amounts) and self.luna_amounts[i] == luna_amount:
+            self.counter_amounts[i] = counter_amount
+        else:
+            insort(self.luna_amounts, luna_amount)
+            self.counter_amounts.insert(i, counter_amount)
+        if quote is not None:
+            self.quotes[luna_amount] = quote
+        self.updated_at = time.monotonic()
+
+    def max_size(self) -> float:
+        return self.luna_amounts[-1] if self.luna_amounts else 0.0
+
+    def amount_for(self, luna_amount: float) -> float:
+        """Counter-token amount for {luna_amount} LUNA by interpolation, O(log n)"""
+        if not self.luna_amounts or luna_amount > self.luna_amounts[-1]:
+            return np.inf if self.side == "buy" else np.nan
+
+        i = bisect_left(self.luna_amounts, luna_amount)
+        if self.luna_amounts[i] == luna_amount:
+            return self.counter_amounts[i]
+
+        x0, y0 = (self.luna_amounts[i - 1], self.counter_amounts[i - 1]) if i > 0 else (0.0, 0.0)
+        x1, y1 = self.luna_amounts[i], self.counter_amounts[i]
+        return y0 + (y1 - y0) * (luna_amount - x0) / (x1 - x0)
+
+    def leg(self, sizes, side):
+        """Leg model for funcs.sizing, backed by the measured points"""
+        if side != self.side:
+            raise ValueError(f"{self.venue} ladder measures {self.side} depth, not {side}")
+
+        if isinstance(sizes, (int, float)):
+            return self.amount_for(sizes)
+
+        sizes = np.asarray(sizes, dtype=float)
+        if not self.luna_amounts:
+            return np.full(sizes.shape, np.inf if side == "buy" else np.nan)
+
+        xs = np.concatenate(([0.0], self.luna_amounts))
+        ys = np.concatenate(([0.0], self.counter_amounts))
+        amounts = np.interp(sizes, xs, ys)
+        return np.where(sizes <= xs[-1], amounts, np.inf if side == "buy" else np.nan)
+
+async def _quote_point(semaphore, venue, side, in_token, out_token, amount, in_decimals, out_decimals):
+    """One ladder quote. Returns (luna_amount, counter_amount, quote)"""
+    async with semaphore:
+        if venue == "base":
+            quote = await quote_odos(in_token, out_token, amount, in_decimals)
+            amount_out = float(quote['outAmounts'][0]) / (10 ** out_decimals)
+        else:
+            quote = await quote_jupiter(in_token, out_token, amount, in_decimals)
+            amount_out = float(quote['outAmount']) / (10 ** out_decimals)
+
+    # Sell: spend {amount} LUNA for counter. Buy: spend {amount} counter for LUNA.
+    return (amount, amount_out, quote) if side == "sell" else (amount_out, amount, quote)
+
+async def build_depth_ladders(trade_action, luna_sizes, base_price_luna_virtual, sol_price_luna_solana,
+                              concurrency: int = LADDER_CONCURRENCY):
+    """
+    Quote both venues at every size concurrently and build their depth ladders
+
+    Args:
+        trade_action: 'buy_base_sell_sol' builds a Base buy + Solana sell ladder, otherwise the reverse
+        luna_sizes: LUNA sizes to measure
+        base_price_luna_virtual: VIRTUAL per LUNA, used to size Base buy quotes
+        sol_price_luna_solana: SOL per LUNA, used to size Solana buy quotes
+        concurrency: Max quotes in flight per venue
+
+    Returns:
+        tuple: (base_ladder, sol_ladder)
+    """
+    base = token_configs["base"]["tokens"]
+    sol = token_configs["solana"]["tokens"]
+
+    if trade_action == 'buy_base_sell_sol':
+        base_side, sol_side = "buy", "sell"
+    else:
+        base_side, sol_side = "sell", "buy"
+
+    base_ladder = DepthLadder("base", base_side)
+    sol_ladder = DepthLadder("solana", sol_side)
+    base_semaphore = asyncio.Semaphore(concurrency)
+    sol_semaphore = asyncio.Semaphore(concurrency)
+
+    tasks = []
+    for size in luna_sizes:
+        if base_side == "buy":
+            tasks.append(_quote_point(base_semaphore, "base", "buy", base["virtual"]["address"], base["luna"]["address"],
+                size * base_price_luna_virtual * LADDER_BUY_HEADROOM, base["virtual"]["decimals"], base["luna"]["decimals"]))
+        else:
+            tasks.append(_quote_point(base_semaphore, "base", "sell", base["luna"]["address"], base["virtual"]["address"],
+                size, base["luna"]["decimals"], base["virtual"]["decimals"]))
+
+        if sol_side == "buy":
+            tasks.append(_quote_point(sol_semaphore, "solana", "buy", sol["sol"]["address"], sol["luna"]["address"],
+                size * sol_price_luna_solana * LADDER_BUY_HEADROOM, sol["sol"]["decimals"], sol["luna"]["decimals"]))
+        else:
+            tasks.append(_quote_point(sol_semaphore, "solana", "sell", sol["luna"]["address"], sol["sol"]["address"],
+                size, sol["luna"]["decimals"], sol["sol"]["decimals"]))
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    # Tasks alternate base, solana for every size
+    for i, result in enumerate(results):
+        ladder = base_ladder if i % 2 == 0 else sol_ladder
+        if isinstance(result, Exception):
+            logger.warning(f"Depth ladder: {ladder.venue} quote failed: {result}")
+            continue
+        luna_amount, counter_amount, quote = result
+        ladder.insert(luna_amount, counter_amount, quote)
+
+    return base_ladder, sol_ladder
@@ -0,0 +1,348 @@
+# Base Imports
+import time
+import asyncio
+import inspect
+import functools
+import itertools
+
+# External Imports
+import aiohttp
+from web3 import HTTPProvider, AsyncHTTPProvider
+from funcs.http_client import get_session
+from funcs.refresher import BackgroundRefresher
+from logging_utility import logger
+
+PROBE_INTERVAL = 5 # Seconds between latency probes of every endpoint
+PROBE_TIMEOUT = 3 # Seconds before a probe counts as failed
+LATENCY_ALPHA = 0.3 # EWMA weight of the newest latency sample
+ERROR_ALPHA = 0.2 # EWMA weight of the newest success / failure sample
+ERROR_PENALTY = 4 # Score multiplier per unit of error rate, so a 25% error rate doubles the score
+MAX_CONSECUTIVE_FAILURES = 3 # Failures in a row before an endpoint is skipped until it answers a probe again
+METRICS_LOG_INTERVAL = 60 # Seconds between endpoint score log lines
+
+PROBE_METHODS = {"base": "eth_blockNumber", "solana": "getSlot"}
+
+# Sends are never failed over: a timed-out send may still have reached the node,
+# and fanning a transaction out is the Broadcaster's job, not the read pool's
+SEND_METHODS = {"eth_sendRawTransaction", "send_raw_transaction", "send_transaction", "send_legacy_transaction"}
+
+@functools.cache
+def failover_errors(chain: str):
+    """
+    Transport failures that move a request on to the next endpoint. JSON-RPC
+    errors (reverts, bad params) are answers, not failures, and are returned
+    as-is. Only the chain's own client library is imported, so the Base path
+    never loads solana.
+    """
+    errors = [aiohttp.ClientError, asyncio.TimeoutError]
+    if chain == "base":
+        import requests # web3's sync HTTPProvider
+        errors += [requests.exceptions.ConnectionError, requests.exceptions.Timeout, requests.exceptions.HTTPError]
+    else:
+        import httpx
+        from solana.exceptions import SolanaRpcException
+        errors += [httpx.HTTPError, SolanaRpcException]
+    return tuple(errors)
+
+class EndpointScore:
+    """Running latency and error rate of one endpoint"""
+
+    def __init__(self):
+        self.latency_ms = None # EWMA of request latency
+        self.error_rate = 0.0 # EWMA of failures, 0 to 1
+        self.consecutive_failures = 0
+        self.requests = 0
+        self.failures = 0
+        self.last_seen = None # Monotonic time of the last successful answer
+
+    def record(self, latency_ms: float, ok: bool):
+        self.requests += 1
+        self.error_rate += ERROR_ALPHA * ((0.0 if ok else 1.0) - self.error_rate)
+        if not ok:
+            self.failures += 1
+            self.consecutive_failures += 1
+            return
+        self.consecutive_failures = 0
+        self.last_seen = time.monotonic()
+        if self.latency_ms is None:
+            self.latency_ms = latency_ms
+        else:
+            self.latency_ms += LATENCY_ALPHA * (latency_ms - self.latency_ms)
+
+    @property
+    def healthy(self) -> bool:
+        return self.consecutive_failures < MAX_CONSECUTIVE_FAILURES
+
+    def score(self) -> float:
+        """Lower is better; endpoints never measured sort after measured healthy ones"""
+        latency = self.latency_ms if self.latency_ms is not None else PROBE_TIMEOUT * 1000
+        return latency * (1 + ERROR_PENALTY * self.error_rate)
+
+    def as_dict(self):
+        return {
+            "latency_ms": round(self.latency_ms, 1) if self.latency_ms is not None else None,
+            "error_rate": round(self.error_rate, 3),
+            "healthy": self.healthy,
+            "score": round(self.score(), 1),
+            "requests": self.requests,
+            "failures": self.failures,
+        }
+
+class EndpointPool(BackgroundRefresher):
+    """
+    Latency-scored RPC endpoints for one chain.
+
+    Every endpoint gets a cheap probe (eth_blockNumber / getSlot) every
+    `interval` seconds, and every real request routed through the pool
+    is timed too. Both feed an EWMA latency and error rate per endpoint.
+    `ranked()` orders healthy endpoints by score, fastest first, with
+    unhealthy ones at the end as a last resort; callers try them in that
+    order so a dead endpoint fails over to the next one transparently.
+
+    Args:
+        chain: "base" or "solana"
+        urls: JSON-RPC HTTP urls
+    """
+
+    name = "Endpoint probe"
+
+    def __init__(self, chain: str, urls, probe_interval: float = PROBE_INTERVAL):
+        if chain not in PROBE_METHODS:
+            raise ValueError(f"Unsupported chain {chain}")
+        super().__init__(probe_interval)
+        self.chain = chain
+        self.urls = list(dict.fromkeys(url for url in urls if url))
+        if not self.urls:
+            raise ValueError(f"No {chain} RPC endpoints configured")
+        self.failover_errors = failover_errors(chain)
+        self.scores = {url: EndpointScore() for url in self.urls}
+        self._ids = itertools.count(1)
+        self._logged_at = time.monotonic()
+
+    # Routing
+    def ranked(self):
+        """Every url, healthy ones fastest first, then unhealthy ones"""
+        return sorted(self.urls, key=lambda url: (not self.scores[url].healthy, self.scores[url].score()))
+
+    def best(self) -> str:
+        return self.ranked()[0]
+
+    def routes(self, method: str = None):
+        """Urls to try for {method}: every url in rank order, or only the best one for a send"""
+        return self.ranked()[:1] if method in SEND_METHODS else self.ranked()
+
+    def call(self, fn, urls=None, errors=None):
+        """
+        Run fn(url) on each of {urls} (ranked() by default) until one answers, timing every attempt into its score
+
+        Args:
+            errors: Exceptions that fail over to the next url, the chain's failover_errors by default
+
+        Returns:
+            tuple: (url, result). Raises the last error when every url failed.
+        """
+        errors = errors or self.failover_errors
+        error = None
+        for url in urls or self.ranked():
+            started = time.monotonic()
+            try:
+                result = fn(url)
+            except errors as e:
+                self.record(url, (time.monotonic() - started) * 1000, False)
+                error = e
+                continue
+            self.record(url, (time.monotonic() - started) * 1000, True)
+            return url, result
+        raise error
+
+    async def call_async(self, fn, urls=None, errors=None):
+        """Async call(): {fn}(url) returns an awaitable"""
+        errors = errors or self.failover_errors
+        error = None
+        for url in urls or self.ranked():
+            started = time.monotonic()
+            try:
+                result = await fn(url)
+            except errors as e:
+                self.record(url, (time.monotonic() - started) * 1000, False)
+                error = e
+                continue
+            self.record(url, (time.monotonic() - started) * 1000, True)
+            return url, result
+        raise error
+
+    async def ping_all(self, fn):
+        """
+        Await {fn}(url) once on every url, so failover never starts on a cold connection
+
+        Returns:
+            int: Endpoints that answered
+        """
+        async def ping(url):
+            try:
+                await self.call_async(fn, urls=[url])
+            except self.failover_errors:
+                return False
+            return True
+
+        return sum(await asyncio.gather(*[ping(url) for url in self.urls]))
+
+    def is_ready(self) -> bool:
+        """True once at least one endpoint has answered"""
+        return any(score.last_seen is not None and score.healthy for score in self.scores.values())
+
+    def record(self, url: str, latency_ms: float, ok: bool):
+        """Feed one request outcome into {url}'s score"""
+        score = self.scores.get(url)
+        if score is None:
+            return
+        was_healthy = score.healthy
+        score.record(latency_ms, ok)
+        if was_healthy and not score.healthy:
+            logger.warning(f"Endpoint pool {self.chain}: {url} unhealthy after {score.consecutive_failures} failures")
+        elif not was_healthy and score.healthy:
+            logger.info(f"Endpoint pool {self.chain}: {url} healthy again")
+
+    # Probing
+    async def probe(self, url: str):
+        """Time one cheap request against {url} and record it"""
+        payload = {"jsonrpc": "2.0", "id": next(self._ids), "method": PROBE_METHODS[self.chain], "params": []}
+        started = time.monotonic()
+        ok = False
+        try:
+            session = get_session()
+            async with session.post(url, json=payload, timeout=aiohttp.ClientTimeout(total=PROBE_TIMEOUT)) as response:
+                response.raise_for_status()
+                body = await response.json()
+            ok = "result" in body
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            logger.debug(f"Endpoint pool {self.chain}: probe of {url} failed: {e}")
+        self.record(url, (time.monotonic() - started) * 1000, ok)
+
+    async def probe_all(self):
+        await asyncio.gather(*[self.probe(url) for url in self.urls])
+
+    async def refresh(self):
+        """Probe every endpoint, logging the scores every METRICS_LOG_INTERVAL seconds"""
+        await self.probe_all()
+        self.updated_at = time.monotonic()
+        if self.updated_at - self._logged_at >= METRICS_LOG_INTERVAL:
+            self.log_metrics()
+            self._logged_at = self.updated_at
+
+    # Metrics
+    def metrics(self):
+        """Per-endpoint scores as dicts, ranked best first"""
+        return {url: self.scores[url].as_dict() for url in self.ranked()}
+
+    def log_metrics(self):
+        for url, score in self.metrics().items():
+            logger.info(f"Endpoint pool {self.chain} {url}: {score}")
+
+class PooledHTTPProvider(HTTPProvider):
+    """Web3 HTTP provider that sends each request to the pool's best endpoint, failing over in rank order"""
+
+    def __init__(self, pool: EndpointPool, **kwargs):
+        self.pool = pool
+        # No per-endpoint retries, the next endpoint is the retry
+        self.providers = {url: HTTPProvider(url, exception_retry_configuration=None, **kwargs) for url in pool.urls}
+        super().__init__(pool.urls[0], **kwargs)
+
+    def make_request(self, method, params):
+        return self.pool.call(lambda url: self.providers[url].make_request(method, params), self.pool.routes(method))[1]
+
+    def make_batch_request(self, batch_requests):
+        urls = self.pool.routes(next((method for method, _ in batch_requests if method in SEND_METHODS), None))
+        return self.pool.call(lambda url: self.providers[url].make_batch_request(batch_requests), urls)[1]
+
+class PooledAsyncHTTPProvider(AsyncHTTPProvider):
+    """
+    Async counterpart of PooledHTTPProvider.
+
+    Every endpoint's provider sends through the bot-wide aiohttp session, so
+    web3 calls share its keep-alive pool and close_session() closes them too.
+    """
+
+    def __init__(self, pool: EndpointPool, **kwargs):
+        self.pool = pool
+        # No per-endpoint retries, the next endpoint is the retry
+        self.providers = {url: AsyncHTTPProvider(url, exception_retry_configuration=None, **kwargs) for url in pool.urls}
+        self._session = None # Shared session the providers were last pointed at
+        super().__init__(pool.urls[0], **kwargs)
+
+    async def _use_shared_session(self):
+        session = get_session()
+        if session is not self._session:
+            for provider in self.providers.values():
+                await provider.cache_async_session(session)
+            self._session = session
+
+    async def make_request(self, method, params):
+        await self._use_shared_session()
+        return (await self.pool.call_async(lambda url: self.providers[url].make_request(method, params),
+                                           self.pool.routes(method)))[1]
+
+    async def make_batch_request(self, batch_requests):
+        await self._use_shared_session()
+        urls = self.pool.routes(next((method for method, _ in batch_requests if method in SEND_METHODS), None))
+        return (await self.pool.call_async(lambda url: self.providers[url].make_batch_request(batch_requests), urls))[1]
+
+    async def warm(self):
+        """
+        One eth_chainId on every endpoint's own connection, so failover never starts cold
+
+        Returns:
+            int: Endpoints that answered
+        """
+        await self._use_shared_session()
+        return await self.pool.ping_all(lambda url: self.providers[url].make_request("eth_chainId", []))
+
+class PooledSolanaClient:
+    """
+    Stands in for a solana Client / AsyncClient, with one client per pool endpoint.
+
+    Every RPC method call goes to the pool's best endpoint and moves on to
+    the next one on a transport failure, so callers keep using the usual
+    client methods (get_signature_statuses, send_raw_transaction, ...).
+
+    Args:
+        pool: EndpointPool for "solana"
+        client_class: solana.rpc.api.Client or solana.rpc.async_api.AsyncClient
+    """
+
+    def __init__(self, pool: EndpointPool, client_class, **kwargs):
+        self.pool = pool
+        self.clients = {url: client_class(url, **kwargs) for url in pool.urls}
+        self.is_async = inspect.iscoroutinefunction(client_class.get_slot)
+
+    def __getattr__(self, name):
+        attribute = getattr(next(iter(self.clients.values())), name)
+        if not callable(attribute) or name.startswith("_"):
+            return attribute
+        if self.is_async:
+            return self._async_call(name)
+        return self._sync_call(name)
+
+    def _sync_call(self, name):
+        def call(*args, **kwargs):
+            return self.pool.call(lambda url: getattr(self.clients[url], name)(*args, **kwargs), self.pool.routes(name))[1]
+        return call
+
+    def _async_call(self, name):
+        async def call(*args, **kwargs):
+            return (await self.pool.call_async(lambda url: getattr(self.clients[url], name)(*args, **kwargs),
+                                               self.pool.routes(name)))[1]
+        return call
+
+    async def warm(self):
+        """
+        One getSlot on every endpoint's own client, so failover never starts cold
+
+        Returns:
+            int: Endpoints that answered
+        """
+        return await self.pool.ping_all(lambda url: self.clients[url].get_slot())
+
+    async def close(self):
+        if self.is_async:
+            await asyncio.gather(*[client.close() for client in self.clients.values()])
@@ -0,0 +1,82 @@
+# Base Imports
+import time
+import statistics
+
+# External Imports
+from funcs import get_w3_async
+from funcs.refresher import BackgroundRefresher
+
+FEE_POLL_INTERVAL = 2 # Seconds between refreshes, one Base block
+FEE_HISTORY_BLOCKS = 10 # Recent blocks sampled for the priority fee
+PRIORITY_FEE_PERCENTILE = 60 # Percentile of each block's tips we aim for
+MIN_PRIORITY_FEE = 1_000_000 # Wei floor for the tip (0.001 gwei)
+BASE_FEE_MULTIPLIER = 2 # maxFeePerGas headroom over the next base fee, survives several full blocks
+
+class FeeOracle(BackgroundRefresher):
+    """
+    EIP-1559 fee recommendation for Base, refreshed in the background.
+
+    Each refresh is one eth_feeHistory call, which returns the next block's
+    baseFeePerGas and the requested tip percentile for recent blocks. The
+    recommendation is computed on refresh, so readers get it with a dict
+    lookup and transaction builders need no RPC call at send time.
+    """
+
+    name = "Fee refresh"
+
+    def __init__(self, client=None, interval: float = FEE_POLL_INTERVAL, blocks: int = FEE_HISTORY_BLOCKS,
+                 percentile: float = PRIORITY_FEE_PERCENTILE):
+        super().__init__(interval)
+        self._client = client
+        self.blocks = blocks
+        self.percentile = percentile
+        self.recommendation = None # dict: baseFeePerGas, maxPriorityFeePerGas, maxFeePerGas, next_block
+
+    @property
+    def client(self):
+        """Async Web3 for eth_feeHistory, w3_async unless one was given"""
+        return self._client or get_w3_async()
+
+    def is_ready(self) -> bool:
+        return self.recommendation is not None
+
+    def fees(self):
+        """Current type-2 fee fields, or None before the first refresh"""
+        if self.recommendation is None:
+            return None
+        return {
+            "maxFeePerGas": self.recommendation["maxFeePerGas"],
+            "maxPriorityFeePerGas": self.recommendation["maxPriorityFeePerGas"],
+        }
+
+    def apply(self, transaction):
+        """
+        Turn {transaction} into a type-2 transaction with the current fees, in place.
+        Left unchanged before the first refresh.
+        """
+        fees = self.fees()
+        if fees is None:
+            return transaction
+
+        transaction.pop("gasPrice", None)
+        transaction.update(fees)
+        transaction["type"] = 2
+        return transaction
+
+    async def refresh(self):
+        """One eth_feeHistory call, then recompute the recommendation"""
+        history = await self.client.eth.fee_history(self.blocks, "latest", [self.percentile])
+
+        # The last base fee is the one the next block will charge
+        base_fee = int(history["baseFeePerGas"][-1])
+        tips = [int(reward[0]) for reward in history.get("reward", []) if reward]
+        priority_fee = max(int(statistics.median(tips)) if tips else 0, MIN_PRIORITY_FEE)
+
+        self.recommendation = {
+            "baseFeePerGas": base_fee,
+            "maxPriorityFeePerGas": priority_fee,
+            "maxFeePerGas": base_fee * BASE_FEE_MULTIPLIER + priority_fee,
+            "next_block": int(history["oldestBlock"]) + len(history["baseFeePerGas"]) - 1,
+        }
+        self.updated_at = time.monotonic()
+        return self.recommendation
@@ -0,0 +1,53 @@
+# Base Imports
+import asyncio
+
+# External Imports
+import aiohttp
+
+# Pool Settings
+POOL_LIMIT = 100            # Max open connections across every upstream
+POOL_LIMIT_PER_HOST = 10    # Max keep-alive connections per upstream (Odos, Jupiter, ...)
+KEEPALIVE_TIMEOUT = 60      # Seconds an idle connection is kept open for reuse
+DNS_CACHE_TTL = 300         # Seconds a resolved hostname stays cached
+REQUEST_TIMEOUT = 10        # Total seconds allowed per request
+
+_session = None
+
+def get_session() -> aiohttp.ClientSession:
+    """
+    Return the bot-wide aiohttp session, creating it on first use.
+
+    Every call to the same host reuses a pooled keep-alive connection, so a quote
+    round only pays DNS, TCP connect and TLS handshake once per upstream.
+    Must be called from inside the running event loop.
+    """
+    global _session
+
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=POOL_LIMIT,
+            limit_per_host=POOL_LIMIT_PER_HOST,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            use_dns_cache=True,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            enable_cleanup_closed=True,
+        )
+        _session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+            headers={"Accept-Encoding": "gzip, deflate"},
+            auto_decompress=True,
+        )
+
+    return _session
+
+async def close_session():
+    """Close the shared session and its pooled connections on shutdown."""
+    global _session
+
+    if _session is not None and not _session.closed:
+        await _session.close()
+        # Let the connector finish closing SSL transports before the loop stops
+        await asyncio.sleep(0.25)
+
+    _session = None
@@ -0,0 +1,123 @@
+# External Imports
+from eth_abi import decode
+from eth_utils.abi import collapse_if_tuple
+from web3 import Web3
+from config import token_configs
+from contracts import get_abi
+from funcs import get_w3, get_w3_async
+
+# Multicall3 is deployed at the same address on Base and every major EVM chain
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# Batched Reads
+def prepare_call(contract, fn_name, *args, allow_failure=False):
+    """
+    Encode one contract read for a Multicall3 batch
+
+    Args:
+        contract: web3 contract instance (sync or async, only its ABI is used)
+        fn_name: Name of the view function
+        args: Function arguments
+        allow_failure: If True a revert yields None instead of failing the whole batch
+
+    Returns:
+        tuple: (target, allow_failure, call_data, output_types)
+    """
+    fn_abi = next(
+        entry for entry in contract.abi
+        if entry.get("type") == "function" and entry["name"] == fn_name and len(entry["inputs"]) == len(args)
+    )
+    output_types = [collapse_if_tuple(output) for output in fn_abi["outputs"]]
+    call_data = contract.encode_abi(fn_name, args=list(args))
+    return contract.address, allow_failure, call_data, output_types
+
+def _aggregate3_args(calls):
+    return [(target, allow_failure, call_data) for target, allow_failure, call_data, _ in calls]
+
+def _decode_results(calls, results):
+    decoded = []
+    for (_, _, _, output_types), (success, return_data) in zip(calls, results):
+        if not success:
+            decoded.append(None)
+            continue
+        values = decode(output_types, return_data)
+        decoded.append(values[0] if len(values) == 1 else values)
+    return decoded
+
+def multicall(calls, block_identifier="latest", client=None):
+    """
+    Run every prepared call in one aggregate3 eth_call and decode the results
+
+    Returns:
+        list: One decoded value per call (a tuple for multi-output functions, None for allowed failures)
+    """
+    client = client or get_w3()
+    multicall3 = client.eth.contract(address=MULTICALL3_ADDRESS, abi=get_abi("multicall3_abi"))
+    results = multicall3.functions.aggregate3(_aggregate3_args(calls)).call(block_identifier=block_identifier)
+    return _decode_results(calls, results)
+
+async def multicall_async(calls, block_identifier="latest", client=None):
+    """Async version of multicall on w3_async"""
+    client = client or get_w3_async()
+    multicall3 = client.eth.contract(address=MULTICALL3_ADDRESS, abi=get_abi("multicall3_abi"))
+    results = await multicall3.functions.aggregate3(_aggregate3_args(calls)).call(block_identifier=block_identifier)
+    return _decode_results(calls, results)
+
+# Base State Refresh
+def base_state_calls(owner_address, spender_address=None, client=None):
+    """
+    Every read needed for a full Base state refresh: block number, LUNA/VIRTUAL
+    pair tokens and reserves, and allowance + balance for each configured token
+    """
+    base = token_configs["base"]
+    client = client or get_w3()
+    spender_address = spender_address or base["odos_routerV2"]
+
+    multicall3 = client.eth.contract(address=MULTICALL3_ADDRESS, abi=get_abi("multicall3_abi"))
+    pair = client.eth.contract(address=Web3.to_checksum_address(base["luna_virtual_v2_pair"]), abi=get_abi("v2_lp_abi"))
+
+    calls = [
+        prepare_call(multicall3, "getBlockNumber"),
+        prepare_call(pair, "token0"),
+        prepare_call(pair, "token1"),
+        prepare_call(pair, "getReserves"),
+    ]
+    for token in base["tokens"].values():
+        token_contract = client.eth.contract(address=Web3.to_checksum_address(token["address"]), abi=get_abi("erc20_abi"))
+        calls.append(prepare_call(token_contract, "allowance", owner_address, spender_address, allow_failure=True))
+        calls.append(prepare_call(token_contract, "balanceOf", owner_address, allow_failure=True))
+
+    return calls
+
+def parse_base_state(results):
+    """
+    Turn base_state_calls results into a dict
+
+    Returns:
+        dict: block_number, token0, token1, reserves, allowances {name: int}, balances {name: int}
+    """
+    block_number, token0, token1, (reserve0, reserve1, _) = results[:4]
+    state = {
+        "block_number": block_number,
+        "token0": Web3.to_checksum_address(token0),
+        "token1": Web3.to_checksum_address(token1),
+        "reserves": (reserve0, reserve1),
+        "allowances": {},
+        "balances": {},
+    }
+
+    token_results = results[4:]
+    for i, name in enumerate(token_configs["base"]["tokens"]):
+        state["allowances"][name] = token_results[2 * i]
+        state["balances"][name] = token_results[2 * i + 1]
+
+    return state
+
+def refresh_base_state(owner_address, spender_address=None):
+    """Full Base state (reserves, allowances, balances) in a single RPC round trip"""
+    return parse_base_state(multicall(base_state_calls(owner_address, spender_address)))
+
+async def refresh_base_state_async(owner_address, spender_address=None):
+    """Async version of refresh_base_state"""
+    calls = base_state_calls(owner_address, spender_address, client=get_w3_async())
+    return parse_base_state(await multicall_async(calls))
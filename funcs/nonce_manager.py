@@ -0,0 +1,84 @@
+# Base Imports
+import asyncio
+
+# External Imports
+from web3 import Web3
+from funcs import get_w3_async
+from logging_utility import logger
+
+# Send errors that mean our local nonce no longer matches the chain
+NONCE_ERRORS = ("nonce too low", "nonce too high", "already known", "replacement transaction underpriced")
+
+class NonceManager:
+    """
+    Hands out Base nonces for one account without an RPC call per transaction.
+
+    The next nonce is read once from the pending pool, then incremented
+    locally behind a lock, so several transactions can be signed and sent
+    back to back. Sent transactions are tracked until mined. A nonce error
+    on send, or a transaction that never gets a receipt (dropped or
+    replaced), triggers a resync from chain.
+    """
+
+    def __init__(self, address: str, client=None):
+        self.address = Web3.to_checksum_address(address)
+        self._client = client
+        self.next_nonce = None
+        self.pending = {} # nonce -> tx hash sent with it, until mined
+        self._lock = asyncio.Lock()
+
+    @property
+    def client(self):
+        """The client passed in, or the shared w3_async built on first use"""
+        return self._client or get_w3_async()
+
+    async def sync(self):
+        """Read the account's pending nonce from chain, e.g. after a transaction was dropped or replaced"""
+        async with self._lock:
+            await self._sync()
+
+    async def _sync(self):
+        latest, pending = await asyncio.gather(
+            self.client.eth.get_transaction_count(self.address, 'latest'),
+            self.client.eth.get_transaction_count(self.address, 'pending')
+        )
+        # Below the mined count is final, at or above the node's pending count was dropped or never arrived
+        self.pending = {nonce: tx_hash for nonce, tx_hash in self.pending.items() if latest <= nonce < pending}
+        self.next_nonce = pending
+        logger.info(f"Nonce manager: synced {self.address} at nonce {self.next_nonce} "
+        f"({len(self.pending)} pending)")
+
+    async def reserve(self) -> int:
+        """Next nonce, syncing from chain only the first time"""
+        async with self._lock:
+            if self.next_nonce is None:
+                await self._sync()
+            nonce = self.next_nonce
+            self.next_nonce += 1
+            return nonce
+
+    def track(self, nonce: int, tx_hash):
+        """Record a transaction that was accepted by the node"""
+        self.pending[nonce] = tx_hash.hex() if hasattr(tx_hash, "hex") else str(tx_hash)
+
+    def confirm(self, nonce: int):
+        """The transaction with {nonce} was mined (successful or reverted, the nonce is spent)"""
+        self.pending.pop(nonce, None)
+
+    async def release(self, nonce: int, error: Exception = None):
+        """
+        A transaction with {nonce} was never accepted or never mined.
+        Hands the nonce back if it was the last one out, otherwise resyncs so later nonces do not stall on the gap.
+        """
+        async with self._lock:
+            self.pending.pop(nonce, None)
+            message = str(error).lower() if error else ""
+
+            if any(reason in message for reason in NONCE_ERRORS):
+                logger.warning(f"Nonce manager: nonce {nonce} rejected ({error}), resyncing")
+                await self._sync()
+            elif self.next_nonce == nonce + 1:
+                self.next_nonce = nonce
+            else:
+                logger.warning(f"Nonce manager: gap at nonce {nonce}, resyncing")
+                await self._sync()
@@ -0,0 +1,70 @@
+# Base Imports
+import time
+
+# External Imports
+from config import token_configs
+from funcs.http_client import get_session
+from funcs.refresher import BackgroundRefresher
+
+JUPITER_PRICE_URL = "https://api.jup.ag/price/v2"
+PRICE_TTL = 5 # Seconds between background refreshes
+
+def price_ids():
+    """
+    Collect every Jupiter price id the bot needs in one list
+
+    Solana tokens are priced by mint address. A Base token can opt in with a
+    "price_id" entry holding its Solana mint; none does today, Odos quotes
+    already carry their USD values.
+    """
+    ids = [token["address"] for token in token_configs["solana"]["tokens"].values()]
+    ids += [token["price_id"] for token in token_configs["base"]["tokens"].values() if "price_id" in token]
+    return list(dict.fromkeys(ids))
+
+class PriceService(BackgroundRefresher):
+    """
+    USD prices from Jupiter price-v2, refreshed in the background.
+
+    All ids are fetched in a single batched request every `ttl` seconds.
+    Readers call `get_price`, a dict lookup that never touches the network.
+    Each id keeps the time it was last priced, so an id Jupiter stops
+    pricing goes stale through `age(id)` even while the others refresh.
+    """
+
+    name = "Price refresh"
+
+    def __init__(self, ids, ttl: float = PRICE_TTL):
+        super().__init__(ttl)
+        self.ids = list(dict.fromkeys(ids))
+        self.prices = {}
+        self.priced_at = {} # id -> monotonic time of its last price
+
+    def get_price(self, token_address):
+        """Latest USD price for `token_address`, or None if never fetched"""
+        return self.prices.get(token_address)
+
+    def age(self, token_address=None) -> float:
+        """Seconds since `token_address` was last priced, or since the last refresh when None"""
+        if token_address is None:
+            return super().age()
+        priced_at = self.priced_at.get(token_address)
+        return time.monotonic() - priced_at if priced_at else float("inf")
+
+    async def refresh(self):
+        """Fetch every id in one request and swap in the new prices"""
+        session = get_session()
+        async with session.get(JUPITER_PRICE_URL, params={"ids": ",".join(self.ids)}) as response:
+            response.raise_for_status()
+            data = await response.json()
+
+        prices = {}
+        for token_address, entry in data["data"].items():
+            # Jupiter returns null for ids it cannot price
+            if entry and entry.get("price") is not None:
+                prices[token_address] = float(entry["price"])
+
+        now = time.monotonic()
+        self.prices = {**self.prices, **prices}
+        self.priced_at.update(dict.fromkeys(prices, now))
+        self.updated_at = now
+        return self.prices
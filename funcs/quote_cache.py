@@ -0,0 +1,95 @@
+# Base Imports
+import time
+from typing import Optional
+
+QUOTE_CACHE_MAX_AGE = 10 # Seconds an entry is kept at all; lookups apply their own, tighter limit
+
+def quote_height(venue: str, quote) -> Optional[int]:
+    """Chain height a quote was priced at: Odos blockNumber on Base, Jupiter contextSlot on Solana"""
+    field = "blockNumber" if venue == "base" else "contextSlot"
+    try:
+        return int(quote[field])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+class QuoteCache:
+    """
+    Recent venue quotes, keyed by venue and input token, so execution can reuse
+    a detection quote instead of paying for another round trip.
+
+    A quote is only reusable for the direction it was taken in: a LUNA -> SOL
+    quote can fill a LUNA sell on Solana, never a SOL -> LUNA buy. Heights
+    (latest Base block / Solana slot) are observed from every quote that
+    passes through, so block and slot age need no extra RPC calls.
+    """
+
+    def __init__(self, max_age: float = QUOTE_CACHE_MAX_AGE):
+        self.max_age = max_age
+        self.entries = {} # (venue, in_token) -> list of (amount_in, quote, quoted_at, height)
+        self.heights = {} # venue -> highest block/slot seen
+
+    def observe(self, venue: str, quote):
+        """Track the newest chain height seen in any quote from {venue}"""
+        height = quote_height(venue, quote)
+        if height is not None and height > self.heights.get(venue, -1):
+            self.heights[venue] = height
+
+    def record(self, venue: str, in_token: str, amount_in: float, quote, quoted_at: float = None):
+        """
+        Store a quote that spent {amount_in} of {in_token}
+
+        Args:
+            venue: "base" or "solana"
+            in_token: Input token address / mint
+            amount_in: Human readable input amount the quote was requested with
+            quote: Raw Odos or Jupiter quote
+            quoted_at: time.monotonic() the quote was requested at (defaults to now)
+        """
+        quoted_at = quoted_at or time.monotonic()
+        self.observe(venue, quote)
+
+        key = (venue, in_token.lower())
+        cutoff = time.monotonic() - self.max_age
+        entries = [entry for entry in self.entries.get(key, []) if entry[2] >= cutoff]
+        entries.append((amount_in, quote, quoted_at, quote_height(venue, quote)))
+        self.entries[key] = entries
+
+    def lookup(self, venue: str, in_token: str, amount_in: float, tolerance: float, max_age_ms: float, max_heights: int):
+        """
+        Best reusable quote for spending {amount_in} of {in_token}
+
+        Args:
+            tolerance: Max relative size difference, e.g. 0.02 for 2%
+            max_age_ms: Max wall-clock age in milliseconds
+            max_heights: Max blocks (Base) or slots (Solana) behind the newest height seen
+
+        Returns:
+            tuple: (entry, reason) where entry is (amount_in, quote, quoted_at, height) or None
+        """
+        entries = self.entries.get((venue, in_token.lower()))
+        if not entries:
+            return None, "no quote in this direction"
+
+        now = time.monotonic()
+        latest = self.heights.get(venue)
+        best, reason = None, None
+
+        for entry in entries:
+            quoted_amount, _, quoted_at, height = entry
+            size_diff = abs(quoted_amount - amount_in) / amount_in
+            if size_diff > tolerance:
+                reason = reason or f"closest size off by more than {tolerance:.1%}"
+                continue
+            if (now - quoted_at) * 1000 > max_age_ms:
+                reason = f"older than {max_age_ms:.0f} ms"
+                continue
+            if latest is not None and height is not None and latest - height > max_heights:
+                reason = f"{latest - height} {'blocks' if venue == 'base' else 'slots'} behind"
+                continue
+            if best is None or size_diff < abs(best[0] - amount_in) / amount_in:
+                best = entry
+
+        return (best, None) if best else (None, reason)
+
+    def clear(self):
+        self.entries.clear()
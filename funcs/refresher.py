@@ -0,0 +1,56 @@
+# Base Imports
+import time
+import asyncio
+
+# External Imports
+from logging_utility import logger
+
+class BackgroundRefresher:
+    """
+    Base for in-memory state that a background task keeps fresh.
+
+    Subclasses implement refresh() and set `updated_at` when it succeeds.
+    start() runs one refresh, then one every `interval` seconds; a failed
+    refresh is logged and the last good state kept, so only stop() ends the
+    task. Services whose task is not a timer override _run() and start().
+    """
+
+    name = "Refresh" # Prefix of the warning logged when a refresh fails
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.updated_at = 0.0
+        self._task = None
+
+    def age(self) -> float:
+        """Seconds since `updated_at`, inf before the first update"""
+        return time.monotonic() - self.updated_at if self.updated_at else float("inf")
+
+    async def refresh(self):
+        raise NotImplementedError
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning(f"{self.name} failed, keeping state from {self.age():.1f}s ago: {e!r}")
+
+    def _spawn(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def start(self):
+        """Refresh once, then keep refreshing in a background task"""
+        await self.refresh()
+        self._spawn()
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
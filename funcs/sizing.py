@@ -0,0 +1,220 @@
+# Base Imports
+import math
+
+# External Imports
+import numpy as np
+
+# Leg models map an array of LUNA sizes to the counter-token amount for one leg:
+#     leg(sizes, "buy")  -> counter-token spent to receive each LUNA size
+#     leg(sizes, "sell") -> counter-token received for selling each LUNA size
+# Sizes a model cannot fill return inf for "buy" and nan for "sell".
+# Model parameters may be scalars or 1-D arrays (one entry per opportunity);
+# arrays broadcast against the size grid to give one curve per opportunity.
+
+def _column(value):
+    if np.ndim(value) == 0:
+        return float(value)
+    array = np.asarray(value, dtype=float)
+    return array[:, None] if array.ndim == 1 else array
+
+def _is_scalar(value):
+    return isinstance(value, (int, float))
+
+def sqrt_impact_leg(price, impact_pct, ref_size):
+    """
+    Impact grows with the square root of size: impact(x) = impact_pct * sqrt(x / ref_size)
+
+    Args:
+        price: Counter-token per LUNA at the quoted size
+        impact_pct: Price impact in percent measured at {ref_size}
+        ref_size: LUNA size the impact was measured at
+    """
+    price = _column(price)
+    coeff = _column(impact_pct) / 100 / math.sqrt(ref_size)
+    scalar_params = _is_scalar(price) and _is_scalar(coeff)
+
+    def leg(sizes, side):
+        # Plain float path for scalar solvers, avoids NumPy call overhead
+        if scalar_params and _is_scalar(sizes):
+            slip = coeff * math.sqrt(sizes)
+            if slip >= 1:
+                return math.inf if side == "buy" else math.nan
+            return sizes * price / (1 - slip) if side == "buy" else sizes * price * (1 - slip)
+
+        sizes = np.asarray(sizes, dtype=float)
+        slip = coeff * np.sqrt(sizes)
+        if side == "buy":
+            with np.errstate(divide="ignore"):
+                return np.where(slip < 1, sizes * price / (1 - slip), np.inf)
+        return np.where(slip < 1, sizes * price * (1 - slip), np.nan)
+
+    return leg
+
+def v2_pool_leg(reserve_counter, reserve_luna, counter_decimals=18, luna_decimals=18):
+    """
+    Constant-product pool with the 0.3% V2 fee, in float math for sweeping.
+    Use funcs.base_v2_quoter for the exact integer amount of the chosen size.
+
+    Args:
+        reserve_counter: Pool reserve of the counter token (raw units)
+        reserve_luna: Pool reserve of LUNA (raw units)
+    """
+    reserve_counter = _column(reserve_counter) / 10 ** counter_decimals
+    reserve_luna = _column(reserve_luna) / 10 ** luna_decimals
+    scalar_params = _is_scalar(reserve_counter) and _is_scalar(reserve_luna)
+
+    def leg(sizes, side):
+        if scalar_params and _is_scalar(sizes):
+            if side == "buy":
+                return reserve_counter * sizes * 1000 / ((reserve_luna - sizes) * 997) if sizes < reserve_luna else math.inf
+            return reserve_counter * sizes * 997 / (reserve_luna * 1000 + sizes * 997)
+
+        sizes = np.asarray(sizes, dtype=float)
+        if side == "buy":
+            with np.errstate(divide="ignore"):
+                amount = reserve_counter * sizes * 1000 / ((reserve_luna - sizes) * 997)
+            return np.where(sizes < reserve_luna, amount, np.inf)
+        return reserve_counter * sizes * 997 / (reserve_luna * 1000 + sizes * 997)
+
+    return leg
+
+def size_grid(minimum, maximum, step):
+    """Candidate LUNA sizes in [minimum, maximum)"""
+    return np.arange(minimum, maximum, step, dtype=float)
+
+def balanced_profit_curve(sizes, base_leg, sol_leg, virtual_usd, solana_usd, trade_action):
+    """
+    Evaluate every candidate size in one array operation
+
+    Args:
+        sizes: LUNA size grid
+        base_leg: Leg model for the Base side (counter token VIRTUAL)
+        sol_leg: Leg model for the Solana side (counter token SOL)
+        virtual_usd: USD per VIRTUAL (scalar or one per opportunity)
+        solana_usd: USD per SOL (scalar or one per opportunity)
+        trade_action: Either 'buy_base_sell_sol' or 'buy_sol_sell_base'
+
+    Returns:
+        tuple: (virtual_amounts, solana_amounts, profit_usd) arrays, -inf profit where a leg cannot fill
+    """
+    virtual_usd = _column(virtual_usd)
+    solana_usd = _column(solana_usd)
+    sizes = np.asarray(sizes, dtype=float)
+
+    if trade_action == 'buy_base_sell_sol':
+        # VIRTUAL -> LUNA on Base, LUNA -> SOL on Solana
+        virtual_amounts = base_leg(sizes, "buy")
+        solana_amounts = sol_leg(sizes, "sell")
+        profit = solana_amounts * solana_usd - virtual_amounts * virtual_usd
+    else:
+        # SOL -> LUNA on Solana, LUNA -> VIRTUAL on Base
+        solana_amounts = sol_leg(sizes, "buy")
+        virtual_amounts = base_leg(sizes, "sell")
+        profit = virtual_amounts * virtual_usd - solana_amounts * solana_usd
+
+    profit = np.where(np.isfinite(profit), profit, -np.inf)
+    return virtual_amounts, solana_amounts, profit
+
+def best_balanced_swap(sizes, base_leg, sol_leg, virtual_usd, solana_usd, trade_action):
+    """
+    Profit-maximizing size over the whole grid, for one or several opportunities
+
+    Returns:
+        dict (or list of dicts, one per opportunity): luna_amount, virtual_amount,
+        solana_amount, profit_usd, plus the full sizes and profit_curve arrays
+    """
+    sizes = np.asarray(sizes, dtype=float)
+    virtual_amounts, solana_amounts, profit = balanced_profit_curve(
+        sizes, base_leg, sol_leg, virtual_usd, solana_usd, trade_action
+    )
+    virtual_amounts = np.broadcast_to(virtual_amounts, profit.shape)
+    solana_amounts = np.broadcast_to(solana_amounts, profit.shape)
+
+    def pick(row):
+        i = int(np.argmax(profit[row]))
+        return {
+            "luna_amount": float(sizes[i]),
+            "virtual_amount": float(virtual_amounts[row][i]),
+            "solana_amount": float(solana_amounts[row][i]),
+            "profit_usd": float(profit[row][i]),
+            "sizes": sizes,
+            "profit_curve": profit[row],
+        }
+
+    if profit.ndim == 1:
+        return pick(Ellipsis)
+    return [pick(row) for row in range(profit.shape[0])]
+
+# Scalar Solver
+GOLDEN_RATIO = (math.sqrt(5) - 1) / 2
+
+def balanced_profit(x, base_leg, sol_leg, virtual_usd, solana_usd, trade_action):
+    """USD profit of trading {x} LUNA on both legs, -inf if a leg cannot fill"""
+    if trade_action == 'buy_base_sell_sol':
+        profit = sol_leg(x, "sell") * solana_usd - base_leg(x, "buy") * virtual_usd
+    else:
+        profit = base_leg(x, "sell") * virtual_usd - sol_leg(x, "buy") * solana_usd
+    return profit if math.isfinite(profit) else -math.inf
+
+def golden_section_max(f, lo, hi, tol=1.0, max_iter=200):
+    """
+    Maximize a unimodal function on [lo, hi] to within {tol}
+
+    Returns:
+        tuple: (x, f(x), evaluations)
+    """
+    a, b = float(lo), float(hi)
+    c = b - GOLDEN_RATIO * (b - a)
+    d = a + GOLDEN_RATIO * (b - a)
+    fc, fd = f(c), f(d)
+    evaluations = 2
+
+    for _ in range(max_iter):
+        if b - a <= tol:
+            break
+        if fc >= fd:
+            b, d, fd = d, c, fc
+            c = b - GOLDEN_RATIO * (b - a)
+            fc = f(c)
+        else:
+            a, c, fc = c, d, fd
+            d = a + GOLDEN_RATIO * (b - a)
+            fd = f(d)
+        evaluations += 1
+
+    x, fx = (c, fc) if fc >= fd else (d, fd)
+
+    # Guard boundary optima (e.g. profit still rising at MAX_TOKEN)
+    for edge in (float(lo), float(hi)):
+        f_edge = f(edge)
+        evaluations += 1
+        if f_edge > fx:
+            x, fx = edge, f_edge
+
+    return x, fx, evaluations
+
+def solve_balanced_swap(lo, hi, base_leg, sol_leg, virtual_usd, solana_usd, trade_action, tol=1.0):
+    """
+    Profit-maximizing LUNA size in [lo, hi] by golden-section search.
+    Works with any leg models whose profit curve is unimodal in size.
+
+    Returns:
+        dict: luna_amount, virtual_amount, solana_amount, profit_usd, evaluations
+    """
+    def profit(x):
+        return balanced_profit(x, base_leg, sol_leg, virtual_usd, solana_usd, trade_action)
+
+    x, profit_usd, evaluations = golden_section_max(profit, lo, hi, tol)
+
+    if trade_action == 'buy_base_sell_sol':
+        virtual_amount, solana_amount = base_leg(x, "buy"), sol_leg(x, "sell")
+    else:
+        virtual_amount, solana_amount = base_leg(x, "sell"), sol_leg(x, "buy")
+
+    return {
+        "luna_amount": x,
+        "virtual_amount": float(virtual_amount),
+        "solana_amount": float(solana_amount),
+        "profit_usd": profit_usd,
+        "evaluations": evaluations,
+    }
@@ -0,0 +1,232 @@
+# Base Imports
+import json
+import time
+import asyncio
+import itertools
+
+# External Imports
+import websockets
+from solders.signature import Signature
+from funcs import RECONNECT_DELAY, get_sol_client_async, rpc_settings
+from logging_utility import logger
+
+COMMITMENT_LEVELS = ("processed", "confirmed", "finalized")
+POLL_INTERVAL = 1 # Seconds between batched getSignatureStatuses sweeps
+STATUS_BATCH_SIZE = 256 # getSignatureStatuses accepts at most 256 signatures per call
+MAX_SUBSCRIPTIONS = 100 # Beyond this many outstanding signatures, extras are polled instead of subscribed
+SUBSCRIBED_RECHECK = 5 # Seconds before a subscribed signature is also swept, in case its notification was missed
+
+def commitment_reached(status: str, target: str) -> bool:
+    """True if confirmation status {status} is at or past commitment {target}"""
+    status = status.split(".")[-1].lower()
+    return status in COMMITMENT_LEVELS and COMMITMENT_LEVELS.index(status) >= COMMITMENT_LEVELS.index(target)
+
+class ConfirmationTracker:
+    """
+    Resolves a future per Solana signature as soon as it reaches its commitment.
+
+    Signatures are watched with signatureSubscribe on one shared websocket,
+    which pushes a notification the moment the node sees the commitment.
+    Signatures that are not subscribed, because the socket is down or too
+    many are outstanding, are checked by a background sweep that sends one
+    batched getSignatureStatuses call for all of them.
+
+    Results are dicts: signature, err, slot, commitment, seconds (time from track() to resolve).
+    """
+
+    def __init__(self, ws_url: str = None, client=None, commitment: str = "confirmed",
+                 poll_interval: float = POLL_INTERVAL, max_subscriptions: int = MAX_SUBSCRIPTIONS):
+        self._ws_url = ws_url
+        self._client = client
+        self.commitment = commitment
+        self.poll_interval = poll_interval
+        self.max_subscriptions = max_subscriptions
+        self.watched = {} # signature -> (future, commitment, tracked_at)
+        self.subscriptions = {} # subscription id -> signature
+        self._subscribed = set() # signatures with a live subscription on the current socket
+        self._requests = {} # request id -> signature, awaiting a subscription id
+        self._ids = itertools.count(1)
+        self._websocket = None
+        self._tasks = []
+        self._sends = set() # signatureSubscribe sends from track(), kept referenced until they finish
+
+    @property
+    def ws_url(self):
+        """The websocket url passed in, or SOL_WS_RPC; "" disables the websocket and only the sweep runs"""
+        return self._ws_url if self._ws_url is not None else rpc_settings()["sol_ws_rpc"]
+
+    @property
+    def client(self):
+        """The client passed in, or the shared sol_client_async built on first use"""
+        return self._client or get_sol_client_async()
+
+    # Public API
+    def track(self, signature: str, commitment: str = None) -> asyncio.Future:
+        """Start watching {signature}; the returned future resolves once it reaches {commitment}"""
+        signature = str(signature)
+        if signature in self.watched:
+            return self.watched[signature][0]
+
+        future = asyncio.get_running_loop().create_future()
+        self.watched[signature] = (future, commitment or self.commitment, time.monotonic())
+        if self._websocket is not None and len(self._subscribed) < self.max_subscriptions:
+            task = asyncio.create_task(self._subscribe(signature))
+            self._sends.add(task)
+            task.add_done_callback(self._sends.discard)
+        return future
+
+    async def wait(self, signature: str, timeout: float = 60, commitment: str = None):
+        """
+        Track {signature} and wait up to {timeout} seconds for its commitment
+
+        Returns:
+            dict: the resolved result. Raises asyncio.TimeoutError if it never lands.
+        """
+        future = self.track(signature, commitment)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            self.forget(signature)
+            raise
+
+    def forget(self, signature: str):
+        """Stop watching {signature} without resolving it"""
+        entry = self.watched.pop(str(signature), None)
+        if entry and not entry[0].done():
+            entry[0].cancel()
+        self._subscribed.discard(str(signature))
+
+    def outstanding(self) -> int:
+        return len(self.watched)
+
+    # Resolution
+    def _resolve(self, signature: str, err, slot, commitment: str):
+        entry = self.watched.pop(signature, None)
+        self._subscribed.discard(signature)
+        if entry is None:
+            return
+
+        future, _, tracked_at = entry
+        if not future.done():
+            future.set_result({
+                "signature": signature,
+                "err": err,
+                "slot": slot,
+                "commitment": commitment,
+                "seconds": time.monotonic() - tracked_at,
+            })
+
+    # Websocket path
+    async def _subscribe(self, signature: str):
+        entry = self.watched.get(signature)
+        websocket = self._websocket
+        if entry is None or websocket is None or signature in self._subscribed:
+            return
+
+        request_id = next(self._ids)
+        self._requests[request_id] = signature
+        self._subscribed.add(signature)
+        try:
+            await websocket.send(json.dumps({
+                "jsonrpc": "2.0", "id": request_id, "method": "signatureSubscribe",
+                "params": [signature, {"commitment": entry[1]}],
+            }))
+        except websockets.ConnectionClosed:
+            self._requests.pop(request_id, None)
+            self._subscribed.discard(signature)
+
+    def _on_message(self, message):
+        if "id" in message and message.get("id") in self._requests:
+            signature = self._requests.pop(message["id"])
+            if "result" in message:
+                self.subscriptions[message["result"]] = signature
+            else:
+                # Rejected subscription, the poll sweep picks it up
+                self._subscribed.discard(signature)
+            return
+
+        if message.get("method") != "signatureNotification":
+            return
+
+        params = message["params"]
+        signature = self.subscriptions.pop(params["subscription"], None)
+        if signature is None or signature not in self.watched:
+            return
+
+        result = params["result"]
+        # The node only notifies once the subscribed commitment is reached, then drops the subscription
+        self._resolve(signature, result["value"].get("err"), result["context"]["slot"], self.watched[signature][1])
+
+    async def _follow(self):
+        async with websockets.connect(self.ws_url) as websocket:
+            self._websocket = websocket
+            self.subscriptions.clear()
+            self._requests.clear()
+            self._subscribed.clear()
+            logger.info(f"Confirmations: websocket connected, subscribing {len(self.watched)} signature(s)")
+
+            for signature in list(self.watched)[:self.max_subscriptions]:
+                await self._subscribe(signature)
+
+            async for raw in websocket:
+                self._on_message(json.loads(raw))
+
+    async def _run_websocket(self):
+        while True:
+            try:
+                await self._follow()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Confirmations: websocket lost ({e}), polling until reconnected in {RECONNECT_DELAY}s")
+            finally:
+                self._websocket = None
+                self._subscribed.clear()
+            await asyncio.sleep(RECONNECT_DELAY)
+
+    # Polling fallback
+    async def poll(self):
+        """One batched getSignatureStatuses sweep over every signature without a live subscription"""
+        recheck_before = time.monotonic() - SUBSCRIBED_RECHECK
+        signatures = [
+            signature for signature, (_, _, tracked_at) in self.watched.items()
+            if signature not in self._subscribed or tracked_at < recheck_before
+        ]
+
+        for i in range(0, len(signatures), STATUS_BATCH_SIZE):
+            batch = signatures[i:i + STATUS_BATCH_SIZE]
+            response = await self.client.get_signature_statuses([Signature.from_string(s) for s in batch])
+
+            for signature, status in zip(batch, response.value):
+                if status is None or signature not in self.watched or status.confirmation_status is None:
+                    continue
+                reached = str(status.confirmation_status).split(".")[-1].lower()
+                if commitment_reached(reached, self.watched[signature][1]):
+                    self._resolve(signature, status.err, status.slot, reached)
+
+    async def _run_poll(self):
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            if not self.watched:
+                continue
+            try:
+                await self.poll()
+            except Exception as e:
+                logger.warning(f"Confirmations: status sweep failed: {e}")
+
+    async def start(self):
+        if not self._tasks:
+            if self.ws_url:
+                self._tasks.append(asyncio.create_task(self._run_websocket()))
+            self._tasks.append(asyncio.create_task(self._run_poll()))
+
+    async def stop(self):
+        tasks = self._tasks + list(self._sends)
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
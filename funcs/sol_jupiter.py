@@ -3,14 +3,17 @@ import time
 from decimal import Decimal
 
 # External
-import aiohttp
 import base58
 import asyncio 
 from solders.keypair import Keypair  
 from solders.transaction import VersionedTransaction
 from solana.rpc.types import TxOpts
-from funcs import sol_client, sol_client_async
+from funcs import get_sol_client, get_sol_client_async
+from funcs.http_client import get_session
+from funcs.sol_confirmations import commitment_reached
+from funcs.sol_rebroadcast import rebroadcast_until_landed
 
+JUPITER_API_URL = "https://quote-api.jup.ag/v6"
 slippage = 200 # Default is 50 = 0.05%, current is 2%
 
 # Utils
@@ -33,7 +36,7 @@ def wait_for_confirmation(signature, max_retries: int = 60, retry_delay: int = 2
     
     for attempt in range(max_retries):
         try:
-            response = sol_client.get_signature_statuses([signature])
+            response = get_sol_client().get_signature_statuses([signature])
             if response.value[0] is not None:
                 confirmation_status = str(response.value[0].confirmation_status)
                 
@@ -63,13 +66,13 @@ async def quote_jupiter(in_token, out_token, amount, in_decimals):
     """Get a quote from Jupiter for token swap."""
     decimal_amount = convert_to_decimal_amount(amount, in_decimals)
     
-    url = f"https://quote-api.jup.ag/v6/quote?inputMint={in_token}&outputMint={out_token}&amount={decimal_amount}&slippageBps={slippage}"
+    url = f"{JUPITER_API_URL}/quote?inputMint={in_token}&outputMint={out_token}&amount={decimal_amount}&slippageBps={slippage}"
     headers = {'Accept': 'application/json'}
 
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url, headers=headers) as response:
-            response.raise_for_status()
-            return await response.json()
+    session = get_session()
+    async with session.get(url, headers=headers) as response:
+        response.raise_for_status()
+        return await response.json()
 
 async def swap_jupiter(user_public_key, quote_response):
     """Create a swap transaction using Jupiter API asynchronously."""
@@ -84,20 +87,26 @@ async def swap_jupiter(user_public_key, quote_response):
         "prioritizationFeeLamports": 500_000
     }
     
-    url = "https://quote-api.jup.ag/v6/swap"
+    url = f"{JUPITER_API_URL}/swap"
     headers = {"Content-Type": "application/json"}
     
-    async with aiohttp.ClientSession() as session:
-        async with session.post(url, headers=headers, json=swap_data) as response:
-            if response.status != 200:
-                error_text = await response.text()
-                print(f"Error response: {error_text}")
-            response.raise_for_status()
-            
-            return await response.json()
+    session = get_session()
+    async with session.post(url, headers=headers, json=swap_data) as response:
+        if response.status != 200:
+            error_text = await response.text()
+            print(f"Error response: {error_text}")
+        response.raise_for_status()
+        
+        return await response.json()
 
-async def execute_jupiter(swap_data, sol_private_key):
-    """Execute a swap transaction asynchronously."""
+async def execute_jupiter(swap_data, sol_private_key, tracker=None, timeout=120, commitment="finalized", broadcaster=None):
+    """
+    Execute a swap transaction asynchronously, returning once it reaches {commitment}.
+    With a ConfirmationTracker the signed bytes are re-sent every REBROADCAST_INTERVAL until the
+    signature lands (watched over its websocket subscription), and TransactionExpired is raised
+    as soon as the swap's lastValidBlockHeight passes, fanned out through {broadcaster} if given.
+    Otherwise it is sent once and polled.
+    """
     
     private_key_bytes = base58.b58decode(sol_private_key)
     keypair = Keypair.from_bytes(private_key_bytes)
@@ -108,10 +117,24 @@ async def execute_jupiter(swap_data, sol_private_key):
         tx = VersionedTransaction.from_bytes(swap_tx)
         signed_tx = VersionedTransaction(tx.message, [keypair])
         signed_tx_bytes = bytes(signed_tx)
+
+        if tracker is not None:
+            # Re-send the same bytes until it lands or its blockhash expires
+            # rebroadcast_until_landed logs the first send a node accepts
+            tx_sig = str(signed_tx.signatures[0])
+            result = await rebroadcast_until_landed(
+                signed_tx_bytes, tx_sig, swap_data.get('lastValidBlockHeight'),
+                tracker=tracker, commitment=commitment, timeout=timeout, broadcaster=broadcaster
+            )
+            if result["err"]:
+                print(f"Transaction {commitment} with error: {result['err']}")
+            else:
+                print(f"Transaction {commitment} in {result['seconds']:.1f}s after {result['sends']} send(s) (slot {result['slot']})")
+            return tx_sig
         
         # Send transaction using async API
         tx_opts = TxOpts(skip_preflight=True, max_retries=5)
-        tx_response = await sol_client_async.send_raw_transaction(signed_tx_bytes, opts=tx_opts)
+        tx_response = await get_sol_client_async().send_raw_transaction(signed_tx_bytes, opts=tx_opts)
         
         if tx_response.value:
             tx_sig = tx_response.value
@@ -125,18 +148,18 @@ async def execute_jupiter(swap_data, sol_private_key):
                 
                 while retries < max_retries:
                     try:
-                        response = sol_client.get_signature_statuses([tx_sig])
+                        response = await get_sol_client_async().get_signature_statuses([tx_sig])
                         
                         if response and response.value[0]:
                             status = response.value[0]
                             confirmation_str = str(status.confirmation_status)
                             result = confirmation_str.split(".")[-1]
 
-                            # Check if transaction is finalized, regardless of success/error
-                            if result == "Finalized":
+                            # Check if transaction reached the commitment, regardless of success/error
+                            if commitment_reached(result, commitment):
                                 # If there's an error, include it in the return
                                 if status.err:
-                                    print(f"Transaction finalized with error: {status.err}")
+                                    print(f"Transaction {commitment} with error: {status.err}")
                                 return True, status.err
                             print(f"Current status: {result} (Confirmations: {status.confirmations})")
                     except Exception as e:
@@ -146,15 +169,15 @@ async def execute_jupiter(swap_data, sol_private_key):
                     await asyncio.sleep(retry_delay)
                 return False, None
             
-            is_finalized, error = await check_confirmation()
-            if is_finalized:
+            is_confirmed, error = await check_confirmation()
+            if is_confirmed:
                 if error:
-                    print(f"Transaction finalized with error: {error}")
+                    print(f"Transaction {commitment} with error: {error}")
                 else:
-                    print("Transaction successfully finalized!")
+                    print(f"Transaction successfully {commitment}!")
                 return tx_sig
             else:
-                raise Exception("Transaction confirmation timeout or failed to finalize")
+                raise Exception(f"Transaction confirmation timeout or failed to reach {commitment}")
         else:
             raise Exception("No transaction ID returned")
             
@@ -0,0 +1,133 @@
+# Base Imports
+import time
+import asyncio
+
+# External Imports
+from solana.rpc.types import TxOpts
+from solders.signature import Signature
+from funcs import get_sol_client_async
+from funcs.sol_confirmations import commitment_reached
+from logging_utility import logger
+
+REBROADCAST_INTERVAL = 1.0 # Seconds between re-sends of the same signed transaction
+REBROADCAST_TIMEOUT = 90 # Hard stop when the swap response carries no lastValidBlockHeight
+
+class TransactionExpired(Exception):
+    """The blockhash passed lastValidBlockHeight before the transaction landed; it can never land now"""
+
+async def rebroadcast_until_landed(signed_tx_bytes: bytes, signature: str, last_valid_block_height: int = None,
+                                   tracker=None, commitment: str = "confirmed", client=None,
+                                   interval: float = REBROADCAST_INTERVAL, timeout: float = REBROADCAST_TIMEOUT,
+                                   broadcaster=None):
+    """
+    Send the same signed bytes every {interval} seconds until the signature reaches {commitment}
+
+    Every round re-sends the transaction and reads the block height in
+    parallel. Once the height passes {last_valid_block_height} the blockhash
+    is expired and the transaction can never land, so the loop stops and
+    raises TransactionExpired right away (after one final status check).
+    A failed height read or status poll (429, connection reset) only costs
+    that round: the last known height is kept and the loop carries on until
+    expiry or {timeout}.
+
+    Args:
+        signed_tx_bytes: Fully signed transaction
+        signature: Its first signature, as a string
+        last_valid_block_height: From the Jupiter swap response
+        tracker: ConfirmationTracker; without one, the status is polled every round
+        broadcaster: Broadcaster; every re-send then goes to all of its endpoints
+
+    Returns:
+        dict: signature, err, slot, commitment, sends, seconds
+    """
+    client = client or get_sol_client_async()
+    opts = TxOpts(skip_preflight=True, max_retries=0) # We retry ourselves, the node should not
+    started = time.monotonic()
+    sends = 0
+    height = None # Last block height read successfully
+
+    landed = tracker.track(signature, commitment) if tracker is not None else None
+    # Credit the broadcast endpoint that sees it land first, off the confirmation path
+    landing_watch = broadcaster.watch_landing(signature, timeout) if broadcaster is not None else None
+
+    async def send_once():
+        nonlocal sends
+        try:
+            if broadcaster is not None:
+                await broadcaster.broadcast(signed_tx_bytes, tx_id=signature)
+            else:
+                await client.send_raw_transaction(signed_tx_bytes, opts=opts)
+            sends += 1
+            if sends == 1:
+                logger.info(f"Solana -> Transaction sent: {signature}")
+        except Exception as e:
+            # Usually "already processed" once it landed; the confirmation decides
+            logger.debug(f"Rebroadcast: send failed for {signature}: {e}")
+
+    async def read_height():
+        nonlocal height
+        try:
+            height = (await client.get_block_height("confirmed")).value
+        except Exception as e:
+            logger.warning(f"Rebroadcast: block height read failed for {signature}, keeping {height}: {e!r}")
+
+    async def poll_status():
+        try:
+            response = await client.get_signature_statuses([Signature.from_string(signature)])
+        except Exception as e:
+            logger.warning(f"Rebroadcast: status poll failed for {signature}: {e!r}")
+            return None
+        status = response.value[0]
+        if status is None or status.confirmation_status is None:
+            return None
+        reached = str(status.confirmation_status).split(".")[-1].lower()
+        if commitment_reached(reached, commitment):
+            return {"signature": signature, "err": status.err, "slot": status.slot, "commitment": reached}
+        return None
+
+    def finish(result):
+        result = dict(result)
+        result.update({"sends": sends, "seconds": time.monotonic() - started})
+        return result
+
+    try:
+        while True:
+            round_started = time.monotonic()
+            await asyncio.gather(send_once(), read_height())
+
+            if landed is None:
+                result = await poll_status()
+                if result:
+                    return finish(result)
+            elif landed.done():
+                return finish(landed.result())
+
+            if last_valid_block_height is not None and height is not None and height > last_valid_block_height:
+                # One last look, it may have landed in the final valid block
+                result = landed.result() if landed is not None and landed.done() else await poll_status()
+                if result:
+                    return finish(result)
+                raise TransactionExpired(
+                    f"{signature} expired at block height {height} (last valid {last_valid_block_height}) "
+                    f"after {sends} send(s) in {time.monotonic() - started:.1f}s"
+                )
+
+            if time.monotonic() - started > timeout:
+                raise TransactionExpired(f"{signature} not landed after {timeout}s and {sends} send(s)")
+
+            # Wake early if the confirmation arrives between sends
+            remaining = max(0.0, interval - (time.monotonic() - round_started))
+            if landed is not None:
+                try:
+                    return finish(await asyncio.wait_for(asyncio.shield(landed), remaining))
+                except asyncio.TimeoutError:
+                    pass
+            else:
+                await asyncio.sleep(remaining)
+    except TransactionExpired:
+        if landing_watch is not None:
+            landing_watch.cancel()
+        raise
+    finally:
+        if tracker is not None and landed is not None and not landed.done():
+            tracker.forget(signature)
@@ -0,0 +1,217 @@
+# Base Imports
+import os
+import json
+import time
+import asyncio
+from datetime import datetime, timezone
+
+# External Imports
+import numpy as np
+from funcs.refresher import BackgroundRefresher
+from logging_utility import logger
+
+TICK_DIR = 'ticks' # Root of the tick store, one sub-directory per UTC day
+TICK_BUFFER_ROWS = 4096 # Rows per in-memory buffer; two buffers are all the recorder ever holds
+TICK_FLUSH_INTERVAL = 5 # Seconds between background flushes of a partly filled buffer
+
+VENUES = ("base", "solana") # Stored as the index into this tuple
+
+# One column file per field, raw little-endian values appended in row order
+TICK_DTYPE = np.dtype([
+    ("ts", "<f8"), # Unix seconds the round was evaluated
+    ("venue", "u1"), # Index into VENUES
+    ("size", "<f8"), # LUNA amount the quote was sized at
+    ("amount_in", "<f8"), # Input amount in token units
+    ("amount_out", "<f8"), # Output amount in token units
+    ("impact", "<f8"), # Price impact in percent
+    ("height", "<i8"), # Odos blockNumber / Jupiter contextSlot, -1 if the quote had none
+    ("spread", "<f8"), # (Solana price - Base price) / mid price in percent, same on both rows of a round
+    ("price", "<f8"), # USD per LUNA on this venue
+])
+
+SCHEMA_FILE = '_schema.json'
+
+def partition_name(ts: float) -> str:
+    """UTC day a timestamp falls in, as the partition directory name"""
+    return datetime.fromtimestamp(ts, timezone.utc).strftime('%Y-%m-%d')
+
+def _column_rows(path: str, itemsize: int) -> int:
+    return os.path.getsize(path) // itemsize if os.path.exists(path) else 0
+
+def repair_partition(directory: str, dtype=TICK_DTYPE) -> int:
+    """
+    Cut every column of a partition back to the shortest one, dropping a
+    row that a crash left half-written, so later appends stay aligned.
+
+    Returns:
+        int: Rows in the partition
+    """
+    rows = min(_column_rows(os.path.join(directory, f'{name}.bin'), dtype[name].itemsize) for name in dtype.names)
+    for name in dtype.names:
+        path = os.path.join(directory, f'{name}.bin')
+        if os.path.exists(path) and os.path.getsize(path) != rows * dtype[name].itemsize:
+            os.truncate(path, rows * dtype[name].itemsize)
+    return rows
+
+def write_ticks(rows: np.ndarray, root: str = TICK_DIR, repaired: set = None):
+    """
+    Append {rows} (a TICK_DTYPE array) to their daily partitions under {root}.
+    Blocking; the recorder runs it in the default executor.
+
+    Args:
+        repaired: Partitions already checked by this process; others are repaired before the first append
+    """
+    days = np.array([partition_name(ts) for ts in rows["ts"][[0, -1]]])
+    if days[0] == days[1]:
+        groups = [(days[0], rows)]
+    else:
+        # A buffer spans midnight: split it by day
+        names = np.array([partition_name(ts) for ts in rows["ts"]])
+        groups = [(day, rows[names == day]) for day in dict.fromkeys(names)]
+
+    for day, group in groups:
+        directory = os.path.join(root, day)
+        if repaired is None or directory not in repaired:
+            os.makedirs(directory, exist_ok=True)
+            schema = os.path.join(directory, SCHEMA_FILE)
+            if not os.path.exists(schema):
+                with open(schema, 'w') as f:
+                    json.dump({"columns": {name: group.dtype[name].str for name in group.dtype.names},
+                               "venues": VENUES}, f, indent=4)
+            repair_partition(directory, group.dtype)
+            if repaired is not None:
+                repaired.add(directory)
+
+        for name in group.dtype.names:
+            with open(os.path.join(directory, f'{name}.bin'), 'ab') as f:
+                f.write(np.ascontiguousarray(group[name]).tobytes())
+
+def read_ticks(root: str = TICK_DIR, start: float = None, end: float = None, columns=None, venue: str = None):
+    """
+    Load ticks from the daily partitions under {root}
+
+    Only partitions overlapping [start, end) and only the requested columns
+    are read, each column with a single np.fromfile.
+
+    Args:
+        start: Unix seconds, inclusive
+        end: Unix seconds, exclusive
+        columns: Column names to return, every column by default
+        venue: "base" or "solana" to keep one venue only
+
+    Returns:
+        dict: column name -> numpy array, rows in time order
+    """
+    columns = list(columns or TICK_DTYPE.names)
+    needed = list(dict.fromkeys(columns + (["ts"] if start is not None or end is not None else [])
+                                + (["venue"] if venue is not None else [])))
+    first = partition_name(start) if start is not None else None
+    last = partition_name(end) if end is not None else None
+
+    parts = {name: [] for name in needed}
+    days = sorted(d for d in os.listdir(root) if os.path.isdir(os.path.join(root, d))) if os.path.isdir(root) else []
+    for day in days:
+        if (first and day < first) or (last and day > last):
+            continue
+        directory = os.path.join(root, day)
+        with open(os.path.join(directory, SCHEMA_FILE)) as f:
+            dtypes = {name: np.dtype(code) for name, code in json.load(f)["columns"].items()}
+        # A torn trailing row is ignored, not returned
+        rows = min(_column_rows(os.path.join(directory, f'{name}.bin'), dtype.itemsize) for name, dtype in dtypes.items())
+        for name in needed:
+            parts[name].append(np.fromfile(os.path.join(directory, f'{name}.bin'), dtype=dtypes[name], count=rows))
+
+    data = {name: np.concatenate(chunks) if chunks else np.empty(0, TICK_DTYPE[name]) for name, chunks in parts.items()}
+    mask = None
+    if start is not None:
+        mask = data["ts"] >= start
+    if end is not None:
+        mask = (data["ts"] < end) if mask is None else mask & (data["ts"] < end)
+    if venue is not None:
+        is_venue = data["venue"] == VENUES.index(venue)
+        mask = is_venue if mask is None else mask & is_venue
+    return {name: data[name][mask] if mask is not None else data[name] for name in columns}
+
+class TickRecorder(BackgroundRefresher):
+    """
+    Append-only columnar store of every monitor round, one row per venue quote.
+
+    record() writes into a preallocated numpy buffer, so a round costs a
+    couple of microseconds and no allocation. A full buffer, or any rows
+    still buffered every `interval` seconds, is swapped for the spare
+    one and appended to disk in the default executor, off the event loop.
+    Memory is bounded at two buffers: if the spare is still being written
+    when the active one fills, new rows are counted in `dropped` rather
+    than queued.
+    """
+
+    def __init__(self, root: str = TICK_DIR, buffer_rows: int = TICK_BUFFER_ROWS,
+                 flush_interval: float = TICK_FLUSH_INTERVAL):
+        super().__init__(flush_interval)
+        self.root = root
+        self._active = np.zeros(buffer_rows, TICK_DTYPE)
+        self._spare = np.zeros(buffer_rows, TICK_DTYPE)
+        self._rows = 0
+        self._flush = None # Future of the write in progress
+        self._repaired = set()
+        self.recorded = 0
+        self.written = 0
+        self.dropped = 0
+
+    def record(self, venue: str, size: float, amount_in: float, amount_out: float, impact: float,
+               height=None, spread: float = float("nan"), price: float = float("nan"), ts: float = None):
+        """Buffer one quote; {height} is the quote's block/slot, None when it had none"""
+        if self._rows == len(self._active) and not self.flush():
+            self.dropped += 1
+            return
+        self._active[self._rows] = (time.time() if ts is None else ts, VENUES.index(venue), size, amount_in,
+                                    amount_out, impact, -1 if height is None else height, spread, price)
+        self._rows += 1
+        self.recorded += 1
+
+    def flush(self) -> bool:
+        """
+        Hand the buffered rows to a background write and switch buffers
+
+        Returns:
+            bool: False when the previous write is still running and nothing was handed over
+        """
+        if self._flush is not None and not self._flush.done():
+            return False
+        if not self._rows:
+            return True
+
+        rows = self._active[:self._rows]
+        self._active, self._spare = self._spare, self._active
+        self._rows = 0
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (scripts, shutdown): write inline
+            self._write(rows)
+            return True
+        self._flush = loop.run_in_executor(None, self._write, rows)
+        return True
+
+    def _write(self, rows: np.ndarray):
+        try:
+            write_ticks(rows, self.root, self._repaired)
+            self.written += len(rows)
+            self.updated_at = time.monotonic()
+        except OSError as e:
+            logger.error(f"Ticks: dropped {len(rows)} row(s), write to {self.root} failed: {e}")
+
+    async def refresh(self):
+        """The flush timer's tick"""
+        self.flush()
+
+    async def stop(self):
+        """Stop the flush timer and write whatever is still buffered"""
+        await super().stop()
+        if self._flush is not None:
+            await self._flush
+        self.flush()
+        if self._flush is not None:
+            await self._flush
+        if self.dropped:
+            logger.warning(f"Ticks: {self.dropped} row(s) dropped while a write was in progress")
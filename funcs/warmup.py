@@ -0,0 +1,193 @@
+# Base Imports
+import time
+import asyncio
+
+# External Imports
+from config import token_configs
+from funcs import get_sol_client_async
+from funcs.http_client import get_session
+from logging_utility import logger
+
+WARMUP_RETRY_DELAY = 2 # Seconds between attempts of a step that failed or left its cache empty
+WARMUP_TIMEOUT = 120 # Seconds before start-up gives up on steps that are still not ready
+KEEPALIVE_INTERVAL = 20 # Seconds between keep-alive pings, well under the pool's 60s idle timeout
+
+async def ping_url(url: str):
+    """HEAD {url} on the shared session; any status keeps the pooled connection open"""
+    session = get_session()
+    async with session.head(url, allow_redirects=False) as response:
+        return response.status
+
+async def fetch_token_metadata(sol_client=None):
+    """
+    Read every configured token's decimals on chain and compare them with config
+
+    Base decimals come from one Multicall3 round trip, Solana decimals from
+    getTokenSupply per mint, all in parallel. Every amount conversion depends
+    on them, so a mismatch is logged and raised.
+
+    Returns:
+        dict: {"base": {name: decimals}, "solana": {name: decimals}}. Raises ValueError on a mismatch.
+    """
+    from solders.pubkey import Pubkey
+    from contracts import get_abi
+    from funcs import get_w3_async
+    from funcs.multicall import multicall_async, prepare_call
+    from web3 import Web3
+
+    sol_client = sol_client or get_sol_client_async()
+    base_tokens = token_configs["base"]["tokens"]
+    sol_tokens = token_configs["solana"]["tokens"]
+
+    w3_async = get_w3_async()
+    calls = [
+        prepare_call(w3_async.eth.contract(address=Web3.to_checksum_address(token["address"]), abi=get_abi("erc20_abi")),
+                     "decimals", allow_failure=True)
+        for token in base_tokens.values()
+    ]
+
+    async def sol_decimals(mint):
+        response = await sol_client.get_token_supply(Pubkey.from_string(mint))
+        return response.value.decimals
+
+    base_decimals, *sol_decimals_list = await asyncio.gather(
+        multicall_async(calls),
+        *[sol_decimals(token["address"]) for token in sol_tokens.values()]
+    )
+
+    metadata = {
+        "base": dict(zip(base_tokens, base_decimals)),
+        "solana": dict(zip(sol_tokens, sol_decimals_list)),
+    }
+    mismatched = []
+    for chain, tokens in (("base", base_tokens), ("solana", sol_tokens)):
+        for name, token in tokens.items():
+            if metadata[chain][name] != token["decimals"]:
+                logger.error(f"Token metadata: {chain} {name} has {metadata[chain][name]} decimals on chain, "
+                             f"{token['decimals']} in config")
+                mismatched.append(f"{chain} {name}")
+    if mismatched:
+        raise ValueError(f"decimals differ from config for {', '.join(mismatched)}")
+    return metadata
+
+class Warmup:
+    """
+    Start-up stage that primes every connection and cache in parallel before trading.
+
+    Each step is an async `prime` callable plus an optional `ready` check
+    that says whether its cache is populated. All steps run at once; a step
+    that raises or leaves its cache empty is retried every `retry_delay`
+    seconds. The bot is reported ready only once every required step is;
+    run() gives up after its timeout (WARMUP_TIMEOUT) and reports them missing.
+    Keep-alive pings then run every `keepalive_interval` seconds so pooled
+    connections are never idle long enough to be closed.
+    """
+
+    def __init__(self, retry_delay: float = WARMUP_RETRY_DELAY, keepalive_interval: float = KEEPALIVE_INTERVAL):
+        self.retry_delay = retry_delay
+        self.keepalive_interval = keepalive_interval
+        self.steps = {} # name -> (prime, ready, required)
+        self.keepalives = {} # name -> ping
+        self.status = {} # name -> {"ready", "attempts", "seconds", "error"}
+        self._ready = asyncio.Event()
+        self._task = None
+
+    def add(self, name: str, prime, ready=None, required: bool = True):
+        """
+        Register a step
+
+        Args:
+            prime: Async callable that opens the connection / fills the cache
+            ready: Callable returning True once the cache is populated; without one, a clean run counts
+            required: Optional steps get one attempt and never hold back readiness
+        """
+        self.steps[name] = (prime, ready, required)
+
+    def add_keepalive(self, name: str, ping):
+        """Register an async {ping} run every keepalive_interval seconds"""
+        self.keepalives[name] = ping
+
+    def is_ready(self) -> bool:
+        return self._ready.is_set()
+
+    async def _run_step(self, name: str, deadline: float = None):
+        prime, ready, required = self.steps[name]
+        status = self.status[name] = {"ready": False, "attempts": 0, "seconds": None, "error": None}
+        started = time.monotonic()
+
+        while True:
+            status["attempts"] += 1
+            try:
+                # A hung attempt must not outlive the deadline either
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                await asyncio.wait_for(prime(), remaining)
+                status["ready"] = ready() if ready is not None else True
+                status["error"] = None if status["ready"] else "cache still empty"
+            except asyncio.TimeoutError:
+                status["error"] = "timed out"
+            except Exception as e:
+                status["error"] = str(e) or type(e).__name__
+
+            if status["ready"]:
+                status["seconds"] = time.monotonic() - started
+                return True
+            if not required or (deadline is not None and time.monotonic() >= deadline):
+                return False
+            logger.warning(f"Warm-up: {name} not ready ({status['error']}), retrying in {self.retry_delay}s")
+            await asyncio.sleep(self.retry_delay if deadline is None else min(self.retry_delay, max(0.0, deadline - time.monotonic())))
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+
+    def missing(self):
+        """Required steps that are not ready"""
+        return [name for name, (_, _, required) in self.steps.items()
+                if required and not self.status.get(name, {}).get("ready")]
+
+    async def run(self, timeout: float = WARMUP_TIMEOUT) -> bool:
+        """
+        Run every step in parallel until all required ones are ready, or {timeout} seconds pass
+
+        Returns:
+            bool: True once every required step is ready
+        """
+        started = time.monotonic()
+        deadline = started + timeout if timeout is not None else None
+        await asyncio.gather(*[self._run_step(name, deadline) for name in self.steps])
+
+        for name, status in self.status.items():
+            if status["ready"]:
+                logger.info(f"Warm-up: {name} ready in {status['seconds']:.2f}s ({status['attempts']} attempt(s))")
+            else:
+                level = logger.error if self.steps[name][2] else logger.warning
+                level(f"Warm-up: {name} not ready after {status['attempts']} attempt(s): {status['error']}")
+
+        missing = self.missing()
+        if missing:
+            logger.error(f"Warm-up: not ready, missing {', '.join(missing)}")
+            return False
+
+        self._ready.set()
+        logger.info(f"Warm-up: ready after {time.monotonic() - started:.2f}s, {len(self.steps)} step(s) in parallel")
+        return True
+
+    # Keep-alive
+    async def _keepalive(self):
+        while True:
+            await asyncio.sleep(self.keepalive_interval)
+            results = await asyncio.gather(*[ping() for ping in self.keepalives.values()], return_exceptions=True)
+            for name, result in zip(self.keepalives, results):
+                if isinstance(result, Exception):
+                    logger.debug(f"Keep-alive: {name} ping failed: {result}")
+
+    async def start_keepalive(self):
+        if self.keepalives and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._keepalive())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
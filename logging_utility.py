@@ -1,24 +1,182 @@
+import os
+import glob
+import gzip
+import json
+import time
+import queue
+import atexit
+import shutil
 import logging
+import logging.handlers
 from datetime import datetime
-import os
 
-# Create logs directory if it doesn't exist
-if not os.path.exists('logs'):
-    os.makedirs('logs')
-
-# Generate log filename with timestamp
-timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-log_file = f'logs/arbitrage_bot_{timestamp}.log'
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_file),
-        logging.StreamHandler()
-    ]
-)
-
-# Create logger
-logger = logging.getLogger('arbitrage_bot')
\ No newline at end of file
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+LOG_JSON = False # Write the log file as JSON lines instead of LOG_FORMAT; the console stays plain text
+LOG_MAX_BYTES = 50 * 1024 * 1024 # Roll the file over once it reaches this size...
+LOG_ROTATE_INTERVAL = 24 * 60 * 60 # ...or after this many seconds, whichever comes first
+LOG_BACKUP_COUNT = 14 # Rolled files kept next to the live one; older ones are deleted
+LOG_COMPRESS = True # Gzip rolled files
+
+# Create logger; it has no handlers until setup_logging() runs, so importing
+# this module creates no directory or file
+logger = logging.getLogger('arbitrage_bot')
+
+log_file = None # Set by setup_logging()
+_listener = None # QueueListener started by setup_logging()
+
+class LogQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that hands the record to the listener thread untouched.
+
+    The stock prepare() formats the message on the calling thread; skipping it
+    leaves the %-formatting, and any traceback rendering, to the listener. Log
+    calls must therefore pass values that are not mutated afterwards (numbers,
+    strings), which every call site in this repo does.
+    """
+
+    def prepare(self, record):
+        return record
+
+class RotatingLogHandler(logging.handlers.BaseRotatingHandler):
+    """
+    File handler that rolls over on size or on age, whichever comes first.
+
+    The rolled file is renamed to <file>.<YYYYmmdd_HHMMSS>[.n], gzipped when
+    {compress} is set, and only the newest {backup_count} are kept. It runs on
+    the listener thread, so neither the rename nor the compression ever blocks
+    the event loop.
+    """
+
+    def __init__(self, filename: str, max_bytes: int = LOG_MAX_BYTES, interval: float = LOG_ROTATE_INTERVAL,
+                 backup_count: int = LOG_BACKUP_COUNT, compress: bool = LOG_COMPRESS):
+        super().__init__(filename, 'a', encoding='utf-8', delay=True)
+        self.max_bytes = max_bytes
+        self.interval = interval
+        self.backup_count = backup_count
+        self.compress = compress
+        self.rollover_at = time.time() + interval if interval else None
+        self.rollovers = 0
+
+    def shouldRollover(self, record) -> bool:
+        if self.rollover_at is not None and time.time() >= self.rollover_at:
+            return True
+        if self.max_bytes:
+            if self.stream is None:
+                self.stream = self._open()
+            return self.stream.tell() >= self.max_bytes
+        return False
+
+    def rotation_filename(self, default_name: str) -> str:
+        return default_name + '.gz' if self.compress else default_name
+
+    def rotate(self, source: str, dest: str):
+        if not os.path.exists(source):
+            return
+        if not self.compress:
+            os.replace(source, dest)
+            return
+        with open(source, 'rb') as f_in, gzip.open(dest, 'wb') as f_out:
+            shutil.copyfileobj(f_in, f_out)
+        os.remove(source)
+
+    def rolled_files(self):
+        """Rolled files of this log, oldest first"""
+        return sorted(glob.glob(glob.escape(self.baseFilename) + '.*'), key=os.path.getmtime)
+
+    def doRollover(self):
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+
+        # Several size rollovers can land in the same second; number them
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        dest = self.rotation_filename(f'{self.baseFilename}.{stamp}')
+        n = 1
+        while os.path.exists(dest):
+            dest = self.rotation_filename(f'{self.baseFilename}.{stamp}.{n}')
+            n += 1
+        self.rotate(self.baseFilename, dest)
+        self.rollovers += 1
+
+        if self.backup_count:
+            for old in self.rolled_files()[:-self.backup_count]:
+                os.remove(old)
+
+        if self.interval:
+            self.rollover_at = time.time() + self.interval
+        self.stream = self._open()
+
+class JsonLinesFormatter(logging.Formatter):
+    """
+    One JSON object per record: time, level, logger and message, plus any
+    fields passed through `extra=` and the rendered traceback under exc.
+    """
+
+    _RESERVED = set(vars(logging.makeLogRecord({}))) | {'message', 'asctime'}
+
+    def format(self, record) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "ts": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update((key, value) for key, value in vars(record).items() if key not in self._RESERVED)
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+def setup_logging(log_dir='logs', json_lines: bool = LOG_JSON):
+    """
+    Log to a timestamped file under {log_dir} and to the console.
+    Called once by the entry point; later calls return the same file.
+
+    Log calls only put the record on a queue; a listener thread formats it
+    and does the file and console I/O, so the event loop never waits on disk.
+    The file rolls over by size and age (see RotatingLogHandler).
+
+    Args:
+        json_lines: Write the file as one JSON object per line
+
+    Returns:
+        str: The log file path
+    """
+    global log_file, _listener
+    if log_file is not None:
+        return log_file
+
+    # Create logs directory if it doesn't exist
+    if not os.path.exists(log_dir):
+        os.makedirs(log_dir)
+
+    # Generate log filename with timestamp
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    log_file = f'{log_dir}/arbitrage_bot_{timestamp}.{"jsonl" if json_lines else "log"}'
+
+    file_handler = RotatingLogHandler(log_file)
+    file_handler.setFormatter(JsonLinesFormatter() if json_lines else logging.Formatter(LOG_FORMAT))
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    log_queue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+
+    # Configure logging
+    logging.basicConfig(
+        level=logging.INFO,
+        handlers=[LogQueueHandler(log_queue)]
+    )
+    return log_file
+
+def stop_logging():
+    """Drain the queue, stop the listener thread and close the file; registered with atexit"""
+    global _listener
+    if _listener is None:
+        return
+    listener, _listener = _listener, None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
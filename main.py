@@ -7,7 +7,9 @@ import asyncio
 from config import token_configs
 from funcs.base_odos import *
 from funcs.sol_jupiter import *
-from funcs import save_trade_data
+from funcs import save_trade_data, load_env
+from funcs.http_client import close_session
+from funcs.allowance_manager import AllowanceManager
 
 """ Core Arb Execution """
 def parse_price(data, source, out_decimals=6, init_amount=1000.0):
@@ -268,6 +270,7 @@ async def main():
     # Get addresses from config
     base = token_configs["base"]
     sol = token_configs["solana"]
+    load_env()
     base_priv_key = os.getenv('BASE_PRIVATE_KEY')
     sol_priv_key = os.getenv('SOL_PRIVATE_KEY')
 
@@ -339,12 +342,13 @@ async def main():
 
     print("Swap transaction assembled")
 
-    # 7. Approval Checks for Base
-    needs_approval = check_token_approval(base_in, base_user_addrs, ODOS_ROUTER_V2)
+    # 7. Approval Checks for Base, every configured token's allowance in one Multicall3 read
+    allowance_manager = AllowanceManager(base_user_addrs, base_priv_key, spender_address=ODOS_ROUTER_V2)
+    await allowance_manager.sync()
 
-    if needs_approval:
+    if allowance_manager.needs_approval(base_in):
         print("Token approval needed. Sending approval transaction...")
-        approval_success = send_infinite_approval(base_in, ODOS_ROUTER_V2)
+        approval_success = await allowance_manager.approve(base_in)
         if not approval_success:
             print("Approval failed!")
             return
@@ -360,4 +364,7 @@ async def main():
     print(f"View on Basescan: https://basescan.org/tx/0x{base_tx_hash}")
     print(f"View on Solscan: https://solscan.io/tx/{solana_tx_hash}")
 
-asyncio.run(main())
\ No newline at end of file
+    await close_session()
+
+if __name__ == "__main__":
+    asyncio.run(main())
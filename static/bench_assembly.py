@@ -0,0 +1,112 @@
+"""
+Benchmark: detection-to-submission latency of execute_arbitrage with and
+without speculative assembly.
+
+Runs the real execute_arbitrage against the local Odos/Jupiter stand-in
+(static.http_standin, RESPONSE_DELAY seconds per request) and stops at the
+point of submission: execute_odos / execute_jupiter are replaced by stubs
+that record when they were called. Quote reuse is off so every run
+re-quotes both legs, then analyzes and assembles as in production.
+
+- before: SPECULATIVE_ASSEMBLY off, assembly starts after the analysis
+- after: SPECULATIVE_ASSEMBLY on, assembly runs while the analysis does
+
+Both run twice: with the analysis as it is now (cached SOL/USD price) and
+with {slow_analysis_ms} of blocking work added, standing in for the blocking
+jup_find_price call the analysis made before the price service.
+
+Run with: python -m static.bench_assembly [runs] [response_delay_ms] [slow_analysis_ms]
+"""
+# Built-in
+import sys
+import time
+import asyncio
+import statistics
+
+# External
+import arb_v2
+import funcs.base_odos as base_odos
+import funcs.sol_jupiter as sol_jupiter
+import static.http_standin as http_standin
+from config import token_configs
+from funcs.allowance_manager import AllowanceManager
+from funcs.http_client import close_session
+
+RUNS = 50
+RESPONSE_DELAY_MS = 80 # Per request, about one Odos / Jupiter round trip from a nearby region
+SLOW_ANALYSIS_MS = 50 # Blocking work added to the analysis in the second pass
+SOL_MINT = token_configs["solana"]["tokens"]["sol"]["address"]
+
+async def run_once(speculative: bool, extra_analysis_ms: float = 0):
+    """One execute_arbitrage call; returns (detection -> submission ms, analysis ms)"""
+    arb_v2.SPECULATIVE_ASSEMBLY = speculative
+    arb_v2.price_service.priced_at[SOL_MINT] = time.monotonic()
+    submitted = {}
+    analysis = {}
+
+    async def submit(*args, **kwargs):
+        submitted.setdefault("at", time.monotonic())
+        return None # No hash: execute_arbitrage stops right after submission
+
+    analyze = arb_v2.analyze_arb_quotes
+    def timed_analysis(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            if extra_analysis_ms:
+                time.sleep(extra_analysis_ms / 1000)
+            return analyze(*args, **kwargs)
+        finally:
+            analysis["ms"] = (time.perf_counter() - started) * 1000
+
+    arb_v2.execute_odos = arb_v2.execute_jupiter = submit
+    arb_v2.analyze_arb_quotes = timed_analysis
+    try:
+        detected_at = time.monotonic()
+        # Sell 20000 LUNA on Base for ~$398, buy it on Solana for 1 SOL ($150): always profitable
+        _, error = await arb_v2.execute_arbitrage("buy_sol_sell_base", 20000, 1.0, "", "", detected_at=detected_at)
+    finally:
+        arb_v2.analyze_arb_quotes = analyze
+    if "at" not in submitted:
+        raise RuntimeError(f"execute_arbitrage stopped before submission: {error}")
+    return (submitted["at"] - detected_at) * 1000, analysis["ms"]
+
+def report(label: str, samples):
+    latencies = sorted(sample[0] for sample in samples)
+    print(f"  {label:<28} detection -> submission mean {statistics.fmean(latencies):7.1f} ms | "
+          f"p50 {latencies[len(latencies) // 2]:7.1f} | p95 {latencies[int(len(latencies) * 0.95) - 1]:7.1f} | "
+          f"analysis {statistics.fmean(sample[1] for sample in samples):.3f} ms")
+
+async def main(runs: int, delay_ms: float, slow_ms: float):
+    http_standin.RESPONSE_DELAY = delay_ms / 1000
+    runner, base_url = await http_standin.start_standin()
+    base_odos.ODOS_API_URL = base_url
+    sol_jupiter.JUPITER_API_URL = base_url
+
+    arb_v2.QUOTE_REUSE = False
+    arb_v2.price_service.prices[SOL_MINT] = 150.0
+    arb_v2.allowance_manager = AllowanceManager(arb_v2.BASE_USER_ADDRS)
+    for token in token_configs["base"]["tokens"].values():
+        arb_v2.allowance_manager.record_approval(token["address"])
+
+    results = {(extra, speculative): [] for extra in (0, slow_ms) for speculative in (False, True)}
+    try:
+        await run_once(False) # Open the pooled connections
+        for _ in range(runs):
+            for extra, speculative in results:
+                results[extra, speculative].append(await run_once(speculative, extra))
+    finally:
+        await close_session()
+        await runner.cleanup()
+
+    print(f"execute_arbitrage over {runs} runs each, stand-in answering every request after {delay_ms:.0f} ms")
+    for extra, title in ((0, "analysis as it is now"), (slow_ms, f"analysis + {slow_ms:.0f} ms blocking")):
+        print(f"\n{title}:")
+        report("before: sequential assembly", results[extra, False])
+        report("after: speculative assembly", results[extra, True])
+        saved = statistics.fmean(s[0] for s in results[extra, False]) - statistics.fmean(s[0] for s in results[extra, True])
+        print(f"  saved {saved:.1f} ms per execution")
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else RUNS,
+                     float(sys.argv[2]) if len(sys.argv) > 2 else RESPONSE_DELAY_MS,
+                     float(sys.argv[3]) if len(sys.argv) > 3 else SLOW_ANALYSIS_MS))
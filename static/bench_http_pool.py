@@ -0,0 +1,99 @@
+"""
+Benchmark: quote round latency with a new session per call vs the shared pool.
+
+A round is one `quote_odos` + one `quote_jupiter` fired concurrently, exactly as
+`arb_v2.price_checker` does. Both modes hit the local stand-in in
+`static/http_standin.py`, so the numbers only show connection setup cost
+(TCP + HTTP); against the real APIs the pooled mode also skips DNS and TLS.
+
+Run with: python -m static.bench_http_pool [rounds]
+"""
+# Built-in
+import sys
+import time
+import asyncio
+import statistics
+
+# External
+import aiohttp
+import funcs.base_odos as base_odos
+import funcs.sol_jupiter as sol_jupiter
+from config import token_configs
+from funcs.http_client import close_session
+from static.http_standin import start_standin
+
+ROUNDS = 200
+
+async def quote_round_unpooled(base_url, base, sol, amount):
+    """Replicates the old behaviour: one ClientSession per request"""
+
+    async def odos():
+        payload = {
+            "chainId": base["chain_id"],
+            "inputTokens": [{"tokenAddress": base["tokens"]["luna"]["address"],
+                             "amount": base_odos.convert_to_decimal_amount(amount, base["tokens"]["luna"]["decimals"])}],
+            "outputTokens": [{"tokenAddress": base["tokens"]["virtual"]["address"], "proportion": 1}],
+            "compact": True,
+        }
+        async with aiohttp.ClientSession() as session:
+            async with session.post(f"{base_url}/sor/quote/v2", json=payload) as response:
+                response.raise_for_status()
+                return await response.json()
+
+    async def jupiter():
+        decimal_amount = sol_jupiter.convert_to_decimal_amount(amount, sol["tokens"]["luna"]["decimals"])
+        url = (f"{base_url}/quote?inputMint={sol['tokens']['luna']['address']}"
+               f"&outputMint={sol['tokens']['sol']['address']}&amount={decimal_amount}&slippageBps=200")
+        async with aiohttp.ClientSession() as session:
+            async with session.get(url) as response:
+                response.raise_for_status()
+                return await response.json()
+
+    return await asyncio.gather(odos(), jupiter())
+
+async def quote_round_pooled(base, sol, amount):
+    """Current behaviour: funcs quote functions on the shared pool"""
+    return await asyncio.gather(
+        base_odos.quote_odos(base["tokens"]["luna"]["address"], base["tokens"]["virtual"]["address"],
+                             amount, base["tokens"]["luna"]["decimals"]),
+        sol_jupiter.quote_jupiter(sol["tokens"]["luna"]["address"], sol["tokens"]["sol"]["address"],
+                                  amount, sol["tokens"]["luna"]["decimals"]),
+    )
+
+async def time_rounds(round_fn, rounds):
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        await round_fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+def report(label, samples):
+    samples = sorted(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(f"{label:<10} mean {statistics.mean(samples):7.3f} ms | "
+          f"p50 {statistics.median(samples):7.3f} ms | p95 {p95:7.3f} ms")
+
+async def main(rounds):
+    runner, base_url = await start_standin()
+    base_odos.ODOS_API_URL = base_url
+    sol_jupiter.JUPITER_API_URL = base_url
+
+    base = token_configs["base"]
+    sol = token_configs["solana"]
+    amount = 10000
+
+    try:
+        before = await time_rounds(lambda: quote_round_unpooled(base_url, base, sol, amount), rounds)
+        after = await time_rounds(lambda: quote_round_pooled(base, sol, amount), rounds)
+    finally:
+        await close_session()
+        await runner.cleanup()
+
+    print(f"\nQuote round latency over {rounds} rounds (local stand-in)")
+    report("unpooled", before)
+    report("pooled", after)
+    print(f"Speedup (mean): {statistics.mean(before) / statistics.mean(after):.2f}x")
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else ROUNDS))
@@ -0,0 +1,215 @@
+"""
+Benchmark: per-round logging overhead on the monitor loop.
+
+One round logs what evaluate_quotes, calc_balanced_swap and
+analyze_arb_quotes log on an opportunity: three multi-line blocks and a
+one-liner. The time measured is what the calling (event loop) thread spends
+inside the log calls, per round.
+
+- before: f-string messages, synchronous FileHandler + StreamHandler
+- after: %-style lazy args, LogQueueHandler feeding a QueueListener thread
+  that owns the same two handlers (the setup_logging() layout)
+
+Each pair also runs against a "slow disk" file handler that fsyncs every
+record, and with the level raised to WARNING, where lazy args skip
+formatting entirely. The console stream goes to os.devnull so the terminal
+does not skew the numbers. A last section rolls a small RotatingLogHandler
+over by size and checks the gzipped files.
+
+Run with: python -m static.bench_logging [rounds]
+"""
+# Built-in
+import os
+import sys
+import glob
+import gzip
+import time
+import queue
+import logging
+import tempfile
+import statistics
+import logging.handlers
+
+# External
+from logging_utility import LOG_FORMAT, JsonLinesFormatter, LogQueueHandler, RotatingLogHandler
+
+ROUNDS = 2000
+
+# A representative buy_base_sell_sol round
+ROUND = {
+    "base_price": 0.066012, "sol_price": 0.069731, "price_diff": 5.47, "impact_min": 10000,
+    "base_impact": 0.91, "sol_impact": 1.62, "x": 23410.0, "virtual_amount": 781.2231, "virtual_usd": 1545.34,
+    "solana_amount": 3.6214, "solana_usd": 1632.40, "profit_usd": 87.0612, "luna_sol": 23410.0,
+    "luna_base": 23398.1, "usdc_sol": 1632.40, "usdc_base": 1545.34,
+}
+
+class FsyncFileHandler(logging.FileHandler):
+    """FileHandler that fsyncs every record, standing in for a slow or contended disk"""
+
+    def flush(self):
+        super().flush()
+        if self.stream:
+            os.fsync(self.stream.fileno())
+
+def round_fstring(log, r):
+    """The log calls of one round as they were: messages built with f-strings before the call"""
+    log.info(f"\n--------------------------------------\n"
+    f"Base Price: ${r['base_price']:.6f}\n"
+    f"Solana Price: ${r['sol_price']:.6f}\n"
+    f"Price Difference: {r['price_diff']:.2f}%\n"
+    f"Base Impact ({r['impact_min']}): {r['base_impact']}\n"
+    f"Sol Impact ({r['impact_min']}): {r['sol_impact']}\n"
+    f"--------------------------------------")
+    log.info(f"Arbitrage opportunity found! Action: buy_base_sell_sol")
+    log.info(f"\n--------------------------------------\n"
+    f"Calculation for Ideal Swap (Before Quote and Transaction):\n"
+    f"LUNA Amount: {r['x']:.4f}\n"
+    f"VIRTUAL Amount (spent): {r['virtual_amount']:.4f} (${r['virtual_usd']:.2f})\n"
+    f"SOLANA Amount (received): {r['solana_amount']:.4f} (${r['solana_usd']:.2f})\n"
+    f"Expected Profit (USD): ${r['profit_usd']:.4f}\n"
+    f"Base Impact: {r['base_impact']:.4f}%\n"
+    f"Sol Impact: {r['sol_impact']:.4f}%\n"
+    f"--------------------------------------")
+    log.info(f"\n=== Arbitrage Analysis ===\n"
+    f"Action: buy_base_sell_sol\n"
+    f"LUNA Sol: {r['luna_sol']:.6f}\n"
+    f"LUNA Base: {r['luna_base']:.6f}\n"
+    f"USDC Sol: ${r['usdc_sol']:.2f}\n"
+    f"USDC Base: ${r['usdc_base']:.2f}\n"
+    f"Profit: ${r['profit_usd']:.2f}\n"
+    f"========================")
+
+def round_lazy(log, r):
+    """The same round with %-style args, as arb_v2 logs it now"""
+    log.info("\n--------------------------------------\n"
+    "Base Price: $%.6f\n"
+    "Solana Price: $%.6f\n"
+    "Price Difference: %.2f%%\n"
+    "Base Impact (%s): %s\n"
+    "Sol Impact (%s): %s\n"
+    "--------------------------------------",
+    r['base_price'], r['sol_price'], r['price_diff'], r['impact_min'], r['base_impact'], r['impact_min'], r['sol_impact'])
+    log.info("Arbitrage opportunity found! Action: %s", "buy_base_sell_sol")
+    log.info("\n--------------------------------------\n"
+    "Calculation for Ideal Swap (Before Quote and Transaction):\n"
+    "LUNA Amount: %.4f\n"
+    "%s Amount (%s): %.4f ($%.2f)\n"
+    "%s Amount (%s): %.4f ($%.2f)\n"
+    "Expected Profit (USD): $%.4f\n"
+    "Base Impact: %.4f%%\n"
+    "Sol Impact: %.4f%%\n"
+    "--------------------------------------",
+    r['x'], "VIRTUAL", "spent", r['virtual_amount'], r['virtual_usd'],
+    "SOLANA", "received", r['solana_amount'], r['solana_usd'], r['profit_usd'], r['base_impact'], r['sol_impact'])
+    log.info("\n=== Arbitrage Analysis ===\n"
+    "Action: %s\n"
+    "LUNA Sol: %.6f\n"
+    "LUNA Base: %.6f\n"
+    "USDC Sol: $%.2f\n"
+    "USDC Base: $%.2f\n"
+    "Profit: $%.2f\n"
+    "========================",
+    "buy_base_sell_sol", r['luna_sol'], r['luna_base'], r['usdc_sol'], r['usdc_base'], r['profit_usd'])
+
+def make_logger(name: str, path: str, devnull, use_queue: bool, fsync: bool, level: int):
+    """
+    A private logger wired like the old setup (sync handlers) or the new one (queue + listener)
+
+    Returns:
+        tuple: (logger, listener or None, handlers)
+    """
+    file_handler = (FsyncFileHandler if fsync else logging.FileHandler)(path, encoding='utf-8')
+    console_handler = logging.StreamHandler(devnull)
+    handlers = [file_handler, console_handler]
+    for handler in handlers:
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    log = logging.getLogger(f'bench_logging.{name}')
+    log.propagate = False
+    log.setLevel(level)
+    log.handlers.clear()
+
+    listener = None
+    if use_queue:
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        log.addHandler(LogQueueHandler(log_queue))
+    else:
+        for handler in handlers:
+            log.addHandler(handler)
+    return log, listener, handlers
+
+def run(name: str, scratch: str, devnull, round_fn, use_queue: bool, rounds: int, fsync=False, level=logging.INFO):
+    """Per-round microseconds spent in the calling thread, plus the time the listener needed to drain"""
+    path = os.path.join(scratch, f'{name}.log')
+    log, listener, handlers = make_logger(name, path, devnull, use_queue, fsync, level)
+
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        round_fn(log, ROUND)
+        samples.append((time.perf_counter() - started) * 1e6)
+
+    drain_started = time.perf_counter()
+    if listener is not None:
+        listener.stop()
+    drain_ms = (time.perf_counter() - drain_started) * 1000
+    for handler in handlers:
+        handler.close()
+
+    with open(path, encoding='utf-8') as f:
+        lines = sum(1 for _ in f)
+    samples.sort()
+    return {
+        "mean": statistics.fmean(samples),
+        "p50": samples[len(samples) // 2],
+        "p99": samples[int(len(samples) * 0.99)],
+        "max": samples[-1],
+        "drain_ms": drain_ms,
+        "lines": lines,
+    }
+
+def report(label: str, result: dict):
+    print(f"  {label:<38} mean {result['mean']:8.1f} us | p50 {result['p50']:8.1f} | p99 {result['p99']:8.1f} "
+          f"| max {result['max']:9.1f} | drain {result['drain_ms']:7.1f} ms | {result['lines']} lines")
+
+def check_rotation(scratch: str):
+    """Roll a 64 KB-capped RotatingLogHandler over a few times and read back the gzipped files"""
+    path = os.path.join(scratch, 'rotate.jsonl')
+    handler = RotatingLogHandler(path, max_bytes=64 * 1024, interval=0, backup_count=3)
+    handler.setFormatter(JsonLinesFormatter())
+
+    log = logging.getLogger('bench_logging.rotate')
+    log.propagate = False
+    log.setLevel(logging.INFO)
+    log.addHandler(handler)
+    for i in range(2000):
+        log.info("round %d profit $%.2f", i, ROUND["profit_usd"], extra={"round": i})
+    handler.close()
+
+    rolled = sorted(glob.glob(path + '.*.gz'))
+    with gzip.open(rolled[-1], 'rt', encoding='utf-8') as f:
+        first = f.readline().strip()
+    print(f"\nRotation (64 KB cap, keep 3): {handler.rollovers} rollovers, {len(rolled)} gzipped files kept, "
+          f"live file {os.path.getsize(path) / 1024:.0f} KB")
+    print(f"  newest rolled line: {first}")
+
+def main(rounds: int):
+    print(f"Per-round logging cost on the calling thread, {rounds} rounds of 4 records")
+    with tempfile.TemporaryDirectory() as scratch, open(os.devnull, 'w') as devnull:
+        for fsync, title in ((False, "page-cache disk"), (True, "slow disk (fsync per record)")):
+            print(f"\n{title}:")
+            n = rounds if not fsync else max(rounds // 10, 50)
+            tag = "fsync_" if fsync else ""
+            report("before: f-string + sync handlers", run(f"{tag}sync", scratch, devnull, round_fstring, False, n, fsync))
+            report("after: lazy args + queue listener", run(f"{tag}queue", scratch, devnull, round_lazy, True, n, fsync))
+
+        print("\nLevel raised to WARNING (nothing written):")
+        report("f-string", run("warn_fstring", scratch, devnull, round_fstring, True, rounds, level=logging.WARNING))
+        report("lazy args", run("warn_lazy", scratch, devnull, round_lazy, True, rounds, level=logging.WARNING))
+
+        check_rotation(scratch)
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else ROUNDS)
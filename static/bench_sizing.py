@@ -0,0 +1,148 @@
+"""
+Benchmark: sizing strategies for calc_balanced_swap.
+
+The loop is the pre-vectorization calc_balanced_swap body (first profitable
+size wins). The sweep is funcs.sizing.best_balanced_swap (most profitable
+size wins), timed on the original 400-point grid, a 10x finer grid, and a
+batch of opportunities evaluated at once. The golden-section solver
+(funcs.sizing.solve_balanced_swap) is compared against a 1-LUNA grid scan
+for solve time and result, under both the sqrt and V2 pool models.
+
+Run with: python -m static.bench_sizing
+"""
+# Built-in
+import math
+import timeit
+
+# External
+import numpy as np
+from funcs.sizing import best_balanced_swap, size_grid, solve_balanced_swap, sqrt_impact_leg, v2_pool_leg
+
+MINIMUM_TOKEN = 10000
+MAX_TOKEN = 50000
+MONITOR_IMPACT_MIN = 10000
+
+# A representative buy_base_sell_sol round: LUNA ~5% cheaper on Base
+OPPORTUNITY = {
+    "base_price_luna_virtual": 0.0330,
+    "sol_price_luna_solana": 0.000155,
+    "base_usd_price": 0.0660,
+    "solana_usd_price": 0.0697,
+    "base_impact": 0.9,
+    "sol_impact": 1.6,
+    "trade_action": "buy_base_sell_sol",
+}
+
+def loop_first_profitable(base_price_luna_virtual, sol_price_luna_solana, base_usd_price, solana_usd_price,
+                          base_impact, sol_impact, trade_action, increment=100):
+    """Original calc_balanced_swap loop for buy_base_sell_sol, without logging"""
+    base_impact = (base_impact / 100) / math.sqrt(MONITOR_IMPACT_MIN)
+    sol_impact = (sol_impact / 100) / math.sqrt(MONITOR_IMPACT_MIN)
+
+    for x in range(MINIMUM_TOKEN, MAX_TOKEN, increment):
+        virtual_usd = base_usd_price / base_price_luna_virtual
+        solana_usd = solana_usd_price / sol_price_luna_solana
+        virtual_amount = (x * base_price_luna_virtual) / (1 - base_impact * math.sqrt(x))
+        solana_amount = x * sol_price_luna_solana * (1 - sol_impact * math.sqrt(x))
+        profit_usd = solana_amount * solana_usd - virtual_amount * virtual_usd
+        if profit_usd > 0:
+            return x, virtual_amount, solana_amount, profit_usd
+    return 0, 0, 0, 0
+
+def loop_best(base_price_luna_virtual, sol_price_luna_solana, base_usd_price, solana_usd_price,
+              base_impact, sol_impact, trade_action, increment=100):
+    """Same loop, scanning the whole grid for the maximum (fair comparison with the sweep)"""
+    base_impact = (base_impact / 100) / math.sqrt(MONITOR_IMPACT_MIN)
+    sol_impact = (sol_impact / 100) / math.sqrt(MONITOR_IMPACT_MIN)
+    virtual_usd = base_usd_price / base_price_luna_virtual
+    solana_usd = solana_usd_price / sol_price_luna_solana
+
+    best = (0, 0, 0, -math.inf)
+    for x in range(MINIMUM_TOKEN, MAX_TOKEN, increment):
+        virtual_amount = (x * base_price_luna_virtual) / (1 - base_impact * math.sqrt(x))
+        solana_amount = x * sol_price_luna_solana * (1 - sol_impact * math.sqrt(x))
+        profit_usd = solana_amount * solana_usd - virtual_amount * virtual_usd
+        if profit_usd > best[3]:
+            best = (x, virtual_amount, solana_amount, profit_usd)
+    return best
+
+def sweep(base_price_luna_virtual, sol_price_luna_solana, base_usd_price, solana_usd_price,
+          base_impact, sol_impact, trade_action, increment=100):
+    return best_balanced_swap(
+        size_grid(MINIMUM_TOKEN, MAX_TOKEN, increment),
+        sqrt_impact_leg(base_price_luna_virtual, base_impact, MONITOR_IMPACT_MIN),
+        sqrt_impact_leg(sol_price_luna_solana, sol_impact, MONITOR_IMPACT_MIN),
+        base_usd_price / base_price_luna_virtual,
+        solana_usd_price / sol_price_luna_solana,
+        trade_action,
+    )
+
+def time_us(fn, number=2000):
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+def main():
+    o = OPPORTUNITY
+
+    print("Single opportunity")
+    for increment in (100, 10):
+        points = len(range(MINIMUM_TOKEN, MAX_TOKEN, increment))
+        t_first = time_us(lambda: loop_first_profitable(**o, increment=increment))
+        t_loop = time_us(lambda: loop_best(**o, increment=increment), number=200)
+        t_sweep = time_us(lambda: sweep(**o, increment=increment))
+        print(f"  {points:5d} sizes | loop first-profitable {t_first:9.1f} us | "
+              f"loop full scan {t_loop:9.1f} us | vectorized {t_sweep:7.1f} us")
+
+    first = loop_first_profitable(**o)
+    best = sweep(**o)
+    print(f"\nOld answer (first profitable): {first[0]} LUNA, profit ${first[3]:.2f}")
+    print(f"New answer (best on grid):     {best['luna_amount']:.0f} LUNA, profit ${best['profit_usd']:.2f}")
+
+    # Several opportunities in one array operation
+    k = 16
+    rng = np.random.default_rng(7)
+    scale = rng.uniform(0.97, 1.03, size=k)
+    grid = size_grid(MINIMUM_TOKEN, MAX_TOKEN, 10)
+    base_leg = sqrt_impact_leg(o["base_price_luna_virtual"] * scale, o["base_impact"], MONITOR_IMPACT_MIN)
+    sol_leg = sqrt_impact_leg(o["sol_price_luna_solana"], o["sol_impact"] * scale, MONITOR_IMPACT_MIN)
+    virtual_usd = o["base_usd_price"] / o["base_price_luna_virtual"]
+    solana_usd = o["solana_usd_price"] / o["sol_price_luna_solana"]
+
+    t_batch = time_us(lambda: best_balanced_swap(grid, base_leg, sol_leg, virtual_usd, solana_usd, o["trade_action"]), number=200)
+    print(f"\n{k} opportunities x {len(grid)} sizes in one sweep: {t_batch:.1f} us")
+
+def compare_solver(label, base_leg, sol_leg, virtual_usd, solana_usd, trade_action, tol=1.0):
+    grid = size_grid(MINIMUM_TOKEN, MAX_TOKEN, 1)
+    t_grid = time_us(lambda: best_balanced_swap(grid, base_leg, sol_leg, virtual_usd, solana_usd, trade_action), number=50)
+    t_solve = time_us(lambda: solve_balanced_swap(MINIMUM_TOKEN, MAX_TOKEN, base_leg, sol_leg, virtual_usd, solana_usd, trade_action, tol))
+
+    scanned = best_balanced_swap(grid, base_leg, sol_leg, virtual_usd, solana_usd, trade_action)
+    solved = solve_balanced_swap(MINIMUM_TOKEN, MAX_TOKEN, base_leg, sol_leg, virtual_usd, solana_usd, trade_action, tol)
+
+    print(f"  {label}")
+    print(f"    grid scan ({len(grid)} sizes): {t_grid:8.1f} us -> {scanned['luna_amount']:.0f} LUNA, ${scanned['profit_usd']:.4f}")
+    print(f"    golden (tol {tol:g}, {solved['evaluations']} evals): {t_solve:6.1f} us -> "
+          f"{solved['luna_amount']:.1f} LUNA, ${solved['profit_usd']:.4f} "
+          f"(size diff {abs(solved['luna_amount'] - scanned['luna_amount']):.2f}, "
+          f"profit diff ${solved['profit_usd'] - scanned['profit_usd']:+.6f})")
+
+def solver_main():
+    o = OPPORTUNITY
+    virtual_usd = o["base_usd_price"] / o["base_price_luna_virtual"]
+    solana_usd = o["solana_usd_price"] / o["sol_price_luna_solana"]
+    sol_leg = sqrt_impact_leg(o["sol_price_luna_solana"], o["sol_impact"], MONITOR_IMPACT_MIN)
+
+    print("\nGolden-section solver vs 1-LUNA grid scan")
+    compare_solver("sqrt impact model",
+                   sqrt_impact_leg(o["base_price_luna_virtual"], o["base_impact"], MONITOR_IMPACT_MIN),
+                   sol_leg, virtual_usd, solana_usd, o["trade_action"])
+
+    # Pool priced so its spot matches the quoted Base price, 1.2M LUNA deep
+    reserve_luna = 1_200_000 * 10**18
+    reserve_virtual = int(reserve_luna * o["base_price_luna_virtual"])
+    compare_solver("V2 pool model",
+                   v2_pool_leg(reserve_virtual, reserve_luna),
+                   sol_leg, virtual_usd, solana_usd, o["trade_action"])
+
+if __name__ == "__main__":
+    main()
+    solver_main()
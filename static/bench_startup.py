@@ -0,0 +1,110 @@
+"""
+Benchmark: cold start, per-module import time and time-to-first-quote.
+
+Every measurement runs in a fresh interpreter so nothing is already in
+sys.modules. Import time is the wall time of `import <module>` alone, and the
+report shows whether that import dragged in web3, solana or dotenv, or
+created the logs/ directory. Time-to-first-quote spawns a process that imports
+the quote functions and fires one quote_odos + quote_jupiter round against
+the local stand-in in `static/http_standin.py`, timed from process spawn.
+
+Run with: python -m static.bench_startup [runs]
+"""
+# Built-in
+import os
+import sys
+import json
+import time
+import asyncio
+import statistics
+import subprocess
+
+# External
+from static.http_standin import start_standin
+
+RUNS = 5
+MODULES = (
+    "logging_utility",
+    "contracts",
+    "funcs",
+    "funcs.http_client",
+    "funcs.price_service",
+    "funcs.base_odos",
+    "funcs.sol_jupiter",
+    "funcs.depth_ladder",
+    "main",
+    "arb_v2",
+)
+HEAVY = ("web3", "solana.rpc.async_api", "dotenv")
+
+IMPORT_PROBE = """
+import os, sys, time, json
+started = time.perf_counter()
+import {module}
+elapsed = (time.perf_counter() - started) * 1000
+print(json.dumps({{"ms": elapsed, "loaded": [m for m in {heavy!r} if m in sys.modules], "logs_dir": os.path.exists("logs")}}))
+"""
+
+QUOTE_PROBE = """
+import asyncio, sys
+import funcs.base_odos as base_odos
+import funcs.sol_jupiter as sol_jupiter
+from config import token_configs
+from funcs.http_client import close_session
+
+async def first_quote(base_url):
+    base_odos.ODOS_API_URL = base_url
+    sol_jupiter.JUPITER_API_URL = base_url
+    base, sol = token_configs["base"], token_configs["solana"]
+    await asyncio.gather(
+        base_odos.quote_odos(base["tokens"]["luna"]["address"], base["tokens"]["virtual"]["address"],
+                             10000, base["tokens"]["luna"]["decimals"]),
+        sol_jupiter.quote_jupiter(sol["tokens"]["luna"]["address"], sol["tokens"]["sol"]["address"],
+                                  10000, sol["tokens"]["luna"]["decimals"]),
+    )
+    print("quoted", flush=True)
+    await close_session()
+
+asyncio.run(first_quote(sys.argv[1]))
+"""
+
+def import_time(module: str, cwd: str):
+    """One fresh-interpreter import of {module}, run in {cwd} so a logs/ directory would show up there"""
+    env = {**os.environ, "PYTHONPATH": os.getcwd()}
+    output = subprocess.run([sys.executable, "-c", IMPORT_PROBE.format(module=module, heavy=HEAVY)],
+                            cwd=cwd, env=env, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+async def time_to_first_quote(base_url: str):
+    """Milliseconds from spawning a fresh interpreter to its first quote round coming back"""
+    started = time.perf_counter()
+    process = await asyncio.create_subprocess_exec(sys.executable, "-c", QUOTE_PROBE, base_url,
+                                                   stdout=asyncio.subprocess.PIPE)
+    line = await process.stdout.readline()
+    elapsed = (time.perf_counter() - started) * 1000
+    await process.wait()
+    if line.strip() != b"quoted":
+        raise RuntimeError("quote probe failed")
+    return elapsed
+
+async def main(runs):
+    import tempfile
+
+    print(f"Import time per module, median of {runs} fresh interpreters")
+    with tempfile.TemporaryDirectory() as scratch:
+        for module in MODULES:
+            samples = [import_time(module, scratch) for _ in range(runs)]
+            last = samples[-1]
+            print(f"  {module:<20} {statistics.median(s['ms'] for s in samples):7.1f} ms | "
+                  f"loads {', '.join(last['loaded']) or '-':<35} | logs/ created: {last['logs_dir']}")
+
+    runner, base_url = await start_standin()
+    try:
+        samples = [await time_to_first_quote(base_url) for _ in range(runs)]
+    finally:
+        await runner.cleanup()
+    print(f"\nTime to first quote from process spawn (local stand-in): "
+          f"median {statistics.median(samples):.1f} ms, min {min(samples):.1f} ms")
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else RUNS))
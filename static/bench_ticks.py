@@ -0,0 +1,129 @@
+"""
+Benchmark: tick recorder cost per round, disk footprint and scan speed.
+
+- record: microseconds per monitor round (two rows) for TickRecorder.record
+  against appending the same round as JSON lines with append_trade_record
+- round trip: records rounds on an event loop across a UTC midnight with
+  background flushes, stops, and reads them back to check nothing was lost
+  or misaligned and that memory stayed at two buffers
+- store: writes {days} days of ticks at 2 rounds/s and reports bytes per row
+  and how long read_ticks takes to scan them, whole and filtered
+
+Run with: python -m static.bench_ticks [days]
+"""
+# Built-in
+import os
+import sys
+import time
+import asyncio
+import tempfile
+
+# External
+import numpy as np
+from funcs import append_trade_record
+from funcs.tick_recorder import TICK_DTYPE, TickRecorder, read_ticks, write_ticks
+
+DAYS = 14
+ROUNDS_PER_SECOND = 2
+DAY = 24 * 60 * 60
+MIDNIGHT = 1792281600.0 # 2026-10-18 00:00:00 UTC
+
+# One monitor round: (venue, size, amount_in, amount_out, impact, height, spread, price)
+ROUND = (
+    ("base", 1000.0, 1000.0, 33.02, 0.91, 21504233, 5.47, 0.066012),
+    ("solana", 1000.0, 1000.0, 0.155, 1.62, 371223411, 5.47, 0.069731),
+)
+
+def time_record(scratch: str, rounds: int = 20000):
+    """Microseconds per round: TickRecorder.record vs one JSON line per venue"""
+    recorder = TickRecorder(os.path.join(scratch, 'record'))
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for row in ROUND:
+            recorder.record(*row)
+    columnar = (time.perf_counter() - started) / rounds * 1e6
+    recorder.flush()
+
+    path = os.path.join(scratch, 'ticks.jsonl')
+    fields = ("venue", "size", "amount_in", "amount_out", "impact", "height", "spread", "price")
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for row in ROUND:
+            append_trade_record({"ts": time.time(), **dict(zip(fields, row))}, path)
+    jsonl = (time.perf_counter() - started) / rounds * 1e6
+    return columnar, jsonl, os.path.getsize(path) / (rounds * 2)
+
+async def round_trip(scratch: str, rounds: int = 50000):
+    """Record across midnight with small buffers and fast flushes, then read everything back"""
+    root = os.path.join(scratch, 'round_trip')
+    recorder = TickRecorder(root, buffer_rows=1024, flush_interval=0.01)
+    await recorder.start()
+
+    start = MIDNIGHT - rounds / ROUNDS_PER_SECOND / 2
+    for i in range(rounds):
+        ts = start + i / ROUNDS_PER_SECOND
+        for venue, size, amount_in, amount_out, impact, height, spread, price in ROUND:
+            recorder.record(venue, size, amount_in, amount_out, impact, height + i, spread, price, ts=ts)
+        if i % 200 == 0:
+            # Let the flush timer and executor writes run, as the monitor's awaits would
+            await asyncio.sleep(0.001)
+    await recorder.stop()
+
+    # Every row's ts must match the round its height came from, whatever was dropped
+    ticks = read_ticks(root)
+    first_height = np.array([row[5] for row in ROUND])[ticks["venue"]]
+    aligned = np.allclose(ticks["ts"], start + (ticks["height"] - first_height) / ROUNDS_PER_SECOND)
+    return {
+        "recorded": recorder.recorded, "written": recorder.written, "dropped": recorder.dropped,
+        "read": len(ticks["ts"]), "partitions": sorted(os.listdir(root)), "aligned": aligned,
+        "buffer_kb": 2 * 1024 * TICK_DTYPE.itemsize / 1024,
+    }
+
+def build_store(root: str, days: int):
+    """Write {days} days of synthetic ticks, one day per write_ticks call"""
+    rows_per_day = DAY * ROUNDS_PER_SECOND * 2
+    rng = np.random.default_rng(7)
+    for day in range(days):
+        rows = np.zeros(rows_per_day, TICK_DTYPE)
+        rows["ts"] = MIDNIGHT - (days - day) * DAY + np.arange(rows_per_day) / (ROUNDS_PER_SECOND * 2)
+        rows["venue"] = np.arange(rows_per_day) % 2
+        rows["size"] = rows["amount_in"] = 1000.0
+        rows["amount_out"] = np.where(rows["venue"] == 0, 33.0, 0.155) * rng.normal(1, 0.01, rows_per_day)
+        rows["impact"] = rng.uniform(0.5, 2.0, rows_per_day)
+        rows["height"] = np.arange(rows_per_day)
+        rows["spread"] = rng.normal(0, 2, rows_per_day)
+        rows["price"] = rng.normal(0.067, 0.001, rows_per_day)
+        write_ticks(rows, root)
+    return rows_per_day * days
+
+def timed(fn, *args, **kwargs):
+    started = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, (time.perf_counter() - started) * 1000
+
+def main(days: int):
+    with tempfile.TemporaryDirectory() as scratch:
+        columnar, jsonl, jsonl_row_bytes = time_record(scratch)
+        print(f"Per round (2 rows): TickRecorder.record {columnar:.2f} us | JSON lines append {jsonl:.2f} us")
+
+        result = asyncio.run(round_trip(scratch))
+        print(f"\nRound trip across midnight: recorded {result['recorded']}, written {result['written']}, "
+              f"dropped {result['dropped']}, read back {result['read']}, columns aligned: {result['aligned']}")
+        print(f"  partitions: {', '.join(result['partitions'])} | buffers held: {result['buffer_kb']:.0f} KB")
+
+        root = os.path.join(scratch, 'store')
+        rows, write_ms = timed(build_store, root, days)
+        size = sum(os.path.getsize(os.path.join(d, f)) for d, _, files in os.walk(root) for f in files)
+        print(f"\nStore: {days} days, {rows:,} rows written in {write_ms:.0f} ms | "
+              f"{size / rows:.0f} bytes/row ({size / 2**20:.0f} MB) vs ~{jsonl_row_bytes:.0f} bytes/row as JSON lines")
+
+        ticks, ms = timed(read_ticks, root, columns=["ts", "spread"])
+        print(f"  read_ticks ts+spread, all days: {ms:7.1f} ms ({len(ticks['ts']):,} rows), "
+              f"max |spread| {np.abs(ticks['spread']).max():.2f}%")
+        ticks, ms = timed(read_ticks, root)
+        print(f"  read_ticks every column, all days: {ms:7.1f} ms")
+        ticks, ms = timed(read_ticks, root, start=MIDNIGHT - DAY - 3600, end=MIDNIGHT - DAY + 3600, venue="solana")
+        print(f"  read_ticks 2h window, solana only: {ms:7.1f} ms ({len(ticks['ts']):,} rows)")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DAYS)
@@ -0,0 +1,112 @@
+"""
+Local HTTP stand-in for the Odos and Jupiter APIs.
+
+Serves canned, gzip-compressed responses on the same paths the bot calls so
+benchmarks can run offline. Point `funcs.base_odos.ODOS_API_URL` and
+`funcs.sol_jupiter.JUPITER_API_URL` at the returned base url.
+
+Run standalone with: python -m static.http_standin
+"""
+# Built-in
+import asyncio
+import itertools
+
+# External
+from aiohttp import web
+
+STANDIN_HOST = "127.0.0.1"
+STANDIN_PORT = 8787
+RESPONSE_DELAY = 0.0  # Seconds of simulated upstream work per request
+
+_path_ids = itertools.count(1)
+_slots = itertools.count(300_000_000)
+
+async def _respond(request, payload):
+    if RESPONSE_DELAY:
+        await asyncio.sleep(RESPONSE_DELAY)
+    response = web.json_response(payload)
+    response.enable_compression()
+    return response
+
+async def odos_quote(request):
+    body = await request.json()
+    amount = body["inputTokens"][0]["amount"]
+    return await _respond(request, {
+        "inTokens": [body["inputTokens"][0]["tokenAddress"]],
+        "outTokens": [body["outputTokens"][0]["tokenAddress"]],
+        "inAmounts": [amount],
+        "outAmounts": [str(int(amount) * 3 // 10)],
+        "inValues": [int(amount) / 1e18 * 0.02],
+        "outValues": [int(amount) / 1e18 * 0.0199],
+        "priceImpact": -0.35,
+        "pathId": f"standin-{next(_path_ids)}",
+        "blockNumber": 22_000_000,
+    })
+
+async def odos_assemble(request):
+    body = await request.json()
+    return await _respond(request, {
+        "pathId": body["pathId"],
+        "transaction": {
+            "to": "0x19cEeAd7105607Cd444F5ad10dd51356436095a1",
+            "data": "0x",
+            "value": "0",
+            "gas": 300000,
+            "gasPrice": 10_000_000,
+            "nonce": 0,
+            "from": body["userAddr"],
+        },
+    })
+
+async def jupiter_quote(request):
+    amount = request.query["amount"]
+    return await _respond(request, {
+        "inputMint": request.query["inputMint"],
+        "outputMint": request.query["outputMint"],
+        "inAmount": amount,
+        "outAmount": str(int(amount) * 9),
+        "priceImpactPct": "0.0041",
+        "slippageBps": int(request.query.get("slippageBps", 50)),
+        "contextSlot": next(_slots),
+        "timeTaken": 0.002,
+    })
+
+async def jupiter_swap(request):
+    await request.json()
+    return await _respond(request, {
+        "swapTransaction": "",
+        "lastValidBlockHeight": 280_000_000,
+        "prioritizationFeeLamports": 500_000,
+    })
+
+async def jupiter_price(request):
+    ids = request.query.get("ids", "").split(",")
+    return await _respond(request, {
+        "data": {token: {"id": token, "type": "derivedPrice", "price": "150.0"} for token in ids if token},
+        "timeTaken": 0.001,
+    })
+
+def create_app():
+    app = web.Application()
+    app.router.add_post("/sor/quote/v2", odos_quote)
+    app.router.add_post("/sor/assemble", odos_assemble)
+    app.router.add_get("/quote", jupiter_quote)
+    app.router.add_post("/swap", jupiter_swap)
+    app.router.add_get("/price/v2", jupiter_price)
+    return app
+
+async def start_standin(host=STANDIN_HOST, port=STANDIN_PORT):
+    """
+    Start the stand-in server on the running loop
+
+    Returns:
+        tuple: (runner, base_url) - call `await runner.cleanup()` to stop it
+    """
+    runner = web.AppRunner(create_app())
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    return runner, f"http://{host}:{port}"
+
+if __name__ == "__main__":
+    web.run_app(create_app(), host=STANDIN_HOST, port=STANDIN_PORT)
@@ -1,5 +1,6 @@
 # Built-in
 import os
+import sys
 from decimal import Decimal
 
 # External 
@@ -7,6 +8,8 @@ from web3 import Web3
 from dotenv import load_dotenv
 from contracts.abi.base_uniswapV2_router02 import router02_abi
 from contracts.abi.base_uniswapV2_lp import v2_lp_abi
+from funcs.base_v2_quoter import get_amounts_out_ladder, cross_check_router
+from funcs.multicall import multicall, prepare_call
 
 load_dotenv()
 
@@ -83,8 +86,13 @@ def get_amounts_out(amount_in, pair_contract, router02_contract, slippage_tolera
         router02_contract: Router02 contract instance
         slippage_tolerance: Maximum allowed slippage percentage (default 0.5%)
     """
-    token0_address = pair_contract.functions.token0().call() # Virtual
-    token1_address = pair_contract.functions.token1().call() # Luna
+    # Both token reads go out in one Multicall3 batch
+    token0_address, token1_address = multicall([
+        prepare_call(pair_contract, "token0"), # Virtual
+        prepare_call(pair_contract, "token1"), # Luna
+    ], client=pair_contract.w3)
+    token0_address = Web3.to_checksum_address(token0_address)
+    token1_address = Web3.to_checksum_address(token1_address)
 
     # Get amounts out for token0 to token1
     amounts_0_to_1 = router02_contract.functions.getAmountsOut(
@@ -110,6 +118,23 @@ def get_amounts_out(amount_in, pair_contract, router02_contract, slippage_tolera
         'min_amount_out': min_amount_out
     }
 
+def get_amounts_out_local(amounts_in, reserve_in, reserve_out):
+    """
+    Quote a whole ladder of input sizes from cached reserves, no RPC calls
+
+    Args:
+        amounts_in: Input amounts in Wei
+        reserve_in: Pair reserve of the input token
+        reserve_out: Pair reserve of the output token
+    """
+    amounts_out = get_amounts_out_ladder(amounts_in, reserve_in, reserve_out)
+
+    print(f"\nSwap Quotes using local V2 engine:")
+    for amount_in, amount_out in zip(amounts_in, amounts_out):
+        print(f"Input: {convert_from_wei(amount_in)} Token0 -> Expected Output: {convert_from_wei(amount_out)} Token1")
+
+    return amounts_out
+
 def main():
     w3 = init_web3()
 
@@ -127,5 +152,20 @@ def main():
     # Get amounts with 0.5% slippage tolerance
     swap_amounts = get_amounts_out(amount_in, pair_contract, router02_contract, slippage_tolerance=0.5)
 
+    # Price a size ladder locally from one reserves read
+    ladder = [convert_to_wei(x) for x in (1, 100, 1000, 10000, 50000)]
+    reserve0, reserve1, _ = pair_contract.functions.getReserves().call()
+    get_amounts_out_local(ladder, reserve0, reserve1)
+
+    # RPC cross-check mode: confirm the local engine matches the router bit for bit
+    if "--cross-check" in sys.argv:
+        token0_address = pair_contract.functions.token0().call()
+        mismatches = cross_check_router(w3, pair_contract, router02_contract, token0_address, ladder)
+        if mismatches:
+            for amount_in, local_out, router_out in mismatches:
+                print(f"Mismatch for {amount_in}: local {local_out} != router {router_out}")
+        else:
+            print(f"Cross-check passed: local engine matches router02 for {len(ladder)} sizes")
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,411 @@
+"""
+Several local JSON-RPC endpoints in front of one simulated network, for fan-out tests.
+
+Each endpoint has its own ack latency, its own share of transactions it
+accepts but never forwards (dropped), and for Base its own view lag in
+blocks. Base endpoints answer eth_sendRawTransaction / eth_getTransactionReceipt
+/ eth_blockNumber / eth_chainId; Solana endpoints answer through the
+static.sol_standin handlers over a shared slot clock.
+
+Run the fan-out check:  python -m static.rpc_standin
+Run the read pool check: python -m static.rpc_standin --pool
+Run the warm-up check:   python -m static.rpc_standin --warmup
+Run the rejected-send check: python -m static.rpc_standin --reject
+"""
+# Built-in
+import random
+import asyncio
+
+# External
+from aiohttp import web
+from eth_utils import keccak
+from static import sol_standin
+
+STANDIN_HOST = "127.0.0.1"
+BASE_PORT = 8600 # Base endpoints listen on BASE_PORT, BASE_PORT + 1, ...
+SOL_PORT = 8700 # Solana endpoints listen on SOL_PORT, SOL_PORT + 1, ...
+BLOCK_TIME = 0.5 # Seconds per simulated Base block
+CHAIN_ID = 8453
+
+# name, ack delay (s), drop rate, view lag (blocks)
+ENDPOINTS = (
+    ("fast-lossy", 0.005, 0.5, 0),
+    ("slow-reliable", 0.060, 0.0, 0),
+    ("lagging", 0.020, 0.0, 2),
+)
+
+class BaseNetwork:
+    """Pending pool and mined blocks shared by every Base endpoint"""
+
+    def __init__(self, block_number=22_000_000):
+        self.block_number = block_number
+        self.pending = set()
+        self.mined = {} # tx hash -> block number
+        self.requests = 0 # HTTP requests served by every endpoint, a batch counts once
+        self.nonce = 7 # What eth_getTransactionCount reports for any account
+
+    def submit(self, tx_hash: str):
+        if tx_hash not in self.mined:
+            self.pending.add(tx_hash)
+
+    def mine(self):
+        self.block_number += 1
+        for tx_hash in self.pending:
+            self.mined[tx_hash] = self.block_number
+        self.pending.clear()
+
+    def receipt(self, tx_hash: str, view_lag: int = 0):
+        block = self.mined.get(tx_hash)
+        if block is None or block > self.block_number - view_lag:
+            return None
+        return {
+            "transactionHash": tx_hash,
+            "blockNumber": hex(block),
+            "blockHash": "0x" + f"{block:064x}",
+            "status": "0x1",
+            "gasUsed": hex(150_000),
+        }
+
+async def produce_blocks(network: BaseNetwork, block_time: float = BLOCK_TIME):
+    while True:
+        await asyncio.sleep(block_time)
+        network.mine()
+
+def make_base_app(network: BaseNetwork, ack_delay: float, drop_rate: float, view_lag: int, reject: str = None):
+    """{reject}: error message every eth_sendRawTransaction is rejected with"""
+    async def handle(request):
+        method = request.get("method")
+        params = request.get("params") or []
+
+        if method == "eth_sendRawTransaction":
+            await asyncio.sleep(ack_delay)
+            if reject:
+                raise ValueError(reject)
+            tx_hash = "0x" + keccak(bytes.fromhex(params[0].removeprefix("0x"))).hex()
+            # Accepted either way, only forwarded to the network if not dropped
+            if random.random() >= drop_rate:
+                network.submit(tx_hash)
+            return tx_hash
+        if method == "eth_getTransactionReceipt":
+            return network.receipt(params[0], view_lag)
+        if method == "eth_blockNumber":
+            return hex(network.block_number - view_lag)
+        if method == "eth_chainId":
+            return hex(CHAIN_ID)
+        if method == "eth_getTransactionCount":
+            return hex(network.nonce)
+        raise ValueError(f"method {method} not supported by stand-in")
+
+    async def answer(request):
+        response = {"jsonrpc": "2.0", "id": request.get("id")}
+        try:
+            response["result"] = await handle(request)
+        except (ValueError, KeyError, IndexError) as e:
+            response["error"] = {"code": -32601, "message": str(e)}
+        return response
+
+    async def rpc(http_request):
+        network.requests += 1
+        request = await http_request.json()
+        if isinstance(request, list):
+            return web.json_response([await answer(item) for item in request])
+        return web.json_response(await answer(request))
+
+    app = web.Application()
+    app.router.add_post("/", rpc)
+    return app
+
+def make_sol_app(state, ack_delay: float, drop_rate: float):
+    async def rpc(http_request):
+        request = await http_request.json()
+        if request.get("method") == "sendTransaction":
+            await asyncio.sleep(ack_delay)
+            signature = sol_standin._signature_of(request["params"][0])
+            state.submit(signature, land=random.random() >= drop_rate)
+            return web.json_response({"jsonrpc": "2.0", "id": request.get("id"), "result": signature})
+        return web.json_response(sol_standin._response(state, request))
+
+    app = web.Application()
+    app.router.add_post("/", rpc)
+    return app
+
+async def _serve(app, port):
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, STANDIN_HOST, port).start()
+    return runner
+
+async def start_standins(endpoints=ENDPOINTS, produce=True):
+    """
+    Start one Base and one Solana endpoint per entry in {endpoints}
+
+    Args:
+        produce: Mine Base blocks on a timer; pass False to call network.mine() yourself
+
+    Returns:
+        tuple: (runners, tasks, base_network, sol_state, base_urls, sol_urls)
+    """
+    network = BaseNetwork()
+    sol_state = sol_standin.ChainState()
+    runners, base_urls, sol_urls = [], [], []
+
+    for i, (_, ack_delay, drop_rate, view_lag) in enumerate(endpoints):
+        runners.append(await _serve(make_base_app(network, ack_delay, drop_rate, view_lag), BASE_PORT + i))
+        runners.append(await _serve(make_sol_app(sol_state, ack_delay, drop_rate), SOL_PORT + i))
+        base_urls.append(f"http://{STANDIN_HOST}:{BASE_PORT + i}")
+        sol_urls.append(f"http://{STANDIN_HOST}:{SOL_PORT + i}")
+
+    tasks = [asyncio.create_task(sol_standin.produce_slots(sol_state))]
+    if produce:
+        tasks.append(asyncio.create_task(produce_blocks(network)))
+    return runners, tasks, network, sol_state, base_urls, sol_urls
+
+async def run_fanout_check(transactions: int = 20):
+    """
+    Fan {transactions} out on both chains and print per-endpoint stats, first
+    waiting with wait_landed, then as the bot does: landing comes from a
+    separate tracker (receipt sweep / rebroadcast status poll) while
+    watch_landing credits the broadcast endpoints in the background
+    """
+    from solana.rpc.async_api import AsyncClient
+    from funcs.broadcaster import Broadcaster
+    from funcs.base_receipts import ReceiptTracker
+    from funcs.endpoint_pool import EndpointPool
+    from funcs.sol_rebroadcast import rebroadcast_until_landed
+    from funcs.http_client import close_session
+
+    runners, tasks, network, sol_state, base_urls, sol_urls = await start_standins()
+    names = {url: name for urls in (base_urls, sol_urls) for url, (name, *_) in zip(urls, ENDPOINTS)}
+
+    async def one_base(broadcaster):
+        raw = random.randbytes(200)
+        sent = await broadcaster.broadcast(raw)
+        return await broadcaster.wait_landed(sent["tx_id"], timeout=10, interval=0.1)
+
+    async def one_sol(broadcaster):
+        raw, signature = sol_standin.signed_test_transaction(sol_state)
+        await broadcaster.broadcast(raw, tx_id=signature)
+        return await broadcaster.wait_landed(signature, timeout=10, interval=0.1)
+
+    receipt_tracker = ReceiptTracker(ws_url="", pool=EndpointPool("base", base_urls), poll_interval=0.1)
+    sol_client = AsyncClient(sol_urls[1])
+
+    async def tracked_base(broadcaster):
+        raw = random.randbytes(200)
+        sent = await broadcaster.broadcast(raw)
+        broadcaster.watch_landing(sent["tx_id"], timeout=10)
+        return await receipt_tracker.wait(sent["tx_id"], timeout=10)
+
+    async def tracked_sol(broadcaster):
+        raw, signature = sol_standin.signed_test_transaction(sol_state)
+        return await rebroadcast_until_landed(raw, signature, client=sol_client, interval=0.2, timeout=10,
+                                              broadcaster=broadcaster)
+
+    def report(chain, label, urls, broadcaster):
+        credited = sum(1 for record in broadcaster.transactions.values() if record["confirmed_by"] in urls)
+        print(f"{chain} ({label}): {transactions} transactions fanned out to {len(urls)} endpoints, "
+              f"{credited} landings credited to a broadcast endpoint")
+        for url, stats in broadcaster.report().items():
+            print(f"  {names[url]:14s} acked {stats['acked']:2d}/{stats['sent']:2d}  resends {stats['resends']:3d}  "
+                  f"first ack {stats['first_acks']:2d}  first confirm {stats['first_confirms']:2d}  "
+                  f"mean ack {stats['mean_ack_ms']:5.1f} ms")
+
+    try:
+        await receipt_tracker.start()
+        for chain, urls, one in (("base", base_urls, one_base), ("solana", sol_urls, one_sol)):
+            broadcaster = Broadcaster(chain, urls)
+            await asyncio.gather(*[one(broadcaster) for _ in range(transactions)])
+            report(chain, "wait_landed", urls, broadcaster)
+
+        for chain, urls, one in (("base", base_urls, tracked_base), ("solana", sol_urls, tracked_sol)):
+            broadcaster = Broadcaster(chain, urls)
+            await asyncio.gather(*[one(broadcaster) for _ in range(transactions)])
+            # Attribution finishes in the background, shortly after the trackers resolve
+            for _ in range(50):
+                if all(record["confirmed_by"] for record in broadcaster.transactions.values()):
+                    break
+                await asyncio.sleep(0.1)
+            await broadcaster.stop()
+            report(chain, "tracker + watch_landing", urls, broadcaster)
+    finally:
+        await receipt_tracker.stop()
+        await sol_client.close()
+        for task in tasks:
+            task.cancel()
+        for runner in runners:
+            await runner.cleanup()
+        await close_session()
+
+async def run_reject_check():
+    """
+    Every Base endpoint rejects the send with a nonce error: execute_odos must fail
+    fast instead of waiting for a receipt, and the nonce manager must resync
+    """
+    import time
+    from web3 import AsyncWeb3, AsyncHTTPProvider
+    from funcs.base_odos import execute_odos
+    from funcs.broadcaster import Broadcaster
+    from funcs.nonce_manager import NonceManager
+    from funcs.http_client import close_session
+
+    network = BaseNetwork()
+    reject = f"nonce too low: next nonce {network.nonce}, tx nonce 5"
+    runners = [await _serve(make_base_app(network, 0.005, 0.0, 0, reject=reject), BASE_PORT + i) for i in range(2)]
+    urls = [f"http://{STANDIN_HOST}:{BASE_PORT + i}" for i in range(2)]
+
+    broadcaster = Broadcaster("base", urls)
+    nonce_manager = NonceManager("0x018C3FB97AB31e02C4Dc215B6b0b662A4dDf9428", client=AsyncWeb3(AsyncHTTPProvider(urls[0])))
+    nonce_manager.next_nonce = 5
+    transaction = {"to": "0x018C3FB97AB31e02C4Dc215B6b0b662A4dDf9428", "value": "0", "data": "0x",
+                   "gas": 21000, "gasPrice": 10**9}
+
+    try:
+        started = time.monotonic()
+        result = await execute_odos({"transaction": transaction}, "0x" + "11" * 32,
+                                    nonce_manager=nonce_manager, broadcaster=broadcaster)
+        print(f"execute_odos returned after {time.monotonic() - started:.2f}s: {result}")
+        print(f"  nonce manager resynced to {nonce_manager.next_nonce} (chain reports {network.nonce}), "
+              f"pending {nonce_manager.pending}")
+        for url, stats in broadcaster.report().items():
+            print(f"  {url} sent {stats['sent']} acked {stats['acked']} errors {stats['errors']}")
+    finally:
+        for runner in runners:
+            await runner.cleanup()
+        await close_session()
+
+async def run_pool_check(reads: int = 30):
+    """Route reads through an EndpointPool per chain, stop the best endpoint halfway and print the scores"""
+    from web3 import AsyncWeb3
+    from solana.rpc.async_api import AsyncClient
+    from funcs.endpoint_pool import EndpointPool, PooledAsyncHTTPProvider, PooledSolanaClient
+    from funcs.http_client import close_session
+
+    runners, tasks, network, sol_state, base_urls, sol_urls = await start_standins()
+    runner_of = dict(zip(base_urls + sol_urls, runners[0::2] + runners[1::2]))
+    names = {url: name for urls in (base_urls, sol_urls) for url, (name, *_) in zip(urls, ENDPOINTS)}
+    # One url with nothing listening, it should be ranked last right after the first probe
+    dead = f"http://{STANDIN_HOST}:{BASE_PORT + len(ENDPOINTS)}"
+    names[dead] = "dead"
+
+    base_pool = EndpointPool("base", base_urls + [dead], probe_interval=0.5)
+    sol_pool = EndpointPool("solana", sol_urls + [dead], probe_interval=0.5)
+    w3 = AsyncWeb3(PooledAsyncHTTPProvider(base_pool))
+    sol_client = PooledSolanaClient(sol_pool, AsyncClient)
+
+    def show(pool, label):
+        print(f"{pool.chain} {label}:")
+        for url, score in pool.metrics().items():
+            print(f"  {names[url]:14s} latency {score['latency_ms'] or 0:6.1f} ms  error rate {score['error_rate']:.2f}  "
+                  f"healthy {score['healthy']!s:5s}  requests {score['requests']}")
+
+    async def read(pool, call):
+        failed = 0
+        for _ in range(reads):
+            try:
+                await call()
+            except Exception:
+                failed += 1
+        return failed
+
+    try:
+        await asyncio.gather(base_pool.start(), sol_pool.start())
+        for pool, call in ((base_pool, lambda: w3.eth.block_number), (sol_pool, sol_client.get_slot)):
+            await read(pool, call)
+            show(pool, f"after {reads} reads")
+
+            best = pool.best()
+            await runner_of[best].cleanup()
+            failed = await read(pool, call)
+            print(f"  stopped {names[best]}: {reads - failed}/{reads} reads still answered, best is now {names[pool.best()]}")
+            show(pool, "after failover")
+    finally:
+        await base_pool.stop()
+        await sol_pool.stop()
+        await sol_client.close()
+        for task in tasks:
+            task.cancel()
+        for runner in runners:
+            await runner.cleanup()
+        await close_session()
+
+async def run_warmup_check(reads: int = 5):
+    """
+    Time the first reads on cold pooled clients against clients primed by a Warmup stage,
+    then show that a step which never becomes ready fails start-up at the timeout
+    """
+    import time
+    import logging
+    from web3 import AsyncWeb3
+    from solana.rpc.async_api import AsyncClient
+    from funcs.endpoint_pool import EndpointPool, PooledAsyncHTTPProvider, PooledSolanaClient
+    from funcs.warmup import Warmup
+    from funcs.http_client import close_session
+
+    logging.basicConfig(level=logging.INFO, format="  %(message)s")
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    runners, tasks, network, sol_state, base_urls, sol_urls = await start_standins()
+
+    def clients():
+        base_pool, sol_pool = EndpointPool("base", base_urls), EndpointPool("solana", sol_urls)
+        return base_pool, sol_pool, AsyncWeb3(PooledAsyncHTTPProvider(base_pool)), PooledSolanaClient(sol_pool, AsyncClient)
+
+    async def first_reads(w3, sol_client):
+        samples = []
+        for _ in range(reads):
+            started = time.perf_counter()
+            await asyncio.gather(w3.eth.block_number, sol_client.get_slot())
+            samples.append((time.perf_counter() - started) * 1000)
+        return samples
+
+    try:
+        _, _, w3, sol_client = clients()
+        cold = await first_reads(w3, sol_client)
+        await sol_client.close()
+        await close_session() # Drop the connections the cold round opened
+
+        base_pool, sol_pool, w3, sol_client = clients()
+
+        async def warm_rpc():
+            await asyncio.gather(base_pool.start(), sol_pool.start())
+            await asyncio.gather(w3.provider.warm(), sol_client.warm())
+
+        warmup = Warmup()
+        warmup.add("rpc_pools", warm_rpc, lambda: base_pool.is_ready() and sol_pool.is_ready())
+        print("Warm-up:")
+        ready = await warmup.run(timeout=10)
+        warm = await first_reads(w3, sol_client)
+
+        print(f"ready: {ready}")
+        print(f"first read round, cold clients: {cold[0]:6.2f} ms (then {sum(cold[1:]) / (reads - 1):5.2f} ms)")
+        print(f"first read round, warmed up:    {warm[0]:6.2f} ms (then {sum(warm[1:]) / (reads - 1):5.2f} ms)")
+
+        # A cache that never fills, like a balanceOf that keeps failing
+        stuck = Warmup(retry_delay=0.2)
+        stuck.add("rpc_pools", warm_rpc, lambda: base_pool.is_ready() and sol_pool.is_ready())
+        stuck.add("never_ready", sol_client.get_slot, lambda: False)
+        print("Warm-up with a step that never becomes ready (timeout 1s):")
+        started = time.perf_counter()
+        ready = await stuck.run(timeout=1)
+        print(f"ready: {ready} after {time.perf_counter() - started:.1f}s, missing {stuck.missing()}")
+
+        await base_pool.stop()
+        await sol_pool.stop()
+        await sol_client.close()
+    finally:
+        for task in tasks:
+            task.cancel()
+        for runner in runners:
+            await runner.cleanup()
+        await close_session()
+
+if __name__ == "__main__":
+    import sys
+
+    if "--pool" in sys.argv:
+        asyncio.run(run_pool_check())
+    elif "--warmup" in sys.argv:
+        asyncio.run(run_warmup_check())
+    elif "--reject" in sys.argv:
+        asyncio.run(run_reject_check())
+    else:
+        asyncio.run(run_fanout_check())
@@ -0,0 +1,356 @@
+"""
+Local stand-in for a Solana RPC node, HTTP JSON-RPC and websocket on one port.
+
+A slot is produced every SLOT_TIME seconds. Signatures handed to
+sendTransaction (or ChainState.submit) move to processed, confirmed and
+finalized after fixed slot counts, and every signatureSubscribe whose
+commitment is reached gets its signatureNotification in that slot.
+getSignatureStatuses, getSlot, getBlockHeight and getLatestBlockhash are
+answered from the same state.
+
+Run the stand-in alone:            python -m static.sol_standin
+Compare confirmation strategies:   python -m static.sol_standin --check
+Rebroadcast against dropped sends: python -m static.sol_standin --rebroadcast
+  (also lands transactions while single getBlockHeight / getSignatureStatuses calls fail with 429)
+"""
+# Built-in
+import sys
+import json
+import logging
+import time
+import base64
+import random
+import asyncio
+import itertools
+
+# External
+from aiohttp import web, WSMsgType
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.signature import Signature
+from solders.transaction import VersionedTransaction
+
+STANDIN_HOST = "127.0.0.1"
+STANDIN_PORT = 8899
+SLOT_TIME = 0.4 # Seconds per slot, as on mainnet
+COMMITMENT_LEVELS = ("processed", "confirmed", "finalized")
+LAND_AFTER = {"processed": 1, "confirmed": 2, "finalized": 32} # Slots after submission for each commitment
+BLOCKHASH_VALID_BLOCKS = 150 # A blockhash is valid for this many blocks after it was issued
+
+class ChainState:
+    """Slot height, submitted signatures and live subscriptions shared by every connection"""
+
+    def __init__(self, slot=300_000_000, drop_rate=0.0):
+        self.slot = slot
+        self.block_height = slot - 20_000_000
+        self.drop_rate = drop_rate # Share of submissions that never land
+        self.signatures = {} # signature -> {"submitted_slot", "status", "slot", "err"}
+        self.subscriptions = {} # subscription id -> (websocket, signature, commitment)
+        self.sends = {} # signature -> times it was sent
+        self.fail_next = {} # method -> HTTP calls still to answer with 429
+        self._ids = itertools.count(1)
+
+    def submit(self, signature: str, land: bool = None):
+        """Register a signature; dropped ones are counted but never land"""
+        self.sends[signature] = self.sends.get(signature, 0) + 1
+        if signature in self.signatures:
+            return
+        if land is None:
+            land = random.random() >= self.drop_rate
+        if land:
+            self.signatures[signature] = {"submitted_slot": self.slot, "status": None, "slot": None, "err": None}
+
+    def should_fail(self, method: str) -> bool:
+        """Consume one injected failure for {method}, if any are left"""
+        if self.fail_next.get(method, 0) > 0:
+            self.fail_next[method] -= 1
+            return True
+        return False
+
+    def status(self, signature: str):
+        entry = self.signatures.get(signature)
+        if entry is None or entry["status"] is None:
+            return None
+        confirmations = None if entry["status"] == "finalized" else self.slot - entry["slot"]
+        return {
+            "slot": entry["slot"],
+            "confirmations": confirmations,
+            "err": entry["err"],
+            "status": {"Ok": None},
+            "confirmationStatus": entry["status"],
+        }
+
+    def reached(self, signature: str, commitment: str) -> bool:
+        entry = self.signatures.get(signature)
+        return (entry is not None and entry["status"] is not None
+                and COMMITMENT_LEVELS.index(entry["status"]) >= COMMITMENT_LEVELS.index(commitment))
+
+    def advance(self):
+        """Produce one slot and move every signature along its commitment schedule"""
+        self.slot += 1
+        self.block_height += 1
+        for entry in self.signatures.values():
+            age = self.slot - entry["submitted_slot"]
+            for level in COMMITMENT_LEVELS:
+                if age >= LAND_AFTER[level]:
+                    entry["status"] = level
+                    entry["slot"] = entry["slot"] or self.slot
+
+    def latest_blockhash(self):
+        return str(Hash.new_unique()), self.block_height + BLOCKHASH_VALID_BLOCKS
+
+def _signature_of(raw_b64: str) -> str:
+    try:
+        return str(VersionedTransaction.from_bytes(base64.b64decode(raw_b64)).signatures[0])
+    except Exception:
+        return str(Signature.new_unique())
+
+def handle_rpc(state: ChainState, request, websocket=None):
+    method = request.get("method")
+    params = request.get("params") or []
+    context = {"slot": state.slot}
+
+    if method == "getSignatureStatuses":
+        return {"context": context, "value": [state.status(signature) for signature in params[0]]}
+    if method == "sendTransaction":
+        signature = _signature_of(params[0])
+        state.submit(signature)
+        return signature
+    if method == "getSlot":
+        return state.slot
+    if method == "getBlockHeight":
+        return state.block_height
+    if method == "getLatestBlockhash":
+        blockhash, last_valid = state.latest_blockhash()
+        return {"context": context, "value": {"blockhash": blockhash, "lastValidBlockHeight": last_valid}}
+    if method == "signatureSubscribe" and websocket is not None:
+        subscription_id = next(state._ids)
+        commitment = (params[1] if len(params) > 1 else {}).get("commitment", "finalized")
+        state.subscriptions[subscription_id] = (websocket, params[0], commitment)
+        return subscription_id
+    if method == "signatureUnsubscribe":
+        return state.subscriptions.pop(params[0], None) is not None
+    raise ValueError(f"method {method} not supported by stand-in")
+
+def _response(state, request, websocket=None):
+    response = {"jsonrpc": "2.0", "id": request.get("id")}
+    try:
+        response["result"] = handle_rpc(state, request, websocket)
+    except (ValueError, KeyError, IndexError) as e:
+        response["error"] = {"code": -32601, "message": str(e)}
+    return response
+
+async def produce_slots(state: ChainState, slot_time: float = SLOT_TIME):
+    """Advance one slot every {slot_time} seconds and notify subscriptions that reached their commitment"""
+    while True:
+        await asyncio.sleep(slot_time)
+        state.advance()
+
+        for subscription_id, (websocket, signature, commitment) in list(state.subscriptions.items()):
+            if not state.reached(signature, commitment):
+                continue
+            # Signature subscriptions are single-shot: notify, then drop
+            state.subscriptions.pop(subscription_id, None)
+            message = {"jsonrpc": "2.0", "method": "signatureNotification", "params": {
+                "subscription": subscription_id,
+                "result": {"context": {"slot": state.slot}, "value": {"err": state.signatures[signature]["err"]}},
+            }}
+            try:
+                await websocket.send_str(json.dumps(message))
+            except ConnectionResetError:
+                pass
+
+def make_app(state: ChainState):
+    async def rpc(request):
+        # The same path serves websocket upgrades and plain HTTP JSON-RPC
+        if request.headers.get("Upgrade", "").lower() == "websocket":
+            websocket = web.WebSocketResponse()
+            await websocket.prepare(request)
+            try:
+                async for message in websocket:
+                    if message.type != WSMsgType.TEXT:
+                        continue
+                    await websocket.send_str(json.dumps(_response(state, json.loads(message.data), websocket)))
+            finally:
+                for subscription_id, (owner, _, _) in list(state.subscriptions.items()):
+                    if owner is websocket:
+                        state.subscriptions.pop(subscription_id, None)
+            return websocket
+
+        body = await request.json()
+        if isinstance(body, dict) and state.should_fail(body.get("method")):
+            return web.json_response({"error": "rate limited"}, status=429)
+        if isinstance(body, list):
+            return web.json_response([_response(state, item) for item in body])
+        return web.json_response(_response(state, body))
+
+    app = web.Application()
+    app.router.add_route("*", "/", rpc)
+    return app
+
+async def start_standin(host=STANDIN_HOST, port=STANDIN_PORT, slot_time=SLOT_TIME, drop_rate=0.0):
+    """
+    Start the stand-in on the running loop
+
+    Returns:
+        tuple: (runner, producer_task, state, http_url, ws_url)
+    """
+    state = ChainState(drop_rate=drop_rate)
+    runner = web.AppRunner(make_app(state), access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    producer = asyncio.create_task(produce_slots(state, slot_time))
+    return runner, producer, state, f"http://{host}:{port}", f"ws://{host}:{port}"
+
+async def _legacy_poll(client, signature, commitment, retry_delay=2):
+    """The old execute_jupiter loop: one status call every {retry_delay} seconds"""
+    while True:
+        response = await client.get_signature_statuses([Signature.from_string(signature)])
+        status = response.value[0]
+        if status and status.confirmation_status is not None:
+            reached = str(status.confirmation_status).split(".")[-1].lower()
+            if COMMITMENT_LEVELS.index(reached) >= COMMITMENT_LEVELS.index(commitment):
+                return
+        await asyncio.sleep(retry_delay)
+
+async def run_check(count: int = 20, commitment: str = "confirmed"):
+    """Time {count} signatures to {commitment} with the websocket tracker, the batched sweep and the old loop"""
+    from solana.rpc.async_api import AsyncClient
+    from funcs.sol_confirmations import ConfirmationTracker
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    runner, producer, state, http_url, ws_url = await start_standin()
+    client = AsyncClient(http_url)
+
+    async def measure(label, wait_one):
+        signatures = [str(Keypair().sign_message(str(i).encode())) for i in range(count)]
+        started = time.monotonic()
+        for signature in signatures:
+            state.submit(signature, land=True)
+
+        async def one(signature):
+            await wait_one(signature)
+            return time.monotonic() - started
+
+        latencies = await asyncio.gather(*[one(signature) for signature in signatures])
+        print(f"  {label:30s} mean {sum(latencies) / count:5.2f}s  max {max(latencies):5.2f}s")
+
+    try:
+        print(f"{count} signatures to '{commitment}' (slot {SLOT_TIME}s, "
+              f"reached after {LAND_AFTER[commitment] * SLOT_TIME:.1f}s)")
+
+        for label, tracker in (
+            ("signatureSubscribe", ConfirmationTracker(ws_url=ws_url, client=client, commitment=commitment)),
+            ("batched status sweep", ConfirmationTracker(ws_url="", client=client, commitment=commitment, poll_interval=SLOT_TIME)),
+        ):
+            await tracker.start()
+            await asyncio.sleep(0.2) # let the websocket connect
+            await measure(label, lambda signature: tracker.wait(signature, timeout=30))
+            await tracker.stop()
+
+        await measure("old 2s loop (1 call per sig)", lambda signature: _legacy_poll(client, signature, commitment))
+    finally:
+        await client.close()
+        producer.cancel()
+        await runner.cleanup()
+
+def signed_test_transaction(state: ChainState, blockhash: str = None):
+    """A self-signed, empty v0 transaction the stand-in can take a signature from"""
+    from solders.message import MessageV0
+
+    payer = Keypair()
+    blockhash = blockhash or state.latest_blockhash()[0]
+    message = MessageV0.try_compile(payer.pubkey(), [], [], Hash.from_string(blockhash))
+    transaction = VersionedTransaction(message, [payer])
+    return bytes(transaction), str(transaction.signatures[0])
+
+async def run_rebroadcast_check(trials: int = 10, drop_rate: float = 0.7, valid_blocks: int = 10):
+    """
+    Land {trials} transactions through a stand-in that drops {drop_rate} of sends,
+    once with a single send and once with the rebroadcast loop, then show expiry
+    detection when every send is dropped
+    """
+    from solana.rpc.async_api import AsyncClient
+    from solana.rpc.types import TxOpts
+    from funcs.sol_confirmations import ConfirmationTracker
+    from funcs.sol_rebroadcast import rebroadcast_until_landed, TransactionExpired
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    runner, producer, state, http_url, ws_url = await start_standin(drop_rate=drop_rate)
+    client = AsyncClient(http_url)
+    tracker = ConfirmationTracker(ws_url=ws_url, client=client)
+    await tracker.start()
+    await asyncio.sleep(0.2)
+    # Same window as the rebroadcast's blockhash, for a like-for-like single send
+    window = valid_blocks * SLOT_TIME
+
+    async def single_send():
+        raw, signature = signed_test_transaction(state)
+        started = time.monotonic()
+        await client.send_raw_transaction(raw, opts=TxOpts(skip_preflight=True, max_retries=0))
+        try:
+            await tracker.wait(signature, timeout=window)
+            return True, time.monotonic() - started, 1
+        except asyncio.TimeoutError:
+            return False, time.monotonic() - started, 1
+
+    async def rebroadcast():
+        raw, signature = signed_test_transaction(state)
+        last_valid = state.block_height + valid_blocks
+        try:
+            result = await rebroadcast_until_landed(raw, signature, last_valid, tracker=tracker, client=client, interval=SLOT_TIME)
+            return True, result["seconds"], result["sends"]
+        except TransactionExpired:
+            return False, None, None
+
+    def report(label, results):
+        landed = [r for r in results if r[0]]
+        mean = sum(r[1] for r in landed) / len(landed) if landed else float("nan")
+        sends = sum(r[2] for r in landed) / len(landed) if landed else float("nan")
+        print(f"  {label:14s} landed {len(landed):2d}/{trials}  mean {mean:5.2f}s  sends/landed {sends:4.1f}")
+
+    try:
+        print(f"{trials} transactions, {drop_rate:.0%} of sends dropped, blockhash valid {valid_blocks} blocks ({window:.1f}s)")
+        report("single send", await asyncio.gather(*[single_send() for _ in range(trials)]))
+        report("rebroadcast", await asyncio.gather(*[rebroadcast() for _ in range(trials)]))
+
+        state.drop_rate = 1.0
+        raw, signature = signed_test_transaction(state)
+        started = time.monotonic()
+        try:
+            await rebroadcast_until_landed(raw, signature, state.block_height + valid_blocks,
+                                           tracker=tracker, client=client, interval=SLOT_TIME)
+        except TransactionExpired as e:
+            print(f"  every send dropped: expiry reported after {time.monotonic() - started:.1f}s ({e})")
+
+        # Transient RPC errors inside the loop must not abort it
+        state.drop_rate = drop_rate
+        for label, use_tracker, method in (("tracker", True, "getBlockHeight"), ("status poll", False, "getSignatureStatuses")):
+            state.fail_next[method] = 2
+            raw, signature = signed_test_transaction(state)
+            try:
+                result = await rebroadcast_until_landed(raw, signature, state.block_height + valid_blocks,
+                                                        tracker=tracker if use_tracker else None, client=client,
+                                                        interval=SLOT_TIME)
+                outcome = f"landed after {result['seconds']:.1f}s, {result['sends']} send(s)"
+            except TransactionExpired as e:
+                outcome = f"expired ({e})"
+            print(f"  2 x {method} answered 429 ({label}): {outcome}, failures left {state.fail_next[method]}")
+    finally:
+        await tracker.stop()
+        await client.close()
+        producer.cancel()
+        await runner.cleanup()
+
+async def serve_forever():
+    runner, producer, _, http_url, ws_url = await start_standin()
+    print(f"Stand-in listening on {http_url} and {ws_url}")
+    await producer
+
+if __name__ == "__main__":
+    if "--check" in sys.argv:
+        asyncio.run(run_check())
+    elif "--rebroadcast" in sys.argv:
+        asyncio.run(run_rebroadcast_check())
+    else:
+        asyncio.run(serve_forever())
@@ -0,0 +1,262 @@
+"""
+Local websocket JSON-RPC stand-in for a Base node.
+
+Simulates one Uniswap V2 pair: a new block every BLOCK_TIME seconds applies a
+random swap to the reserves, pushes a Sync log to every `logs`
+subscription and a block header to every `newHeads` subscription. Answers
+the eth_call reads the V2 feed seeds from (token0, token1, getReserves) plus
+eth_blockNumber / eth_chainId.
+
+Run the stand-in alone:            python -m static.ws_standin
+Run it with the feed attached:     python -m static.ws_standin --feed
+Run the receipt tracker against it: python -m static.ws_standin --receipts
+"""
+# Built-in
+import sys
+import json
+import random
+import asyncio
+import itertools
+
+# External
+import websockets
+
+STANDIN_HOST = "127.0.0.1"
+STANDIN_PORT = 8546
+BLOCK_TIME = 0.5  # Seconds between simulated blocks
+CHAIN_ID = 8453
+
+PAIR_ADDRESS = "0xa8e64FB120CE8796594670BAE72279C8aA1e5359"
+TOKEN0 = "0x0b3e328455c4059EEb9e3f84b5543F74E24e7E1b"  # VIRTUAL
+TOKEN1 = "0x55cD6469F597452B5A7536e2CD98fDE4c1247ee4"  # LUNA
+SYNC_TOPIC = "0x1c411e9a96e071241c2f21f7726b17ae89e3cab4c78be50e062b03a9fffbbad1"
+
+SELECTOR_TOKEN0 = "0x0dfe1681"
+SELECTOR_TOKEN1 = "0xd21220a7"
+SELECTOR_GET_RESERVES = "0x0902f1ac"
+
+def _word(value: int) -> str:
+    return f"{value:064x}"
+
+def _address_word(address: str) -> str:
+    return address.lower().removeprefix("0x").rjust(64, "0")
+
+class ChainState:
+    """Reserves, block height and live subscriptions shared by every connection"""
+
+    def __init__(self, reserve0=5_000_000 * 10**18, reserve1=15_000_000 * 10**18, block_number=22_000_000):
+        self.reserve0 = reserve0
+        self.reserve1 = reserve1
+        self.block_number = block_number
+        self.subscriptions = {}  # subscription id -> (websocket, kind)
+        self._ids = itertools.count(1)
+
+    def new_subscription(self, websocket, kind):
+        subscription_id = hex(next(self._ids))
+        self.subscriptions[subscription_id] = (websocket, kind)
+        return subscription_id
+
+    def swap(self):
+        """Apply a random constant-product swap (0.3% fee) to the reserves"""
+        if random.random() < 0.5:
+            amount_in = random.randint(1, 50_000) * 10**18
+            amount_out = amount_in * 997 * self.reserve1 // (self.reserve0 * 1000 + amount_in * 997)
+            self.reserve0 += amount_in
+            self.reserve1 -= amount_out
+        else:
+            amount_in = random.randint(1, 50_000) * 10**18
+            amount_out = amount_in * 997 * self.reserve0 // (self.reserve1 * 1000 + amount_in * 997)
+            self.reserve1 += amount_in
+            self.reserve0 -= amount_out
+
+    def sync_log(self):
+        return {
+            "address": PAIR_ADDRESS.lower(),
+            "topics": [SYNC_TOPIC],
+            "data": "0x" + _word(self.reserve0) + _word(self.reserve1),
+            "blockNumber": hex(self.block_number),
+            "blockHash": "0x" + _word(self.block_number),
+            "transactionHash": "0x" + _word(random.getrandbits(256)),
+            "transactionIndex": "0x0",
+            "logIndex": "0x0",
+            "removed": False,
+        }
+
+    def head(self):
+        return {
+            "number": hex(self.block_number),
+            "hash": "0x" + _word(self.block_number),
+            "parentHash": "0x" + _word(self.block_number - 1),
+            "baseFeePerGas": hex(10_000_000),
+        }
+
+    def eth_call(self, data: str) -> str:
+        selector = data[:10]
+        if selector == SELECTOR_TOKEN0:
+            return "0x" + _address_word(TOKEN0)
+        if selector == SELECTOR_TOKEN1:
+            return "0x" + _address_word(TOKEN1)
+        if selector == SELECTOR_GET_RESERVES:
+            return "0x" + _word(self.reserve0) + _word(self.reserve1) + _word(self.block_number & 0xFFFFFFFF)
+        raise ValueError(f"unsupported call {selector}")
+
+async def produce_blocks(state: ChainState, block_time: float = BLOCK_TIME, on_block=None):
+    """
+    Mine a block with one swap every {block_time} seconds and notify subscribers
+
+    Args:
+        on_block: Called with the new block number before subscribers are notified
+    """
+    while True:
+        await asyncio.sleep(block_time)
+        state.block_number += 1
+        state.swap()
+        if on_block is not None:
+            on_block(state.block_number)
+        payloads = {"logs": state.sync_log(), "newHeads": state.head()}
+
+        for subscription_id, (websocket, kind) in list(state.subscriptions.items()):
+            if kind not in payloads:
+                continue
+            message = {"jsonrpc": "2.0", "method": "eth_subscription",
+                       "params": {"subscription": subscription_id, "result": payloads[kind]}}
+            try:
+                await websocket.send(json.dumps(message))
+            except websockets.ConnectionClosed:
+                state.subscriptions.pop(subscription_id, None)
+
+def handle_request(state: ChainState, websocket, request):
+    method = request.get("method")
+    params = request.get("params") or []
+
+    if method == "eth_subscribe":
+        return state.new_subscription(websocket, params[0])
+    if method == "eth_unsubscribe":
+        return state.subscriptions.pop(params[0], None) is not None
+    if method == "eth_call":
+        return state.eth_call(params[0]["data"] if "data" in params[0] else params[0]["input"])
+    if method == "eth_blockNumber":
+        return hex(state.block_number)
+    if method == "eth_chainId":
+        return hex(CHAIN_ID)
+    raise ValueError(f"method {method} not supported by stand-in")
+
+def make_handler(state: ChainState):
+    async def handler(websocket):
+        try:
+            async for message in websocket:
+                request = json.loads(message)
+                response = {"jsonrpc": "2.0", "id": request.get("id")}
+                try:
+                    response["result"] = handle_request(state, websocket, request)
+                except (ValueError, KeyError, IndexError) as e:
+                    response["error"] = {"code": -32601, "message": str(e)}
+                await websocket.send(json.dumps(response))
+        finally:
+            for subscription_id, (owner, _) in list(state.subscriptions.items()):
+                if owner is websocket:
+                    state.subscriptions.pop(subscription_id, None)
+    return handler
+
+async def start_standin(host=STANDIN_HOST, port=STANDIN_PORT, block_time=BLOCK_TIME, on_block=None):
+    """
+    Start the stand-in on the running loop
+
+    Args:
+        on_block: Passed to produce_blocks, e.g. to mine a static.rpc_standin network in step
+
+    Returns:
+        tuple: (server, producer_task, state, ws_url)
+    """
+    state = ChainState()
+    server = await websockets.serve(make_handler(state), host, port)
+    producer = asyncio.create_task(produce_blocks(state, block_time, on_block))
+    return server, producer, state, f"ws://{host}:{port}"
+
+async def run_feed_check(seconds: float = 10):
+    """Follow the stand-in with V2SyncFeed and compare its reserves with the stand-in's"""
+    from funcs.base_v2_feed import V2SyncFeed
+
+    server, producer, state, ws_url = await start_standin()
+    feed = V2SyncFeed(PAIR_ADDRESS, ws_url=ws_url)
+
+    try:
+        await feed.start()
+        loop = asyncio.get_running_loop()
+        end = loop.time() + seconds
+        while loop.time() < end:
+            await asyncio.sleep(BLOCK_TIME)
+            in_sync = (feed.reserve0, feed.reserve1) == (state.reserve0, state.reserve1)
+            print(f"block {feed.block_number} | LUNA in VIRTUAL {feed.spot_price(TOKEN1):.6f} | "
+                  f"lag {state.block_number - feed.block_number} block(s) | in sync: {in_sync}")
+    finally:
+        await feed.stop()
+        producer.cancel()
+        server.close()
+        await server.wait_closed()
+
+async def run_receipt_check(transactions: int = 40, seconds: float = 6):
+    """
+    Track {transactions} submitted at random times with ReceiptTracker, then the same
+    load with one wait_for_transaction_receipt loop each, and compare latency and request counts
+    """
+    from web3 import AsyncWeb3, AsyncHTTPProvider
+    from funcs.base_receipts import ReceiptTracker
+    from funcs.endpoint_pool import EndpointPool
+    from funcs.http_client import close_session
+    from static import rpc_standin
+
+    # One reliable HTTP endpoint, mined in step with the websocket's blocks
+    runners, tasks, network, _, base_urls, _ = await rpc_standin.start_standins(
+        endpoints=(("reliable", 0.0, 0.0, 0),), produce=False)
+    server, producer, state, ws_url = await start_standin(on_block=lambda _: network.mine())
+    loop = asyncio.get_running_loop()
+
+    async def submit_after(delay):
+        await asyncio.sleep(delay)
+        tx_hash = "0x" + _word(random.getrandbits(256))
+        network.submit(tx_hash)
+        return tx_hash, network.block_number + 1 # Mined in the next block
+
+    async def run(label, wait):
+        requests_before = network.requests
+        async def one():
+            tx_hash, block = await submit_after(random.uniform(0, seconds))
+            receipt = await wait(tx_hash)
+            return state.block_number - block, int(receipt["blockNumber"]) == block
+        results = await asyncio.gather(*[one() for _ in range(transactions)])
+        lags = [lag for lag, _ in results]
+        print(f"{label:28s} {transactions} tx | resolved within {max(lags)} block(s) of inclusion "
+              f"(mean {sum(lags) / len(lags):.2f}) | {network.requests - requests_before} HTTP requests")
+
+    tracker = ReceiptTracker(ws_url=ws_url, pool=EndpointPool("base", base_urls))
+    w3 = AsyncWeb3(AsyncHTTPProvider(base_urls[0]))
+    try:
+        await tracker.start()
+        await asyncio.sleep(BLOCK_TIME)
+        await run("ReceiptTracker (newHeads)", lambda tx_hash: tracker.wait(tx_hash, timeout=30))
+        print(f"  {tracker.sweeps} batched sweeps")
+        await run("wait_for_transaction_receipt", lambda tx_hash: w3.eth.wait_for_transaction_receipt(tx_hash, timeout=30, poll_latency=0.1))
+    finally:
+        await tracker.stop()
+        producer.cancel()
+        server.close()
+        await server.wait_closed()
+        for task in tasks:
+            task.cancel()
+        for runner in runners:
+            await runner.cleanup()
+        await close_session()
+
+async def serve_forever():
+    server, producer, _, ws_url = await start_standin()
+    print(f"Stand-in listening on {ws_url}")
+    await asyncio.gather(server.wait_closed(), producer)
+
+if __name__ == "__main__":
+    if "--feed" in sys.argv:
+        asyncio.run(run_feed_check())
+    elif "--receipts" in sys.argv:
+        asyncio.run(run_receipt_check())
+    else:
+        asyncio.run(serve_forever())